@@ -0,0 +1,14 @@
+-- Marca de version para los GET condicionales (ETag) de ventas y clientes.
+ALTER TABLE venta
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ;
+UPDATE venta SET updated_at = fecha WHERE updated_at IS NULL;
+ALTER TABLE venta
+    ALTER COLUMN updated_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET NOT NULL;
+
+ALTER TABLE clientes
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ;
+UPDATE clientes SET updated_at = created_at WHERE updated_at IS NULL;
+ALTER TABLE clientes
+    ALTER COLUMN updated_at SET DEFAULT now(),
+    ALTER COLUMN updated_at SET NOT NULL;
@@ -0,0 +1,12 @@
+ALTER TABLE venta
+    ADD COLUMN IF NOT EXISTS idempotency_key VARCHAR(64);
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'venta_idempotency_key_key'
+    ) THEN
+        ALTER TABLE venta
+            ADD CONSTRAINT venta_idempotency_key_key UNIQUE (idempotency_key);
+    END IF;
+END $$;
@@ -0,0 +1,162 @@
+"""
+Compara los viajes a la base de datos y la latencia de la lectura de cierre
+de caja: consultas separadas (implementacion anterior) vs. una sola sentencia.
+
+Uso (requiere PostgreSQL; crea y borra una caja temporal):
+
+    python scripts/bench_cerrar_caja.py --database-url postgresql://... \
+        --movimientos 5000 --repeticiones 20 --latencia-ms 40
+
+`--latencia-ms` agrega una espera artificial por viaje para simular una
+instancia remota (RDS) desde una base local.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, event, func  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.infrastructure.models.models import (  # noqa: E402
+    Caja,
+    CajaSesion,
+    CierreCajaDenominacion,
+    MovimientoFinanciero,
+)
+from src.infrastructure.repository.createCajaRepository import CajaRepository  # noqa: E402
+from src.utils.timezone import now_utc_minus_5  # noqa: E402
+
+
+def lectura_anterior(db, caja_id: int) -> tuple:
+    record = db.get(Caja, caja_id)
+    cierre_time = now_utc_minus_5()
+    totales = []
+    for tipo in ("INGRESO", "EGRESO"):
+        query = db.query(func.coalesce(func.sum(MovimientoFinanciero.monto), 0)).filter(
+            MovimientoFinanciero.caja_id == caja_id,
+            MovimientoFinanciero.tipo == tipo,
+            MovimientoFinanciero.fecha <= cierre_time,
+        )
+        if record.fecha_apertura is not None:
+            query = query.filter(MovimientoFinanciero.fecha >= record.fecha_apertura)
+        totales.append(Decimal(query.scalar() or 0))
+    ultimo_conteo = (
+        db.query(func.max(CierreCajaDenominacion.fecha_conteo))
+        .filter(CierreCajaDenominacion.caja_id == caja_id)
+        .scalar()
+    )
+    efectivo = (
+        db.query(func.coalesce(func.sum(CierreCajaDenominacion.subtotal), 0))
+        .filter(
+            CierreCajaDenominacion.caja_id == caja_id,
+            CierreCajaDenominacion.fecha_conteo == ultimo_conteo,
+        )
+        .scalar()
+    )
+    sesion = (
+        db.query(CajaSesion)
+        .filter(CajaSesion.caja_id == caja_id, CajaSesion.fecha_cierre.is_(None))
+        .order_by(CajaSesion.fecha_apertura.desc())
+        .first()
+    )
+    return totales[0], totales[1], efectivo, sesion.id if sesion else None
+
+
+def lectura_actual(db, caja_id: int) -> tuple:
+    repo = CajaRepository(db)
+    _, balance, _, efectivo, sesion_id = db.execute(repo._cierre_statement(caja_id)).one()
+    return balance.total_ingresos, balance.total_egresos, efectivo, sesion_id
+
+
+def preparar(Session, movimientos: int) -> int:
+    with Session() as db:
+        apertura = now_utc_minus_5() - timedelta(hours=8)
+        caja = Caja(nombre="bench-cierre", saldo_inicial=Decimal("100000.00"), estado="ABIERTA", fecha_apertura=apertura)
+        db.add(caja)
+        db.flush()
+        db.add(CajaSesion(caja_id=caja.id, fecha_apertura=apertura))
+        db.add_all(
+            MovimientoFinanciero(
+                fecha=apertura + timedelta(seconds=n),
+                tipo="INGRESO" if n % 3 else "EGRESO",
+                monto=Decimal("1000.00"),
+                concepto="bench",
+                caja_id=caja.id,
+            )
+            for n in range(movimientos)
+        )
+        conteo = now_utc_minus_5()
+        db.add_all(
+            CierreCajaDenominacion(caja_id=caja.id, denominacion=Decimal(d), cantidad=3, subtotal=Decimal(d) * 3, fecha_conteo=conteo)
+            for d in (2000, 5000, 10000, 20000, 50000, 100000)
+        )
+        db.commit()
+        CajaRepository(db).get_balance(caja.id)
+        return caja.id
+
+
+def limpiar(Session, caja_id: int) -> None:
+    with Session() as db:
+        for model in (MovimientoFinanciero, CierreCajaDenominacion, CajaSesion):
+            db.query(model).filter(model.caja_id == caja_id).delete(synchronize_session=False)
+        db.query(Caja).filter(Caja.id == caja_id).delete(synchronize_session=False)
+        db.commit()
+
+
+def medir(Session, contador: dict, lectura, caja_id: int, repeticiones: int) -> tuple[int, float]:
+    tiempos = []
+    viajes = 0
+    for _ in range(repeticiones):
+        with Session() as db:
+            contador["n"] = 0
+            inicio = time.perf_counter()
+            lectura(db, caja_id)
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+            viajes = contador["n"]
+            db.rollback()
+    return viajes, statistics.median(tiempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--movimientos", type=int, default=5000)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--latencia-ms", type=float, default=0.0)
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("Defina --database-url o DATABASE_URL")
+
+    engine = create_engine(args.database_url)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    contador = {"n": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _contar(conn, cursor, statement, parameters, context, executemany):
+        contador["n"] += 1
+        if args.latencia_ms:
+            time.sleep(args.latencia_ms / 1000)
+
+    caja_id = preparar(Session, args.movimientos)
+    try:
+        for nombre, lectura in (("anterior", lectura_anterior), ("una sentencia", lectura_actual)):
+            viajes, mediana = medir(Session, contador, lectura, caja_id, args.repeticiones)
+            print(f"{nombre:>14}: {viajes} viajes, mediana {mediana:.2f} ms")
+    finally:
+        limpiar(Session, caja_id)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Mide el arranque de un worker: tiempo de importar la app, memoria residente
+y cuantos modulos/modelos Pydantic quedan cargados. Cada repeticion corre en
+un proceso nuevo. Para comparar con otro layout, correrlo en cada commit.
+
+Uso (no abre conexiones a la base; DATABASE_URL puede ser cualquiera):
+
+    python scripts/bench_import.py --repeticiones 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+MEDICION = """
+import json, resource, sys, time
+inicio = time.perf_counter()
+import src.app.main
+segundos = time.perf_counter() - inicio
+from pydantic import BaseModel
+def subclases(cls):
+    for sub in cls.__subclasses__():
+        yield sub
+        yield from subclases(sub)
+modelos = [m for m in subclases(BaseModel) if m.__module__.split(".")[0] in {"src", "domain"}]
+print(json.dumps({
+    "segundos": segundos,
+    "rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modulos": len(sys.modules),
+    "modulos_app": sum(1 for n in sys.modules if n.split(".")[0] in {"src", "domain", "infrastructure", "utils", "app"}),
+    "modelos": len(modelos),
+    "modelos_duplicados": len(modelos) - len({m.__qualname__ + m.__module__.removeprefix("src.") for m in modelos}),
+}))
+"""
+
+
+def medir_una_vez() -> dict:
+    env = {**os.environ, "DATABASE_URL": os.getenv("DATABASE_URL", "sqlite://")}
+    salida = subprocess.run(
+        [sys.executable, "-c", MEDICION],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(salida.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    medir_una_vez()  # compila el bytecode
+    corridas = [medir_una_vez() for _ in range(args.repeticiones)]
+    ultima = corridas[-1]
+    print(f"import src.app.main: {statistics.median(c['segundos'] for c in corridas) * 1000:.0f} ms")
+    print(f"RSS maximo: {statistics.median(c['rss_kib'] for c in corridas) / 1024:.1f} MiB")
+    print(f"modulos cargados: {ultima['modulos']} ({ultima['modulos_app']} de la app)")
+    print(f"modelos Pydantic: {ultima['modelos']} ({ultima['modelos_duplicados']} duplicados)")
+
+
+if __name__ == "__main__":
+    main()
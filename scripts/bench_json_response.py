@@ -0,0 +1,108 @@
+"""
+Compara el render de la respuesta JSON de un listado de ventas con detalles:
+JSONResponse (json.dumps, implementacion anterior) vs. POSJSONResponse
+(orjson). Tambien mide el camino directo de los listados ya confiables.
+
+Uso (no requiere base de datos; las ventas se generan en memoria):
+
+    python scripts/bench_json_response.py --ventas 10000 --repeticiones 5
+"""
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+import orjson  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from pydantic_core import to_json  # noqa: E402
+
+from src.domain.dtos.ventaDto import VentaDetalleResponse, VentaResponse  # noqa: E402
+from src.infrastructure.web.responses import POSJSONResponse  # noqa: E402
+from src.utils.timezone import now_utc_minus_5  # noqa: E402
+
+
+def generar_ventas(cantidad: int, detalles: int) -> list[VentaResponse]:
+    ahora = now_utc_minus_5()
+    return [
+        VentaResponse(
+            venta_id=n,
+            fecha=ahora - timedelta(minutes=n),
+            subtotal=Decimal("15000.00"),
+            impuesto=Decimal("2850.00"),
+            descuento=Decimal("0.00"),
+            total=Decimal("17850.00"),
+            tipo_pago="efectivo",
+            es_credito=False,
+            estado=True,
+            nota_venta=None,
+            numero_factura=f"POS-{n:06d}",
+            cliente_id=uuid.uuid4(),
+            user_id=1,
+            detalles=[
+                VentaDetalleResponse(
+                    venta_detalle_id=n * detalles + d,
+                    venta_id=n,
+                    producto_id=d + 1,
+                    producto_nombre=f"Producto {d + 1}",
+                    cantidad=2,
+                    precio_unitario=Decimal("2500.00"),
+                    descuento=Decimal("0.00"),
+                    subtotal=Decimal("5000.00"),
+                )
+                for d in range(detalles)
+            ],
+        )
+        for n in range(1, cantidad + 1)
+    ]
+
+
+def medir(funcion, repeticiones: int) -> tuple[float, int]:
+    tiempos = []
+    tamano = 0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        tamano = len(funcion())
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos), tamano
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ventas", type=int, default=10000)
+    parser.add_argument("--detalles", type=int, default=3)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    ventas = generar_ventas(args.ventas, args.detalles)
+    # Lo que FastAPI entrega a la clase de respuesta cuando hay response_model.
+    contenido = TypeAdapter(list[VentaResponse]).dump_python(ventas, mode="json")
+    anterior = JSONResponse(contenido).body
+    nuevo = POSJSONResponse(contenido).body
+    assert orjson.loads(anterior) == orjson.loads(nuevo), "la salida cambio"
+
+    casos = (
+        ("JSONResponse", lambda: JSONResponse(contenido).body),
+        ("POSJSONResponse", lambda: POSJSONResponse(contenido).body),
+        ("to_json directo", lambda: to_json(ventas)),
+    )
+    for nombre, funcion in casos:
+        segundos, tamano = medir(funcion, args.repeticiones)
+        print(
+            f"{nombre:>16}: {segundos * 1000:.1f} ms, "
+            f"{args.ventas / segundos:,.0f} ventas/s, {tamano / 1024 / 1024:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
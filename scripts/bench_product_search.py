@@ -0,0 +1,120 @@
+"""
+Compara la busqueda de productos ILIKE (implementacion anterior) con la
+busqueda trigram indexada y el atajo por codigo de barras.
+
+Uso (requiere PostgreSQL con scripts/create_product_search_indexes.sql
+aplicado; crea y borra productos temporales):
+
+    python scripts/bench_product_search.py --database-url postgresql://... \
+        --productos 50000 --repeticiones 20
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from sqlalchemy import create_engine, insert, text  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.infrastructure.models.models import Product  # noqa: E402
+from src.infrastructure.repository.createProductsRepository import (  # noqa: E402
+    ProductRepository,
+)
+from src.utils.timezone import now_utc_minus_5  # noqa: E402
+
+MARCA = "bench-busqueda"
+PALABRAS = [
+    "cerveza", "gaseosa", "jugo", "agua", "leche", "arroz", "azucar", "cafe",
+    "chocolate", "galletas", "jamon", "limon", "manzana", "pina", "pinguino",
+    "champana", "cafe", "te", "yogur", "salchicha", "atun", "aji", "frijol",
+]
+ACENTOS = {"cafe": "café", "azucar": "azúcar", "limon": "limón", "pina": "piña", "atun": "atún", "aji": "ají"}
+TERMINOS = ["cerv", "cafe", "piña", "limon jugo", "choco", "zzz-no-existe"]
+
+
+def preparar(Session, productos: int) -> str:
+    rng = random.Random(7)
+    ahora = now_utc_minus_5()
+    filas = []
+    for n in range(productos):
+        palabras = [ACENTOS.get(p, p) for p in rng.sample(PALABRAS, 3)]
+        filas.append(
+            {
+                "codigo_barras": f"990{n:010d}",
+                "nombre": " ".join(palabras).title(),
+                "descripcion": MARCA,
+                "precio_venta": Decimal(rng.randint(1, 500) * 100),
+                "costo": Decimal(rng.randint(1, 400) * 100),
+                "iva": Decimal("19.00"),
+                "estado": True,
+                "fecha_creacion": ahora,
+                "fecha_actualizacion": ahora,
+            }
+        )
+    with Session() as db:
+        for inicio in range(0, len(filas), 5000):
+            db.execute(insert(Product), filas[inicio:inicio + 5000])
+        db.commit()
+        db.execute(text("ANALYZE product"))
+        db.commit()
+    return filas[productos // 2]["codigo_barras"]
+
+
+def limpiar(Session) -> None:
+    with Session() as db:
+        db.query(Product).filter(Product.descripcion == MARCA).delete(synchronize_session=False)
+        db.commit()
+
+
+def medir(Session, buscar, terminos: list[str], repeticiones: int) -> float:
+    tiempos = []
+    for _ in range(repeticiones):
+        with Session() as db:
+            repo = ProductRepository(db)
+            for termino in terminos:
+                inicio = time.perf_counter()
+                buscar(repo, termino)
+                tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--productos", type=int, default=50000)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+    if not args.database_url:
+        raise SystemExit("Defina --database-url o DATABASE_URL")
+
+    engine = create_engine(args.database_url)
+    Session = sessionmaker(bind=engine, autoflush=False)
+    codigo = preparar(Session, args.productos)
+    try:
+        casos = (
+            ("ILIKE anterior", lambda repo, t: repo._search_products_like(t, args.limit), TERMINOS),
+            ("trigram", lambda repo, t: repo.search_products(t, args.limit), TERMINOS),
+            ("codigo ILIKE", lambda repo, t: repo._search_products_like(t, args.limit), [codigo]),
+            ("codigo exacto", lambda repo, t: repo.search_products(t, args.limit), [codigo]),
+        )
+        for nombre, buscar, terminos in casos:
+            mediana = medir(Session, buscar, terminos, args.repeticiones)
+            print(f"{nombre:>14}: mediana {mediana:.2f} ms por busqueda")
+    finally:
+        limpiar(Session)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
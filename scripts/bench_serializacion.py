@@ -0,0 +1,193 @@
+"""
+Mide el costo por fila de armar y serializar los listados de productos y
+ventas: entidad + DTO + validacion de response_model (implementacion
+anterior) vs. proyeccion con model_construct + serializacion directa.
+
+Uso (no requiere base de datos; las filas se generan en memoria):
+
+    python scripts/bench_serializacion.py --filas 5000 --repeticiones 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from pydantic import TypeAdapter  # noqa: E402
+from pydantic_core import to_json  # noqa: E402
+
+from src.domain.dtos.productsDto import ProductResponse  # noqa: E402
+from src.domain.dtos.ventaDto import VentaDetalleResponse, VentaResponse  # noqa: E402
+from src.domain.entities.productsEntity import ProductEntity  # noqa: E402
+from src.domain.entities.ventaEntity import VentaEntity  # noqa: E402
+from src.utils.timezone import now_utc_minus_5  # noqa: E402
+
+DETALLES_POR_VENTA = 3
+NOMBRES_RELACIONES = ("categoria_nombre", "creado_por_nombre", "actualizado_por_nombre")
+
+
+def filas_productos(cantidad: int) -> list[dict]:
+    ahora = now_utc_minus_5()
+    return [
+        {
+            "producto_id": n,
+            "codigo_barras": f"770{n:010d}",
+            "nombre": f"Producto {n}",
+            "categoria_id": n % 20 + 1,
+            "descripcion": "bench",
+            "precio_venta": Decimal("2500.00"),
+            "costo": Decimal("1800.00"),
+            "margen": Decimal("700.00"),
+            "iva": Decimal("19.00"),
+            "creado_por_id": 1,
+            "actualizado_por_id": 1,
+            "fecha_creacion": ahora,
+            "fecha_actualizacion": ahora,
+            "estado": True,
+            "categoria_nombre": f"Categoria {n % 20 + 1}",
+            "creado_por_nombre": "admin",
+            "actualizado_por_nombre": "admin",
+        }
+        for n in range(1, cantidad + 1)
+    ]
+
+
+def filas_ventas(cantidad: int) -> list[dict]:
+    ahora = now_utc_minus_5()
+    ventas = []
+    for n in range(1, cantidad + 1):
+        detalles = [
+            {
+                "venta_detalle_id": n * DETALLES_POR_VENTA + d,
+                "venta_id": n,
+                "producto_id": d + 1,
+                "producto_nombre": f"Producto {d + 1}",
+                "cantidad": 2,
+                "precio_unitario": Decimal("2500.00"),
+                "descuento": Decimal("0.00"),
+                "subtotal": Decimal("5000.00"),
+            }
+            for d in range(DETALLES_POR_VENTA)
+        ]
+        ventas.append(
+            {
+                "venta_id": n,
+                "fecha": ahora - timedelta(minutes=n),
+                "subtotal": Decimal("15000.00"),
+                "impuesto": Decimal("0.00"),
+                "descuento": Decimal("0.00"),
+                "total": Decimal("15000.00"),
+                "tipo_pago": "efectivo",
+                "es_credito": False,
+                "estado": True,
+                "nota_venta": None,
+                "numero_factura": f"POS-{n:06d}",
+                "cliente_id": uuid.uuid4(),
+                "user_id": 1,
+                "idempotency_key": None,
+                "detalles": detalles,
+            }
+        )
+    return ventas
+
+
+def respuesta_fastapi(adapter: TypeAdapter, data) -> bytes:
+    """Lo que hacia FastAPI con response_model: validar, volcar a dict y json.dumps."""
+    validado = adapter.validate_python(data, from_attributes=True)
+    contenido = adapter.dump_python(validado, mode="json")
+    return json.dumps(contenido, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def productos_antes(filas: list[dict], adapter: TypeAdapter) -> bytes:
+    respuestas = []
+    for fila in filas:
+        columnas = {k: v for k, v in fila.items() if k not in NOMBRES_RELACIONES}
+        entity = ProductEntity.from_model(SimpleNamespace(**columnas))
+        entity.categoria_nombre = fila["categoria_nombre"]
+        entity.creado_por_nombre = fila["creado_por_nombre"]
+        entity.actualizado_por_nombre = fila["actualizado_por_nombre"]
+        respuestas.append(ProductResponse.model_validate(entity))
+    return respuesta_fastapi(adapter, respuestas)
+
+
+def productos_despues(filas: list[dict]) -> bytes:
+    return to_json([ProductResponse.model_construct(**fila) for fila in filas])
+
+
+def ventas_antes(filas: list[dict], adapter: TypeAdapter) -> bytes:
+    respuestas = []
+    for fila in filas:
+        orm = SimpleNamespace(
+            **{**fila, "detalles": [SimpleNamespace(**d) for d in fila["detalles"]]}
+        )
+        respuestas.append(VentaResponse.model_validate(VentaEntity.from_model(orm)))
+    return respuesta_fastapi(adapter, respuestas)
+
+
+def ventas_despues(filas: list[dict]) -> bytes:
+    return to_json(
+        [
+            VentaResponse.model_construct(
+                **{
+                    **fila,
+                    "detalles": [
+                        VentaDetalleResponse.model_construct(**d) for d in fila["detalles"]
+                    ],
+                }
+            )
+            for fila in filas
+        ]
+    )
+
+
+def medir(funcion, filas: int, repeticiones: int) -> float:
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) / filas * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, default=5000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    productos = filas_productos(args.filas)
+    ventas = filas_ventas(args.filas)
+    productos_adapter = TypeAdapter(list[ProductResponse])
+    ventas_adapter = TypeAdapter(list[VentaResponse])
+
+    assert json.loads(productos_antes(productos, productos_adapter)) == json.loads(
+        productos_despues(productos)
+    ), "productos: la salida cambio"
+    assert json.loads(ventas_antes(ventas, ventas_adapter)) == json.loads(
+        ventas_despues(ventas)
+    ), "ventas: la salida cambio"
+
+    casos = (
+        ("productos antes", lambda: productos_antes(productos, productos_adapter)),
+        ("productos despues", lambda: productos_despues(productos)),
+        ("ventas antes", lambda: ventas_antes(ventas, ventas_adapter)),
+        ("ventas despues", lambda: ventas_despues(ventas)),
+    )
+    for nombre, funcion in casos:
+        costo = medir(funcion, args.filas, args.repeticiones)
+        print(f"{nombre:>17}: {costo:.1f} us por fila")
+
+
+if __name__ == "__main__":
+    main()
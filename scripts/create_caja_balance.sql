@@ -0,0 +1,25 @@
+CREATE TABLE IF NOT EXISTS caja_balance (
+    caja_id INTEGER NOT NULL,
+    total_ingresos NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+    total_egresos NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+    desde TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    CONSTRAINT caja_balance_pkey PRIMARY KEY (caja_id),
+    CONSTRAINT caja_balance_caja_id_fkey FOREIGN KEY (caja_id)
+        REFERENCES cierre_cajas (id) ON DELETE CASCADE
+);
+
+-- Carga inicial: movimientos del turno actual de cada caja.
+INSERT INTO caja_balance (caja_id, total_ingresos, total_egresos, desde, updated_at)
+SELECT
+    c.id,
+    COALESCE(SUM(m.monto) FILTER (WHERE m.tipo = 'INGRESO'), 0),
+    COALESCE(SUM(m.monto) FILTER (WHERE m.tipo = 'EGRESO'), 0),
+    c.fecha_apertura,
+    now()
+FROM cierre_cajas c
+LEFT JOIN movimientos_financieros m
+    ON m.caja_id = c.id
+   AND (c.fecha_apertura IS NULL OR m.fecha >= c.fecha_apertura)
+GROUP BY c.id, c.fecha_apertura
+ON CONFLICT (caja_id) DO NOTHING;
@@ -0,0 +1,3 @@
+-- Historial por producto: GET /stock/productos/{producto_id}/movimientos.
+CREATE INDEX IF NOT EXISTS ix_movimientos_stock_producto_fecha
+    ON movimientos_stock (producto_id, fecha_creacion);
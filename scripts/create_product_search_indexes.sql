@@ -0,0 +1,25 @@
+-- Busqueda de productos del POS: trigram sobre texto sin tildes.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- unaccent es STABLE; este envoltorio IMMUTABLE permite indexar la expresion.
+CREATE OR REPLACE FUNCTION product_search_text(nombre TEXT, descripcion TEXT)
+RETURNS TEXT
+LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE
+AS $$
+    SELECT public.unaccent(
+        'public.unaccent',
+        lower(coalesce(nombre, '') || ' ' || coalesce(descripcion, ''))
+    )
+$$;
+
+CREATE INDEX IF NOT EXISTS ix_product_search_trgm
+    ON product USING gin (product_search_text(nombre, descripcion) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_product_codigo_barras_trgm
+    ON product USING gin (codigo_barras gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS ix_product_precio_venta
+    ON product (precio_venta);
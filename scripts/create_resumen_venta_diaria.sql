@@ -0,0 +1,42 @@
+CREATE TABLE IF NOT EXISTS resumen_venta_diaria (
+    id UUID NOT NULL,
+    fecha DATE NOT NULL,
+    total_ventas NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+    total_efectivo NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+    total_tarjeta NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+    total_transferencia NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+    total_credito NUMERIC(14, 2) NOT NULL DEFAULT 0.00,
+    cantidad_transacciones INTEGER NOT NULL DEFAULT 0,
+    generado_por_whatsapp_user_id VARCHAR(255),
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+    updated_at TIMESTAMP WITH TIME ZONE,
+    CONSTRAINT resumen_venta_diaria_pkey PRIMARY KEY (id),
+    CONSTRAINT resumen_venta_diaria_fecha_key UNIQUE (fecha)
+);
+
+-- Carga inicial desde el historico de ventas (dias en UTC-5).
+INSERT INTO resumen_venta_diaria (
+    id, fecha, total_ventas, total_efectivo, total_tarjeta,
+    total_transferencia, total_credito, cantidad_transacciones, created_at
+)
+SELECT
+    gen_random_uuid(),
+    (v.fecha AT TIME ZONE INTERVAL '-05:00')::date AS dia,
+    COALESCE(SUM(v.total), 0),
+    COALESCE(SUM(v.total) FILTER (WHERE v.tipo_pago = 'efectivo'), 0),
+    COALESCE(SUM(v.total) FILTER (WHERE v.tipo_pago = 'tarjeta'), 0),
+    COALESCE(SUM(v.total) FILTER (WHERE v.tipo_pago = 'transferencia'), 0),
+    COALESCE(SUM(v.total) FILTER (WHERE v.tipo_pago = 'credito' OR v.tipo_pago IS NULL), 0),
+    COUNT(*),
+    now()
+FROM venta v
+WHERE v.estado = true
+GROUP BY dia
+ON CONFLICT (fecha) DO UPDATE SET
+    total_ventas = EXCLUDED.total_ventas,
+    total_efectivo = EXCLUDED.total_efectivo,
+    total_tarjeta = EXCLUDED.total_tarjeta,
+    total_transferencia = EXCLUDED.total_transferencia,
+    total_credito = EXCLUDED.total_credito,
+    cantidad_transacciones = EXCLUDED.cantidad_transacciones,
+    updated_at = now();
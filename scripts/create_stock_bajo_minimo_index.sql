@@ -0,0 +1,6 @@
+-- Reporte de reposicion: solo indexa las filas en o bajo el minimo.
+-- La pagina avanza por (producto_id, stock_id); se recrea si existia solo con producto_id.
+DROP INDEX IF EXISTS ix_stock_bajo_minimo;
+CREATE INDEX ix_stock_bajo_minimo
+    ON stock (producto_id, stock_id)
+    WHERE cantidad_actual <= cantidad_minima;
@@ -0,0 +1,127 @@
+"""
+Prueba de carga del camino caliente de la caja: POST /ventas/,
+GET /productos/buscar y GET /productos/{id} con N clientes concurrentes.
+Con varias --url compara servidores (por ejemplo este commit contra el
+anterior, que atendia las mismas rutas con Session sync en el threadpool).
+
+Uso (con la API ya levantada; cada venta registrada descuenta stock):
+
+    python scripts/load_test_checkout.py --url http://127.0.0.1:8000 \\
+        --url http://127.0.0.1:8001 --clientes 200 --segundos 30 \\
+        --producto-id 1 --user-id 1 --termino coca
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+from dataclasses import dataclass, field
+
+import httpx
+
+ESCENARIOS = ("venta", "buscar", "producto")
+
+
+@dataclass
+class Resultado:
+    latencias_ms: list[float] = field(default_factory=list)
+    errores: int = 0
+
+
+def payload_venta(args: argparse.Namespace) -> dict:
+    return {
+        "tipo_pago": "efectivo",
+        "es_credito": False,
+        "user_id": args.user_id,
+        "idempotency_key": str(uuid.uuid4()),
+        "detalles": [
+            {
+                "producto_id": args.producto_id,
+                "cantidad": 1,
+                "precio_unitario": str(args.precio),
+            }
+        ],
+    }
+
+
+async def una_peticion(client: httpx.AsyncClient, escenario: str, args) -> bool:
+    if escenario == "venta":
+        response = await client.post("/ventas/", json=payload_venta(args))
+        return response.status_code == 201
+    if escenario == "buscar":
+        response = await client.get("/productos/buscar", params={"q": args.termino})
+    else:
+        response = await client.get(f"/productos/{args.producto_id}")
+    return response.status_code == 200
+
+
+async def cliente(
+    client: httpx.AsyncClient, escenarios: list[str], fin: float, args, resultado: Resultado
+) -> None:
+    while time.perf_counter() < fin:
+        escenario = random.choice(escenarios)
+        inicio = time.perf_counter()
+        try:
+            ok = await una_peticion(client, escenario, args)
+        except httpx.HTTPError:
+            ok = False
+        if ok:
+            resultado.latencias_ms.append((time.perf_counter() - inicio) * 1000)
+        else:
+            resultado.errores += 1
+
+
+async def correr(url: str, args: argparse.Namespace) -> tuple[Resultado, float]:
+    limits = httpx.Limits(max_connections=args.clientes, max_keepalive_connections=args.clientes)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=args.timeout) as client:
+        resultado = Resultado()
+        inicio = time.perf_counter()
+        fin = inicio + args.segundos
+        await asyncio.gather(
+            *(
+                cliente(client, args.escenarios, fin, args, resultado)
+                for _ in range(args.clientes)
+            )
+        )
+        return resultado, time.perf_counter() - inicio
+
+
+def percentil(valores: list[float], p: int) -> float:
+    if len(valores) < 2:
+        return valores[0] if valores else 0.0
+    return statistics.quantiles(valores, n=100)[p - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", action="append", required=True)
+    parser.add_argument("--clientes", type=int, default=200)
+    parser.add_argument("--segundos", type=float, default=30)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument(
+        "--escenario", dest="escenarios", action="append", choices=ESCENARIOS
+    )
+    parser.add_argument("--producto-id", type=int, default=1)
+    parser.add_argument("--precio", default="1000.00")
+    parser.add_argument("--user-id", type=int, default=None)
+    parser.add_argument("--termino", default="a")
+    args = parser.parse_args()
+    args.escenarios = args.escenarios or list(ESCENARIOS)
+
+    for url in args.url:
+        resultado, segundos = asyncio.run(correr(url, args))
+        latencias = resultado.latencias_ms
+        print(
+            f"{url}: {len(latencias) / segundos:,.0f} req/s, "
+            f"p50 {percentil(latencias, 50):.1f} ms, "
+            f"p95 {percentil(latencias, 95):.1f} ms, "
+            f"p99 {percentil(latencias, 99):.1f} ms, "
+            f"{resultado.errores} errores"
+        )
+
+
+if __name__ == "__main__":
+    main()
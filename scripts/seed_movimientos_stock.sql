@@ -0,0 +1,18 @@
+-- Catalogos usados por MovimientoStockRepository (se buscan por nombre).
+INSERT INTO tipo_movimiento (tipo_movimiento_id, nombre, activo, descripcion)
+SELECT COALESCE((SELECT MAX(tipo_movimiento_id) FROM tipo_movimiento), 0) + n, nombre, TRUE, descripcion
+FROM (VALUES
+    (1, 'ENTRADA', 'Aumenta el stock'),
+    (2, 'SALIDA', 'Disminuye el stock')
+) AS t (n, nombre, descripcion)
+WHERE NOT EXISTS (SELECT 1 FROM tipo_movimiento tm WHERE tm.nombre = t.nombre);
+
+INSERT INTO ref_movimiento (ref_movimiento_id, nombre, activo, descripcion)
+SELECT COALESCE((SELECT MAX(ref_movimiento_id) FROM ref_movimiento), 0) + n, nombre, TRUE, descripcion
+FROM (VALUES
+    (1, 'VENTA', 'Venta registrada'),
+    (2, 'ANULACION_VENTA', 'Anulacion o eliminacion de venta'),
+    (3, 'EDICION_VENTA', 'Edicion de detalles de venta'),
+    (4, 'AJUSTE_MANUAL', 'Ajuste manual de inventario')
+) AS r (n, nombre, descripcion)
+WHERE NOT EXISTS (SELECT 1 FROM ref_movimiento rm WHERE rm.nombre = r.nombre);
@@ -1,10 +1,12 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from src.app.utils.cached_response import cached_json_response
 from src.config import get_db
 from src.domain.dtos.cajaDto import (
+    CajaBalanceResponse,
     CajaCerrarRequest,
     CajaRequest,
     CajaResponse,
@@ -13,6 +15,7 @@ from src.domain.dtos.cajaDto import (
 from src.domain.dtos.genericResponseDto import CreationResponse
 from src.domain.services.caja_service import CajaService
 from src.infrastructure.repository.createCajaRepository import CajaRepository
+from src.infrastructure.response_cache import CACHE_CAJAS
 
 router = APIRouter(prefix="/contabilidad/cajas", tags=["contabilidad-cajas"])
 
@@ -43,8 +46,8 @@ def create_caja(
 
 
 @router.get("/", response_model=list[CajaResponse])
-def list_cajas(service: ServiceDep) -> list[CajaResponse]:
-    return service.list_cajas()
+def list_cajas(request: Request, service: ServiceDep) -> Response:
+    return cached_json_response(request, CACHE_CAJAS, service.list_cajas)
 
 
 @router.get("/{caja_id}", response_model=CajaResponse)
@@ -55,6 +58,14 @@ def get_caja(caja_id: int, service: ServiceDep) -> CajaResponse:
     return caja
 
 
+@router.get("/{caja_id}/balance", response_model=CajaBalanceResponse)
+def get_caja_balance(caja_id: int, service: ServiceDep) -> CajaBalanceResponse:
+    balance = service.get_balance(caja_id)
+    if not balance:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Caja no encontrada")
+    return balance
+
+
 @router.put("/{caja_id}", response_model=CajaResponse)
 def update_caja(
     caja_id: int,
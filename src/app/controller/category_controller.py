@@ -1,8 +1,9 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from src.app.utils.cached_response import cached_json_response
 from src.config import get_db
 from src.domain.dtos.categoryDto import (
     CategoryRequest,
@@ -12,6 +13,7 @@ from src.domain.dtos.categoryDto import (
 from src.domain.dtos.genericResponseDto import CreationResponse, MessageResponse
 from src.domain.services.category_service import CategoryService
 from src.infrastructure.repository.createCategoryRepository import CategoryRepository
+from src.infrastructure.response_cache import CACHE_CATEGORIAS
 
 router = APIRouter(prefix="/categorias", tags=["categorias"])
 
@@ -43,8 +45,8 @@ def create_category(
 
 
 @router.get("/", response_model=list[CategoryResponse])
-def list_categories(service: ServiceDep) -> list[CategoryResponse]:
-    return service.list_categories()
+def list_categories(request: Request, service: ServiceDep) -> Response:
+    return cached_json_response(request, CACHE_CATEGORIAS, service.list_categories)
 
 
 @router.get("/buscar", response_model=list[CategoryResponse])
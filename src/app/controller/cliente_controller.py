@@ -9,6 +9,7 @@ from src.domain.dtos.clienteDto import ClienteRequest, ClienteResponse, ClienteU
 from src.domain.dtos.genericResponseDto import CreationResponse
 from src.domain.services.ClienteService import ClienteService
 from src.infrastructure.repository.ClienteRepository import ClienteRepository
+from src.infrastructure.web.etag import cliente_etag
 
 router = APIRouter(prefix="/clientes", tags=["clientes"])
 
@@ -82,7 +83,11 @@ def get_cliente_por_nombre_normalizado(
     return cliente
 
 
-@router.get("/{cliente_id}", response_model=ClienteResponse)
+@router.get(
+    "/{cliente_id}",
+    response_model=ClienteResponse,
+    dependencies=[Depends(cliente_etag)],
+)
 def get_cliente(cliente_id: UUID, service: ServiceDep) -> ClienteResponse:
     cliente = service.get_cliente(cliente_id)
     if not cliente:
@@ -1,8 +1,9 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from src.app.utils.cached_response import cached_json_response
 from src.config import get_db
 from src.domain.dtos.contabilidadCategoriaDto import (
     ContabilidadCategoriaRequest,
@@ -14,6 +15,7 @@ from src.domain.services.contabilidad_categoria_service import ContabilidadCateg
 from src.infrastructure.repository.createContabilidadCategoriaRepository import (
     ContabilidadCategoriaRepository,
 )
+from src.infrastructure.response_cache import CACHE_CONTABILIDAD_CATEGORIAS
 
 router = APIRouter(prefix="/contabilidad/categorias", tags=["contabilidad-categorias"])
 
@@ -44,8 +46,10 @@ def create_categoria(
 
 
 @router.get("/", response_model=list[ContabilidadCategoriaResponse])
-def list_categorias(service: ServiceDep) -> list[ContabilidadCategoriaResponse]:
-    return service.list_categorias()
+def list_categorias(request: Request, service: ServiceDep) -> Response:
+    return cached_json_response(
+        request, CACHE_CONTABILIDAD_CATEGORIAS, service.list_categorias
+    )
 
 
 @router.get("/por-nombre", response_model=ContabilidadCategoriaResponse)
@@ -18,6 +18,7 @@ from src.domain.services.cuenta_cobrar_service import CuentaCobrarService
 from src.infrastructure.repository.createCuentaCobrarRepository import (
     CuentaCobrarRepository,
 )
+from src.infrastructure.web.etag import cuenta_cobrar_etag
 
 router = APIRouter(
     prefix="/contabilidad/cuentas-por-cobrar",
@@ -60,7 +61,11 @@ def list_cuentas(
     return service.list_cuentas(cliente_id=cliente_id, venta_id=venta_id, estado=estado)
 
 
-@router.get("/{cuenta_id}", response_model=CuentaCobrarResponse)
+@router.get(
+    "/{cuenta_id}",
+    response_model=CuentaCobrarResponse,
+    dependencies=[Depends(cuenta_cobrar_etag)],
+)
 def get_cuenta(cuenta_id: int, service: ServiceDep) -> CuentaCobrarResponse:
     cuenta = service.get_cuenta(cuenta_id)
     if not cuenta:
@@ -0,0 +1,68 @@
+from typing import Any, Optional
+
+from fastapi import APIRouter, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from src.config import get_async_engine, get_engine
+
+router = APIRouter(prefix="/health", tags=["health"], include_in_schema=False)
+
+
+def _not_ready(motivo: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"status": "unavailable", "detail": motivo},
+    )
+
+
+@router.get("/live")
+def live() -> dict[str, str]:
+    """El proceso responde; no toca la base."""
+    return {"status": "ok"}
+
+
+def _pool_estado(pool) -> Optional[dict[str, Any]]:
+    """``None`` si el pool esta agotado; si no, su ocupacion."""
+    if not isinstance(pool, QueuePool):
+        return {}
+    # max_overflow negativo significa sin limite.
+    limitado = pool._max_overflow >= 0
+    if limitado and pool.checkedout() >= pool.size() + pool._max_overflow:
+        return None
+    return {"size": pool.size(), "checked_out": pool.checkedout()}
+
+
+def _select_1(engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+@router.get("/ready", response_model=None)
+async def ready() -> dict[str, Any] | JSONResponse:
+    """
+    Lista para recibir trafico: los engines sync y async existen, sus pools
+    tienen cupo y una conexion de cada uno responde ``SELECT 1``. Con un pool
+    agotado responde 503 de inmediato en lugar de esperar ``pool_timeout``.
+    """
+    try:
+        engine = get_engine()
+        async_engine = get_async_engine()
+    except (RuntimeError, ImportError) as exc:
+        return _not_ready(str(exc))
+
+    estado: dict[str, Any] = {}
+    for nombre, pool in (("sync", engine.pool), ("async", async_engine.sync_engine.pool)):
+        estado[nombre] = _pool_estado(pool)
+        if estado[nombre] is None:
+            return _not_ready(f"Pool de conexiones {nombre} agotado")
+
+    try:
+        await run_in_threadpool(_select_1, engine)
+        async with async_engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except Exception as exc:
+        return _not_ready(f"Base de datos no disponible: {exc.__class__.__name__}")
+    return {"status": "ok", "pool": estado}
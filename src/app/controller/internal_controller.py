@@ -0,0 +1,36 @@
+import os
+from typing import Any
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+
+from src.config import get_engine
+from src.infrastructure.db import pool_status
+
+LOCALHOST_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+def assert_internal_access(
+    request: Request,
+    x_internal_token: str | None = Header(default=None),
+) -> None:
+    """Solo desde la maquina local o con ``INTERNAL_TOKEN`` en X-Internal-Token."""
+    token = os.getenv("INTERNAL_TOKEN", "").strip()
+    if token and x_internal_token == token:
+        return
+    client_host = request.client.host if request.client else ""
+    if client_host in LOCALHOST_HOSTS:
+        return
+    raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No encontrado")
+
+
+router = APIRouter(
+    prefix="/_internal",
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(assert_internal_access)],
+)
+
+
+@router.get("/pool")
+def get_pool_status() -> dict[str, Any]:
+    return pool_status(get_engine())
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Response
+
+from src.app.controller.internal_controller import assert_internal_access
+from src.infrastructure.web.request_metrics import registry
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(
+    tags=["internal"],
+    include_in_schema=False,
+    dependencies=[Depends(assert_internal_access)],
+)
+
+
+@router.get("/metrics")
+def get_metrics() -> Response:
+    """Latencia, consultas y tiempo de base por ruta, en formato Prometheus."""
+    return Response(content=registry.render_prometheus(), media_type=PROMETHEUS_MEDIA_TYPE)
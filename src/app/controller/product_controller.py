@@ -1,24 +1,47 @@
-from io import BytesIO
-from typing import Annotated
-from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
-
-from openpyxl import load_workbook
-from pydantic import ValidationError
-
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+import os
+import shutil
+import tempfile
+from functools import partial
+from typing import Annotated, Literal
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.config import get_db
+from src.app.utils.cached_response import cached_json_response
+from src.config import SessionLocal, get_async_db, get_db
 from src.domain.dtos.genericResponseDto import CreationResponse, MessageResponse
 from src.domain.dtos.productsDto import (
     ProductRequest,
     ProductResponse,
-    ProductImportError,
+    ProductImportJobResponse,
     ProductImportResponse,
     ProductStatusUpdate,
 )
-from src.domain.services.product_service import ProductService
+from src.domain.services.product_import_service import (
+    ImportMode,
+    ProgressCallback,
+    ProductImportService,
+    import_jobs,
+)
+from src.domain.services.product_service import AsyncProductService, ProductService
+from src.infrastructure.repository.createAsyncProductsRepository import (
+    AsyncProductRepository,
+)
 from src.infrastructure.repository.createProductsRepository import ProductRepository
+from src.infrastructure.response_cache import CACHE_PRODUCTOS
+from src.utils.xlsx import open_xlsx_rows
+from src.infrastructure.web.etag import product_etag
 
 router = APIRouter(prefix="/productos", tags=["productos"])
 
@@ -28,8 +51,22 @@ def get_product_service(db: Session = Depends(get_db)) -> ProductService:
     return ProductService(repo)
 
 
+def get_async_product_service(
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncProductService:
+    return AsyncProductService(AsyncProductRepository(db))
+
+
 DbDep = Annotated[Session, Depends(get_db)]
 ServiceDep = Annotated[ProductService, Depends(get_product_service)]
+AsyncServiceDep = Annotated[AsyncProductService, Depends(get_async_product_service)]
+
+
+def get_product_import_service(service: ServiceDep) -> ProductImportService:
+    return ProductImportService(service)
+
+
+ImportServiceDep = Annotated[ProductImportService, Depends(get_product_import_service)]
 
 
 @router.post(
@@ -52,23 +89,42 @@ def create_product(
 
 
 @router.get("/", response_model=list[ProductResponse])
-def list_products(service: ServiceDep) -> list[ProductResponse]:
-    return service.list_products()
+def list_products(request: Request, service: ServiceDep) -> Response:
+    return cached_json_response(request, CACHE_PRODUCTOS, service.list_products)
 
 
 @router.get("/buscar", response_model=list[ProductResponse])
-def search_products(q: str, service: ServiceDep) -> list[ProductResponse]:
+async def search_products(
+    q: str,
+    service: AsyncServiceDep,
+    limit: int = Query(default=50, ge=1, le=200),
+) -> list[ProductResponse]:
     if not q.strip():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="El parametro q no puede estar vacio",
         )
-    return service.search_products(q.strip())
+    return await service.search_products(q.strip(), limit=limit)
 
 
-@router.get("/{product_id}", response_model=ProductResponse)
-def get_product(product_id: int, service: ServiceDep) -> ProductResponse:
-    producto = service.get_product(product_id)
+@router.get("/barcode/{codigo}", response_model=ProductResponse)
+def get_product_by_barcode(codigo: str, service: ServiceDep) -> ProductResponse:
+    producto = service.get_product_by_barcode(codigo.strip())
+    if not producto:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Producto no encontrado",
+        )
+    return producto
+
+
+@router.get(
+    "/{product_id}",
+    response_model=ProductResponse,
+    dependencies=[Depends(product_etag)],
+)
+async def get_product(product_id: int, service: AsyncServiceDep) -> ProductResponse:
+    producto = await service.get_product(product_id)
     if not producto:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -88,131 +144,70 @@ def delete_product(product_id: int, service: ServiceDep) -> MessageResponse:
     return MessageResponse(message="Producto eliminado")
 
 
-@router.post("/import", response_model=ProductImportResponse)
-async def import_products(
-    service: ServiceDep,
-    file: UploadFile = File(...),
+def _run_import_job(
+    path: str, mode: ImportMode, progress: ProgressCallback
 ) -> ProductImportResponse:
+    try:
+        with SessionLocal() as db:
+            service = ProductImportService(ProductService(ProductRepository(db)))
+            return service.import_rows(
+                open_xlsx_rows(path), mode=mode, progress=progress
+            )
+    finally:
+        os.unlink(path)
+
+
+@router.post(
+    "/import",
+    response_model=ProductImportResponse | ProductImportJobResponse,
+)
+def import_products(
+    service: ImportServiceDep,
+    response: Response,
+    file: UploadFile = File(...),
+    background: bool = Query(default=False),
+    mode: Literal["create", "upsert"] = Query(default="create"),
+) -> ProductImportResponse | ProductImportJobResponse:
+    # Funcion sincrona: FastAPI la ejecuta en el threadpool y el parseo no
+    # bloquea el event loop.
     if not file.filename or not file.filename.lower().endswith(".xlsx"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="El archivo debe ser un .xlsx",
         )
 
+    if background:
+        # El archivo subido se cierra al responder; el trabajo usa una copia.
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as copia:
+            shutil.copyfileobj(file.file, copia)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return import_jobs.submit(partial(_run_import_job, copia.name, mode))
+
     try:
-        content = await file.read()
-        workbook = load_workbook(BytesIO(content), data_only=True)
+        rows = open_xlsx_rows(file.file)
     except Exception as exc:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"No se pudo leer el archivo: {exc}",
         ) from exc
 
-    sheet = workbook.active
-    header_row = next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), None)
-    if not header_row:
+    try:
+        return service.import_rows(rows, mode=mode)
+    except ValueError as exc:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="El archivo no tiene encabezados",
-        )
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
 
-    field_names = list(ProductRequest.model_fields.keys())
-    field_map = {name.lower(): name for name in field_names}
-    headers = [str(h).strip() if h is not None else "" for h in header_row]
-    header_map = {idx: field_map.get(h.lower()) for idx, h in enumerate(headers)}
 
-    required_fields = [
-        name for name, field in ProductRequest.model_fields.items() if field.is_required()
-    ]
-    missing = [name for name in required_fields if name not in header_map.values()]
-    if missing:
+@router.get("/import/{job_id}", response_model=ProductImportJobResponse)
+def get_import_job(job_id: str) -> ProductImportJobResponse:
+    job = import_jobs.get(job_id)
+    if not job:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Faltan columnas requeridas: {', '.join(missing)}",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Importacion no encontrada",
         )
-
-    items: list[ProductRequest] = []
-    errors: list[ProductImportError] = []
-    max_price = Decimal("99999999.99")
-    for row_index, row in enumerate(
-        sheet.iter_rows(min_row=2, values_only=True), start=2
-    ):
-        payload = {}
-        for idx, value in enumerate(row):
-            field_name = header_map.get(idx)
-            if not field_name:
-                continue
-            if isinstance(value, str):
-                value = value.strip()
-                if value == "":
-                    value = None
-            payload[field_name] = value
-
-        def _add_numeric_error(field_name: str, msg: str, value: object) -> None:
-            errors.append(
-                ProductImportError(
-                    row=row_index,
-                    message=str(
-                        [
-                            {
-                                "type": "value_error",
-                                "loc": (field_name,),
-                                "msg": msg,
-                                "input": value,
-                            }
-                        ]
-                    ),
-                )
-            )
-
-        invalid_numeric = False
-        for field_name in ("precio_venta", "costo", "margen", "iva"):
-            raw_value = payload.get(field_name)
-            if raw_value is None:
-                continue
-            try:
-                value = Decimal(str(raw_value))
-            except (InvalidOperation, ValueError):
-                _add_numeric_error(field_name, "El precio debe ser un numero valido", raw_value)
-                invalid_numeric = True
-                break
-            if value.is_nan() or value.is_infinite():
-                _add_numeric_error(field_name, "El precio debe ser un numero valido", raw_value)
-                invalid_numeric = True
-                break
-            try:
-                value = value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            except (InvalidOperation, ValueError):
-                _add_numeric_error(field_name, "El precio debe tener un formato valido", raw_value)
-                invalid_numeric = True
-                break
-            if value < 0:
-                _add_numeric_error(field_name, "El precio no puede ser negativo", raw_value)
-                invalid_numeric = True
-                break
-            if value > max_price:
-                _add_numeric_error(field_name, "El precio excede el maximo permitido", raw_value)
-                invalid_numeric = True
-                break
-
-        if invalid_numeric:
-            continue
-
-        try:
-            items.append(ProductRequest(**payload))
-        except ValidationError as exc:
-            errors.append(
-                ProductImportError(row=row_index, message=str(exc.errors()))
-            )
-
-    created, skipped = service.import_products(items)
-    return ProductImportResponse(
-        created=created,
-        importados=created,
-        skipped=skipped,
-        invalid=len(errors),
-        errors=errors,
-    )
+    return job
 
 
 @router.put("/{product_id}", response_model=ProductResponse)
@@ -1,8 +1,10 @@
+from functools import partial
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
+from src.app.utils.cached_response import cached_json_response
 from src.config import get_db
 from src.domain.dtos.genericResponseDto import CreationResponse
 from src.domain.dtos.proveedorDto import (
@@ -12,6 +14,7 @@ from src.domain.dtos.proveedorDto import (
 )
 from src.domain.services.proveedor_service import ProveedorService
 from src.infrastructure.repository.createProveedorRepository import ProveedorRepository
+from src.infrastructure.response_cache import CACHE_PROVEEDORES
 
 router = APIRouter(prefix="/proveedores", tags=["proveedores"])
 
@@ -43,12 +46,15 @@ def create_proveedor(
 
 @router.get("/", response_model=list[ProveedorResponse])
 def list_proveedores(
+    request: Request,
     service: ServiceDep,
     q: Optional[str] = None,
-) -> list[ProveedorResponse]:
+) -> Response:
     if q and q.strip():
-        return service.search_proveedores(q)
-    return service.list_proveedores()
+        loader = partial(service.search_proveedores, q)
+    else:
+        loader = service.list_proveedores
+    return cached_json_response(request, CACHE_PROVEEDORES, loader)
 
 
 @router.get("/{proveedor_id}", response_model=ProveedorResponse)
@@ -0,0 +1,35 @@
+from datetime import date
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from src.config import get_db
+from src.domain.dtos.reporteDto import AgrupacionRotacion, RotacionProductosResponse
+from src.domain.services.reporte_service import ReporteService
+from src.infrastructure.repository.createReporteRepository import ReporteRepository
+
+router = APIRouter(prefix="/reportes", tags=["reportes"])
+
+
+def get_reporte_service(db: Session = Depends(get_db)) -> ReporteService:
+    return ReporteService(ReporteRepository(db))
+
+
+ServiceDep = Annotated[ReporteService, Depends(get_reporte_service)]
+
+
+@router.get("/productos/rotacion", response_model=RotacionProductosResponse)
+def rotacion_productos(
+    service: ServiceDep,
+    desde: Optional[date] = None,
+    hasta: Optional[date] = None,
+    top: int = Query(default=20, ge=1, le=200),
+    agrupacion: AgrupacionRotacion = "dia",
+) -> RotacionProductosResponse:
+    try:
+        return service.rotacion_productos(
+            desde=desde, hasta=hasta, top=top, agrupacion=agrupacion
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
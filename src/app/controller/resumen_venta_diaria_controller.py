@@ -47,6 +47,18 @@ def create_resumen(
     return CreationResponse[ResumenVentaDiariaResponse](id=created.id, data=created)
 
 
+@router.post("/recalcular", response_model=list[ResumenVentaDiariaResponse])
+def recalcular_resumenes(
+    desde: date,
+    hasta: date,
+    service: ServiceDep,
+) -> list[ResumenVentaDiariaResponse]:
+    try:
+        return service.recalcular(desde=desde, hasta=hasta)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
 @router.get("/", response_model=list[ResumenVentaDiariaResponse])
 def list_resumenes(
     service: ServiceDep,
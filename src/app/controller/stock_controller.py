@@ -1,12 +1,24 @@
+from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from src.config import get_db
 from src.domain.dtos.genericResponseDto import CreationResponse
-from src.domain.dtos.stockDto import StockRequest, StockResponse
+from src.domain.dtos.stockDto import (
+    AjusteStockRequest,
+    AjusteStockResponse,
+    MovimientoStockHistorialResponse,
+    StockBajoMinimoPageResponse,
+    StockRequest,
+    StockResponse,
+)
+from src.domain.services.movimiento_stock_service import MovimientoStockService
 from src.domain.services.stock_service import StockService
+from src.infrastructure.repository.createMovimientoStockRepository import (
+    MovimientoStockRepository,
+)
 from src.infrastructure.repository.createStockRepository import StockRepository
 
 router = APIRouter(prefix="/stock", tags=["stock"])
@@ -21,6 +33,15 @@ DbDep = Annotated[Session, Depends(get_db)]
 ServiceDep = Annotated[StockService, Depends(get_stock_service)]
 
 
+def get_movimiento_stock_service(db: Session = Depends(get_db)) -> MovimientoStockService:
+    return MovimientoStockService(MovimientoStockRepository(db))
+
+
+MovimientoServiceDep = Annotated[
+    MovimientoStockService, Depends(get_movimiento_stock_service)
+]
+
+
 @router.post(
     "/",
     response_model=CreationResponse[StockResponse],
@@ -53,6 +74,57 @@ def search_stock(q: str, service: ServiceDep) -> list[StockResponse]:
     return service.search_stock(q.strip())
 
 
+@router.get("/bajo-minimo", response_model=StockBajoMinimoPageResponse)
+def list_bajo_minimo(
+    service: ServiceDep,
+    limit: int = Query(default=100, ge=1, le=500),
+    cursor: str | None = None,
+    categoria_id: int | None = None,
+    solo_activos: bool = True,
+) -> StockBajoMinimoPageResponse:
+    try:
+        return service.list_bajo_minimo(
+            limit=limit,
+            cursor=cursor,
+            categoria_id=categoria_id,
+            solo_activos=solo_activos,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.post(
+    "/ajustes",
+    response_model=AjusteStockResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+def registrar_ajuste(
+    payload: AjusteStockRequest,
+    service: MovimientoServiceDep,
+) -> AjusteStockResponse:
+    try:
+        return service.registrar_ajuste(payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
+@router.get(
+    "/productos/{producto_id}/movimientos",
+    response_model=MovimientoStockHistorialResponse,
+)
+def historial_movimientos(
+    producto_id: int,
+    service: MovimientoServiceDep,
+    desde: date | None = None,
+    hasta: date | None = None,
+    limit: int = Query(default=500, ge=1, le=5000),
+) -> MovimientoStockHistorialResponse:
+    try:
+        return service.historial(producto_id, desde=desde, hasta=hasta, limit=limit)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
 @router.get("/{stock_id}", response_model=StockResponse)
 def get_stock(stock_id: int, service: ServiceDep) -> StockResponse:
     stock = service.get_stock(stock_id)
@@ -1,22 +1,30 @@
 from datetime import date
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.config import get_db
+from src.app.utils.cached_response import json_response
+from src.config import get_async_db, get_db
 from src.domain.dtos.genericResponseDto import CreationResponse, MessageResponse
 from src.domain.dtos.ventaDto import (
     VentaAnulacionRequest,
+    VentaBatchRequest,
+    VentaBatchResponse,
     VentaRequest,
     VentaResponse,
     VentaDetallesUpdateRequest,
+    VentaPageResponse,
     VentaResumenResponse,
     VentaStatusRequest,
     VentaUpdateRequest,
 )
-from src.domain.services.venta_service import VentaService
+from src.domain.services.venta_service import AsyncVentaService, VentaService
+from src.infrastructure.repository.createAsyncVentaRepository import AsyncVentaRepository
 from src.infrastructure.repository.createVentaRepository import VentaRepository
+from src.infrastructure.web.etag import venta_etag
 
 router = APIRouter(prefix="/ventas", tags=["ventas"])
 
@@ -26,8 +34,13 @@ def get_venta_service(db: Session = Depends(get_db)) -> VentaService:
     return VentaService(repo)
 
 
+def get_async_venta_service(db: AsyncSession = Depends(get_async_db)) -> AsyncVentaService:
+    return AsyncVentaService(AsyncVentaRepository(db))
+
+
 DbDep = Annotated[Session, Depends(get_db)]
 ServiceDep = Annotated[VentaService, Depends(get_venta_service)]
+AsyncServiceDep = Annotated[AsyncVentaService, Depends(get_async_venta_service)]
 
 
 @router.post(
@@ -35,21 +48,74 @@ ServiceDep = Annotated[VentaService, Depends(get_venta_service)]
     response_model=CreationResponse[VentaResponse],
     status_code=status.HTTP_201_CREATED,
 )
-def create_venta(
+async def create_venta(
     payload: VentaRequest,
-    service: ServiceDep,
+    service: AsyncServiceDep,
 ) -> CreationResponse[VentaResponse]:
     try:
-        created = service.create_venta(payload)
+        created = await service.create_venta(payload)
     except Exception as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
     return CreationResponse[VentaResponse](id=created.venta_id, data=created)
 
 
+@router.post("/batch", response_model=VentaBatchResponse)
+def create_ventas_batch(
+    payload: VentaBatchRequest,
+    service: ServiceDep,
+) -> VentaBatchResponse:
+    try:
+        return service.create_ventas_batch(payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+
 @router.get("/", response_model=list[VentaResponse])
-def list_ventas(service: ServiceDep) -> list[VentaResponse]:
-    return service.list_ventas()
+def list_ventas(service: ServiceDep) -> Response:
+    return json_response(service.list_ventas())
+
+
+@router.get("/pagina", response_model=VentaPageResponse)
+def list_ventas_page(
+    service: ServiceDep,
+    desde: date | None = None,
+    hasta: date | None = None,
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: str | None = None,
+) -> Response:
+    try:
+        page = service.list_ventas_page(
+            desde=desde,
+            hasta=hasta,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return json_response(page)
+
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_ventas(
+    service: ServiceDep,
+    formato: Literal["ndjson", "csv"] = "ndjson",
+    desde: date | None = None,
+    hasta: date | None = None,
+) -> StreamingResponse:
+    chunks = service.export_ventas(formato=formato, desde=desde, hasta=hasta)
+    filename = f"ventas_{desde or 'inicio'}_{hasta or 'hoy'}.{formato}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.get("/resumen", response_model=list[VentaResumenResponse])
@@ -71,7 +137,11 @@ def search_ventas(q: str, service: ServiceDep) -> list[VentaResponse]:
     return service.search_ventas(q.strip())
 
 
-@router.get("/{venta_id}", response_model=VentaResponse)
+@router.get(
+    "/{venta_id}",
+    response_model=VentaResponse,
+    dependencies=[Depends(venta_etag)],
+)
 def get_venta(venta_id: int, service: ServiceDep) -> VentaResponse:
     venta = service.get_venta(venta_id)
     if not venta:
@@ -88,7 +158,10 @@ def update_venta_status(
     payload: VentaStatusRequest,
     service: ServiceDep,
 ) -> VentaResponse:
-    venta = service.update_venta_status(venta_id, payload)
+    try:
+        venta = service.update_venta_status(venta_id, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     if not venta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -121,7 +194,10 @@ def update_venta_detalles(
     payload: VentaDetallesUpdateRequest,
     service: ServiceDep,
 ) -> VentaResponse:
-    venta = service.update_venta_detalles(venta_id, payload)
+    try:
+        venta = service.update_venta_detalles(venta_id, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     if not venta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -136,7 +212,10 @@ def delete_venta_detalle(
     producto_id: int,
     service: ServiceDep,
 ) -> VentaResponse:
-    venta = service.delete_venta_detalle(venta_id, producto_id)
+    try:
+        venta = service.delete_venta_detalle(venta_id, producto_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     if not venta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -168,7 +247,10 @@ def update_venta(
     payload: VentaUpdateRequest,
     service: ServiceDep,
 ) -> VentaResponse:
-    venta = service.update_venta(venta_id, payload)
+    try:
+        venta = service.update_venta(venta_id, payload)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     if not venta:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
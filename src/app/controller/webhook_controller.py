@@ -2,6 +2,7 @@ import os
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from src.app.services.webhook_service import (
@@ -11,7 +12,7 @@ from src.app.services.webhook_service import (
     setup_webhook_logger,
 )
 from src.config import get_db
-from domain.services.ClienteService import ClienteService
+from src.domain.services.ClienteService import ClienteService
 from src.infrastructure.repository.ClienteRepository import ClienteRepository
 
 router = APIRouter(tags=["webhook"])
@@ -64,7 +65,10 @@ async def whatsapp_webhook(
     webhook_service: WebhookService = Depends(get_webhook_service),
 ):
     body = await request.json()
-    return webhook_service.handle_webhook(
+    # handle_webhook consulta la base y llama a la API de WhatsApp de forma
+    # sincrona: en el threadpool no bloquea el event loop.
+    return await run_in_threadpool(
+        webhook_service.handle_webhook,
         body=body,
         cliente_service=cliente_service,
     )
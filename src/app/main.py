@@ -1,9 +1,10 @@
 from pathlib import Path
+import logging
 import os
 import sys
 import threading
 import time
-import webbrowser
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Header, HTTPException, Request, status
@@ -12,11 +13,10 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SRC_DIR = PROJECT_ROOT / "src"
-# Make sure imports work whether the app runs as a module or a script.
-for path in (PROJECT_ROOT, SRC_DIR):
-    if str(path) not in sys.path:
-        sys.path.append(str(path))
+# Every module is imported as ``src.*``; only the project root goes on the
+# path so no module can be loaded a second time under a bare name.
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
 
 from src.app.controller.category_controller import router as category_router
 from src.app.controller.cartera_controller import router as cartera_router
@@ -34,16 +34,29 @@ from src.app.controller.cuenta_cobrar_controller import (
     router as cuenta_cobrar_router,
 )
 from src.app.controller.egreso_controller import router as egreso_router
+from src.app.controller.health_controller import router as health_router
 from src.app.controller.ingreso_controller import router as ingreso_router
+from src.app.controller.internal_controller import router as internal_router
+from src.app.controller.metrics_controller import router as metrics_router
 from src.app.controller.proveedor_controller import router as proveedor_router
 from src.app.controller.movimiento_financiero_controller import (
     router as movimiento_financiero_router,
 )
 from src.app.controller.product_controller import router as product_router
+from src.app.controller.reporte_controller import router as reporte_router
+from src.app.controller.resumen_venta_diaria_controller import (
+    router as resumen_venta_diaria_router,
+)
 from src.app.controller.stock_controller import router as stock_router
 from src.app.controller.user_controller import router as user_router
 from src.app.controller.venta_controller import router as venta_router
 from src.app.controller.visita_controller import router as visita_router
+from src.config import SessionLocal, dispose_engines, get_engine
+from src.domain.services.product_service import ProductService
+from src.infrastructure.numero_factura import get_numero_factura_allocator
+from src.infrastructure.repository.createProductsRepository import ProductRepository
+from src.infrastructure.web.request_metrics import RequestMetricsMiddleware, metrics_enabled
+from src.infrastructure.web.responses import POSJSONResponse
 
 DEFAULT_PORT = 8000
 DOCS_URL = f"http://127.0.0.1:{DEFAULT_PORT}/docs"
@@ -56,6 +69,8 @@ BROWSER_CANDIDATES = [
 ]
 LOCALHOST_HOSTS = {"127.0.0.1", "::1", "localhost"}
 
+logger = logging.getLogger("app.startup")
+
 
 def env_bool(name: str, default: bool = False) -> bool:
     raw_value = os.getenv(name)
@@ -76,6 +91,32 @@ def load_environment() -> None:
             break
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # El engine se crea aqui y no al importar: importar la app no toca la base.
+    try:
+        get_engine()
+    except RuntimeError as exc:
+        logger.warning("No fue posible crear el engine: %s", exc, exc_info=True)
+    try:
+        get_numero_factura_allocator().ensure_sequence()
+    except Exception as exc:
+        # Si la base no responde, el allocator la asegura en la primera venta.
+        logger.warning(
+            "No fue posible asegurar la secuencia de facturas: %s", exc, exc_info=True
+        )
+    try:
+        with SessionLocal() as db:
+            ProductService(ProductRepository(db)).warm_barcode_index()
+    except Exception as exc:
+        # Se carga en el primer escaneo.
+        logger.warning(
+            "No fue posible cargar el indice de codigos de barras: %s", exc, exc_info=True
+        )
+    yield
+    await dispose_engines()
+
+
 def create_app() -> FastAPI:
     load_environment()
 
@@ -89,6 +130,8 @@ def create_app() -> FastAPI:
         docs_url=None,
         redoc_url=None,
         openapi_url=None,
+        lifespan=lifespan,
+        default_response_class=POSJSONResponse,
     )
 
     allowed_origins = [
@@ -106,6 +149,13 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    if metrics_enabled():
+        # Sin REQUEST_METRICS no se agrega el middleware ni los hooks de consultas.
+        app.add_middleware(
+            RequestMetricsMiddleware,
+            server_timing=env_bool("SERVER_TIMING", default=True),
+        )
+        app.include_router(metrics_router)
 
     app.include_router(category_router)
     app.include_router(cartera_router)
@@ -117,10 +167,14 @@ def create_app() -> FastAPI:
     app.include_router(contabilidad_categoria_router)
     app.include_router(cuenta_cobrar_router)
     app.include_router(egreso_router)
+    app.include_router(health_router)
     app.include_router(ingreso_router)
+    app.include_router(internal_router)
     app.include_router(proveedor_router)
     app.include_router(movimiento_financiero_router)
     app.include_router(product_router)
+    app.include_router(reporte_router)
+    app.include_router(resumen_venta_diaria_router)
     app.include_router(stock_router)
     app.include_router(user_router)
     app.include_router(venta_router)
@@ -180,6 +234,8 @@ app = create_app()
 
 
 def open_docs_in_browser() -> None:
+    import webbrowser
+
     time.sleep(1)
 
     for path in BROWSER_CANDIDATES:
@@ -3,7 +3,6 @@ import os
 from dataclasses import dataclass, field
 from typing import Optional, Set
 
-import requests
 from fastapi import HTTPException, status
 
 from src.domain.dtos.clienteDto import ClienteRequest
@@ -183,6 +182,9 @@ class WebhookService:
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail="WhatsApp client no configurado",
             )
+        # requests solo se carga cuando el webhook envia mensajes.
+        import requests
+
         try:
             self.whatsapp_client.send_message(recipient, message)
         except requests.HTTPError as exc:
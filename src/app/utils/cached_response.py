@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Optional
+from urllib.parse import urlencode
+
+from fastapi import Request, Response, status
+from pydantic_core import to_json
+
+from src.infrastructure.response_cache import ResponseCache, response_cache
+from src.infrastructure.web.etag import etag_matches
+
+
+def route_key(request: Request) -> str:
+    """Ruta + query ordenada, para que el orden de los parametros no duplique entradas."""
+    query = urlencode(sorted(request.query_params.multi_items()))
+    return f"{request.url.path}?{query}" if query else request.url.path
+
+
+def dump_json(data: Any) -> bytes:
+    """
+    Serializa DTOs ya construidos con su propio serializador (Decimal y UUID
+    como texto), sin la validacion de ``response_model``.
+    """
+    return to_json(data)
+
+
+def json_response(data: Any) -> Response:
+    """Respuesta JSON para datos ya confiables, como las proyecciones del repositorio."""
+    return Response(content=dump_json(data), media_type="application/json")
+
+
+def not_modified_or_none(request: Request, etag: str) -> Optional[Response]:
+    """Respuesta 304 sin cuerpo si el cliente ya tiene ``etag``."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag, "Cache-Control": "no-cache"},
+        )
+    return None
+
+
+def cached_json_response(
+    request: Request,
+    namespace: str,
+    loader: Callable[[], Any],
+    *,
+    cache: ResponseCache = response_cache,
+) -> Response:
+    """
+    Sirve el JSON de ``loader`` desde la cache compartida. En un acierto no se
+    consulta la base ni se valida nada; en un fallo se serializa una sola vez
+    y se guarda con su ETag.
+    """
+    key = cache.key(namespace, route_key(request))
+    entry = cache.get(key)
+    if entry is None:
+        entry = cache.set(key, dump_json(loader()))
+    not_modified = not_modified_or_none(request, entry.etag)
+    if not_modified is not None:
+        return not_modified
+    return Response(
+        content=entry.body,
+        media_type="application/json",
+        headers={"ETag": entry.etag, "Cache-Control": "no-cache"},
+    )
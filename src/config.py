@@ -1,10 +1,18 @@
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 import os
+import threading
 
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from src.infrastructure.db import create_async_db_engine, create_db_engine
+from src.infrastructure.web.request_metrics import instrument_queries, metrics_enabled
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 ENV_CANDIDATES = [
     PROJECT_ROOT / ".env",
@@ -22,19 +30,41 @@ def load_environment() -> None:
 load_environment()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
-if not DATABASE_URL:
-    raise RuntimeError("DATABASE_URL no esta definido en el entorno")
+# Por defecto la misma base de DATABASE_URL con el driver asyncpg.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+
+_engine: Optional[Engine] = None
+_async_engine: Optional["AsyncEngine"] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """
+    Engine compartido, creado en el primer uso (o en el lifespan de la app).
+    Importar este modulo no abre conexiones ni exige DATABASE_URL.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                if not DATABASE_URL:
+                    raise RuntimeError("DATABASE_URL no esta definido en el entorno")
+                _engine = create_db_engine(DATABASE_URL)
+                if metrics_enabled():
+                    instrument_queries(_engine)
+    return _engine
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 
-try:
-    with engine.connect() as connection:
-        result = connection.execute(text("SELECT 'Conexion exitosa a PostgreSQL en AWS RDS --'"))
-        print(result.scalar())
-except Exception as e:
-    print(f"Error de conexion: {e}")
+class LazySessionmaker(sessionmaker):
+    """sessionmaker que enlaza el engine al abrir la primera sesion."""
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    def __call__(self, **local_kw):
+        if "bind" not in local_kw and self.kw.get("bind") is None:
+            local_kw["bind"] = get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = LazySessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
 
@@ -44,3 +74,37 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_async_engine() -> "AsyncEngine":
+    """Engine asyncio compartido; como ``get_engine``, se crea en el primer uso."""
+    global _async_engine
+    if _async_engine is None:
+        with _engine_lock:
+            if _async_engine is None:
+                url = ASYNC_DATABASE_URL or DATABASE_URL
+                if not url:
+                    raise RuntimeError("DATABASE_URL no esta definido en el entorno")
+                _async_engine = create_async_db_engine(url)
+                if metrics_enabled():
+                    instrument_queries(_async_engine.sync_engine)
+    return _async_engine
+
+
+def async_session() -> "AsyncSession":
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    return AsyncSession(bind=get_async_engine(), autoflush=False)
+
+
+async def get_async_db():
+    async with async_session() as db:
+        yield db
+
+
+async def dispose_engines() -> None:
+    """Cierra los pools creados; los que nunca se usaron no se crean aqui."""
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
@@ -6,7 +6,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from domain.enums.contabilidadEnums import CajaEstado
+from src.domain.enums.contabilidadEnums import CajaEstado
 
 
 class CajaRequest(BaseModel):
@@ -37,6 +37,18 @@ class CajaResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class CajaBalanceResponse(BaseModel):
+    caja_id: int
+    saldo_inicial: Decimal
+    total_ingresos: Decimal
+    total_egresos: Decimal
+    saldo_teorico: Decimal
+    desde: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
 class CajaUpdateRequest(BaseModel):
     nombre: Optional[str] = Field(default=None, min_length=1, max_length=150)
     saldo_inicial: Optional[Decimal] = Field(default=None, ge=Decimal("0.00"))
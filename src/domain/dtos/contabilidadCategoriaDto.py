@@ -4,7 +4,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from domain.enums.contabilidadEnums import CategoriaTipo
+from src.domain.enums.contabilidadEnums import CategoriaTipo
 
 
 class ContabilidadCategoriaRequest(BaseModel):
@@ -7,9 +7,9 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from domain.enums.contabilidadEnums import CreditoEstado
-from domain.dtos.abonoCuentaDto import AbonoCuentaResponse
-from domain.dtos.ventaDto import VentaDetalleResponse
+from src.domain.enums.contabilidadEnums import CreditoEstado
+from src.domain.dtos.abonoCuentaDto import AbonoCuentaResponse
+from src.domain.dtos.ventaDto import VentaDetalleResponse
 
 
 class CuentaCobrarRequest(BaseModel):
@@ -6,7 +6,7 @@ from typing import Optional
 
 from pydantic import BaseModel, Field
 
-from domain.enums.contabilidadEnums import CategoriaTipo
+from src.domain.enums.contabilidadEnums import CategoriaTipo
 
 
 class MovimientoFinancieroRequest(BaseModel):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
-from typing import Any, ClassVar, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -119,13 +119,34 @@ class ProductImportError(BaseModel):
 
 
 class ProductImportResponse(BaseModel):
+    processed: int = 0
     created: int
     importados: int
     skipped: int
     invalid: int
+    updated: int = 0
+    unchanged: int = 0
     errors: list[ProductImportError] = Field(default_factory=list)
 
 
+class ProductImportJobResponse(BaseModel):
+    """
+    DTO con el avance de una importacion en segundo plano.
+    """
+    job_id: str
+    estado: Literal["pendiente", "procesando", "completado", "fallido"]
+    processed: int = 0
+    created: int = 0
+    skipped: int = 0
+    invalid: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    errors: list[ProductImportError] = Field(default_factory=list)
+    error: Optional[str] = None
+    fecha_creacion: datetime
+    fecha_fin: Optional[datetime] = None
+
+
 class ProductResponse(BaseModel):
     """
     DTO para manejar las respuestas relacionadas con productos.
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Literal, Optional
+
+from pydantic import BaseModel, Field
+
+AgrupacionRotacion = Literal["dia", "semana"]
+
+
+class RotacionPeriodoResponse(BaseModel):
+    periodo: date
+    cantidad: int
+    ingreso: Decimal
+
+
+class RotacionProductoResponse(BaseModel):
+    """
+    Ventas de un producto en el rango. El margen se estima con el costo
+    actual del producto (no se guarda el costo historico por venta).
+    """
+
+    producto_id: int
+    codigo_barras: Optional[str] = None
+    nombre: str
+    cantidad: int
+    ingreso: Decimal
+    costo_estimado: Decimal
+    margen: Decimal
+    margen_pct: Optional[Decimal] = None
+    promedio_diario: Decimal
+    periodos: list[RotacionPeriodoResponse] = Field(default_factory=list)
+
+
+class RotacionProductosResponse(BaseModel):
+    desde: date
+    hasta: date
+    agrupacion: AgrupacionRotacion
+    top: int
+    por_cantidad: list[RotacionProductoResponse] = Field(default_factory=list)
+    por_ingreso: list[RotacionProductoResponse] = Field(default_factory=list)
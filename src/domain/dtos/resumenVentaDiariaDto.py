@@ -14,6 +14,7 @@ class ResumenVentaDiariaRequest(BaseModel):
     total_efectivo: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
     total_tarjeta: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
     total_transferencia: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
+    total_credito: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
     cantidad_transacciones: int = Field(default=0, ge=0)
     generado_por_whatsapp_user_id: str = Field(..., min_length=1, max_length=255)
 
@@ -25,9 +26,11 @@ class ResumenVentaDiariaResponse(BaseModel):
     total_efectivo: Decimal
     total_tarjeta: Decimal
     total_transferencia: Decimal
+    total_credito: Decimal = Decimal("0.00")
     cantidad_transacciones: int
-    generado_por_whatsapp_user_id: str
+    generado_por_whatsapp_user_id: Optional[str] = None
     created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
     model_config = {"from_attributes": True}
 
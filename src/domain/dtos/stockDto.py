@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class StockRequest(BaseModel):
@@ -33,3 +33,74 @@ class StockResponse(BaseModel):
     creado_por_id: Optional[int]
 
     model_config = {"from_attributes": True}
+
+
+class StockBajoMinimoResponse(BaseModel):
+    """
+    DTO para el reporte de productos con stock en o bajo el minimo.
+    """
+
+    stock_id: int
+    producto_id: int
+    producto_nombre: str
+    codigo_barras: Optional[str] = None
+    categoria_id: Optional[int] = None
+    categoria_nombre: Optional[str] = None
+    cantidad_actual: int
+    cantidad_minima: int
+    faltante: int
+    ultima_actualizacion: Optional[datetime] = None
+
+
+class StockBajoMinimoPageResponse(BaseModel):
+    items: list[StockBajoMinimoResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+class AjusteStockRequest(BaseModel):
+    """
+    DTO para un ajuste manual de inventario (conteo, merma, ingreso de mercancia).
+    """
+
+    producto_id: int = Field(..., ge=1)
+    delta: int = Field(..., description="Positivo suma unidades, negativo las descuenta.")
+    nota: Optional[str] = Field(default=None, max_length=255)
+    referencia_doc: Optional[str] = Field(default=None, max_length=64)
+    realizado_por_id: Optional[int] = None
+
+    @field_validator("delta")
+    def _delta_no_cero(cls, v: int) -> int:
+        if v == 0:
+            raise ValueError("delta no puede ser 0")
+        return v
+
+
+class AjusteStockResponse(BaseModel):
+    producto_id: int
+    cantidad_actual: int
+
+
+class MovimientoStockResponse(BaseModel):
+    movimiento_id: int
+    producto_id: int
+    tipo: str
+    referencia: str
+    cantidad: int
+    delta: int
+    fecha_creacion: datetime
+    referencia_doc: Optional[str] = None
+    nota: Optional[str] = None
+    realizado_por_id: Optional[int] = None
+
+
+class FlujoStockDiarioResponse(BaseModel):
+    fecha: date
+    entradas: int
+    salidas: int
+    neto: int
+
+
+class MovimientoStockHistorialResponse(BaseModel):
+    producto_id: int
+    movimientos: list[MovimientoStockResponse] = Field(default_factory=list)
+    flujo_diario: list[FlujoStockDiarioResponse] = Field(default_factory=list)
@@ -2,11 +2,35 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
 
+# Columnas de la exportacion plana (una fila por detalle de venta).
+VENTA_EXPORT_COLUMNS: tuple[str, ...] = (
+    "venta_id",
+    "fecha",
+    "numero_factura",
+    "tipo_pago",
+    "es_credito",
+    "estado",
+    "cliente_id",
+    "user_id",
+    "venta_subtotal",
+    "venta_impuesto",
+    "venta_descuento",
+    "venta_total",
+    "nota_venta",
+    "venta_detalle_id",
+    "producto_id",
+    "producto_nombre",
+    "cantidad",
+    "precio_unitario",
+    "detalle_descuento",
+    "detalle_subtotal",
+)
+
 
 class VentaDetalleRequest(BaseModel):
     producto_id: int = Field(..., ge=1)
@@ -27,6 +51,12 @@ class VentaRequest(BaseModel):
     impuesto: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
     descuento: Decimal = Field(default=Decimal("0.00"), ge=Decimal("0.00"))
     fecha: Optional[datetime] = None
+    idempotency_key: Optional[str] = Field(
+        default=None,
+        min_length=1,
+        max_length=64,
+        description="Clave unica del terminal; reenviar la misma clave no duplica la venta.",
+    )
     detalles: list[VentaDetalleRequest] = Field(default_factory=list)
 
     @model_validator(mode="after")
@@ -36,6 +66,34 @@ class VentaRequest(BaseModel):
         return self
 
 
+class VentaBatchItem(VentaRequest):
+    idempotency_key: str = Field(..., min_length=1, max_length=64)
+
+
+class VentaBatchRequest(BaseModel):
+    """
+    DTO para registrar en lote ventas hechas sin conexion.
+    """
+
+    ventas: list[VentaBatchItem] = Field(..., min_length=1, max_length=500)
+
+
+class VentaBatchItemResult(BaseModel):
+    index: int
+    idempotency_key: str
+    estado: Literal["creada", "duplicada", "error"]
+    venta_id: Optional[int] = None
+    numero_factura: Optional[str] = None
+    error: Optional[str] = None
+
+
+class VentaBatchResponse(BaseModel):
+    creadas: int = 0
+    duplicadas: int = 0
+    errores: int = 0
+    resultados: list[VentaBatchItemResult] = Field(default_factory=list)
+
+
 class VentaDetalleResponse(BaseModel):
     venta_detalle_id: int
     venta_id: int
@@ -63,11 +121,21 @@ class VentaResponse(BaseModel):
     numero_factura: Optional[str]
     cliente_id: Optional[UUID]
     user_id: Optional[int]
+    idempotency_key: Optional[str] = None
     detalles: list[VentaDetalleResponse] = Field(default_factory=list)
 
     model_config = {"from_attributes": True}
 
 
+class VentaPageResponse(BaseModel):
+    """
+    DTO para una pagina de ventas ordenada por fecha descendente.
+    """
+
+    items: list[VentaResponse] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
 class VentaResumenResponse(BaseModel):
     fecha: datetime
     numero_factura: Optional[str]
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CajaBalanceEntity(BaseModel):
+    caja_id: int
+    saldo_inicial: Decimal = Decimal("0.00")
+    total_ingresos: Decimal = Decimal("0.00")
+    total_egresos: Decimal = Decimal("0.00")
+    saldo_teorico: Decimal = Decimal("0.00")
+    desde: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        validate_assignment=True,
+    )
+
+    @classmethod
+    def from_model(cls, obj: Any) -> "CajaBalanceEntity":
+        return cls.model_validate(obj)
@@ -6,7 +6,7 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from domain.enums.contabilidadEnums import CajaEstado
+from src.domain.enums.contabilidadEnums import CajaEstado
 
 
 class CajaEntity(BaseModel):
@@ -4,7 +4,7 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from domain.enums.contabilidadEnums import CategoriaTipo
+from src.domain.enums.contabilidadEnums import CategoriaTipo
 
 
 class ContabilidadCategoriaEntity(BaseModel):
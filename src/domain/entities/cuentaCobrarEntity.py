@@ -7,8 +7,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from domain.enums.contabilidadEnums import CreditoEstado
-from domain.entities.ventaDetalleEntity import VentaDetalleEntity
+from src.domain.enums.contabilidadEnums import CreditoEstado
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity
 
 
 class CuentaCobrarEntity(BaseModel):
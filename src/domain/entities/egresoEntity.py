@@ -6,7 +6,7 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from domain.enums.contabilidadEnums import MedioPago
+from src.domain.enums.contabilidadEnums import MedioPago
 
 
 class EgresoEntity(BaseModel):
@@ -7,7 +7,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
-from domain.entities.ventaDetalleEntity import VentaDetalleEntity
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity
 
 
 class VentaEntity(BaseModel):
@@ -28,6 +28,7 @@ class VentaEntity(BaseModel):
     numero_factura: Optional[str] = None
     cliente_id: Optional[UUID] = None
     user_id: Optional[int] = None
+    idempotency_key: Optional[str] = None
     detalles: Optional[list[VentaDetalleEntity]] = None
 
     model_config = ConfigDict(
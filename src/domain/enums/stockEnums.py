@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class TipoMovimientoStock(str, Enum):
+    ENTRADA = "ENTRADA"
+    SALIDA = "SALIDA"
+
+
+class RefMovimientoStock(str, Enum):
+    VENTA = "VENTA"
+    ANULACION_VENTA = "ANULACION_VENTA"
+    EDICION_VENTA = "EDICION_VENTA"
+    AJUSTE_MANUAL = "AJUSTE_MANUAL"
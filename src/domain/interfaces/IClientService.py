@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
-from domain.dtos.clienteDto import ClienteRequest, ClienteResponse, ClienteUpdateRequest
+from src.domain.dtos.clienteDto import ClienteRequest, ClienteResponse, ClienteUpdateRequest
 
 
 class IClientService(ABC):
@@ -3,7 +3,11 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.dtos.stockDto import StockRequest, StockResponse
+from src.domain.dtos.stockDto import (
+    StockBajoMinimoPageResponse,
+    StockRequest,
+    StockResponse,
+)
 
 
 class IStockService(ABC):
@@ -22,3 +26,14 @@ class IStockService(ABC):
     @abstractmethod
     def search_stock(self, term: str) -> List[StockResponse]:
         ...
+
+    @abstractmethod
+    def list_bajo_minimo(
+        self,
+        *,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        categoria_id: Optional[int] = None,
+        solo_activos: bool = True,
+    ) -> StockBajoMinimoPageResponse:
+        ...
@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.dtos.userDto import (
+from src.domain.dtos.userDto import (
     UserRequest,
     UserResponse,
     UserStatusRequest,
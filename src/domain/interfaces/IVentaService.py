@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import date
 from typing import List, Optional
 
-from domain.dtos.ventaDto import (
+from src.domain.dtos.ventaDto import (
     VentaAnulacionRequest,
+    VentaBatchRequest,
+    VentaBatchResponse,
     VentaRequest,
     VentaResponse,
     VentaDetallesUpdateRequest,
+    VentaPageResponse,
     VentaStatusRequest,
     VentaUpdateRequest,
 )
@@ -18,6 +22,10 @@ class IVentaService(ABC):
     def create_venta(self, data: VentaRequest) -> VentaResponse:
         ...
 
+    @abstractmethod
+    def create_ventas_batch(self, data: VentaBatchRequest) -> VentaBatchResponse:
+        ...
+
     @abstractmethod
     def get_venta(self, venta_id: int) -> Optional[VentaResponse]:
         ...
@@ -26,6 +34,17 @@ class IVentaService(ABC):
     def list_ventas(self) -> List[VentaResponse]:
         ...
 
+    @abstractmethod
+    def list_ventas_page(
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> VentaPageResponse:
+        ...
+
     @abstractmethod
     def search_ventas(self, term: str) -> List[VentaResponse]:
         ...
@@ -3,7 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.entities.cajaEntity import CajaEntity
+from src.domain.entities.cajaBalanceEntity import CajaBalanceEntity
+from src.domain.entities.cajaEntity import CajaEntity
 
 
 class CajaRepositoryInterface(ABC):
@@ -19,6 +20,10 @@ class CajaRepositoryInterface(ABC):
     def list_cajas(self) -> List[CajaEntity]:
         raise NotImplementedError
 
+    @abstractmethod
+    def get_balance(self, caja_id: int) -> Optional[CajaBalanceEntity]:
+        raise NotImplementedError
+
     @abstractmethod
     def update_caja(self, caja_id: int, entity: CajaEntity) -> Optional[CajaEntity]:
         raise NotImplementedError
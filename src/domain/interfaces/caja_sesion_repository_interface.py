@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.entities.cajaSesionEntity import CajaSesionEntity
+from src.domain.entities.cajaSesionEntity import CajaSesionEntity
 
 
 class CajaSesionRepositoryInterface(ABC):
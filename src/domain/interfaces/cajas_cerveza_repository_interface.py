@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.entities.cajasCervezaEntity import CajasCervezaEntity
+from src.domain.entities.cajasCervezaEntity import CajasCervezaEntity
 
 
 class CajasCervezaRepositoryInterface(ABC):
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import List, Optional
 
-from domain.entities.carteraEntity import CarteraEntity
+from src.domain.entities.carteraEntity import CarteraEntity
 
 
 class CarteraRepositoryInterface(ABC):
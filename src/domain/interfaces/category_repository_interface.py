@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Optional
 
-from domain.entities.categoryEntity import CategoryEntity
+from src.domain.entities.categoryEntity import CategoryEntity
 
 
 class CategoryRepositoryInterface(ABC):
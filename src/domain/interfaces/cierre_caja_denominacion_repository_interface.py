@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.entities.cierreCajaDenominacionEntity import CierreCajaDenominacionEntity
+from src.domain.entities.cierreCajaDenominacionEntity import CierreCajaDenominacionEntity
 
 
 class CierreCajaDenominacionRepositoryInterface(ABC):
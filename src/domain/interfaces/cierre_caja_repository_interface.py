@@ -5,7 +5,7 @@ from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from domain.entities.cierreCajaEntity import CierreCajaEntity
+from src.domain.entities.cierreCajaEntity import CierreCajaEntity
 
 
 class CierreCajaRepositoryInterface(ABC):
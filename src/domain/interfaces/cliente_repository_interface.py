@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
-from domain.entities.clienteEntity import ClienteEntity
+from src.domain.entities.clienteEntity import ClienteEntity
 
 
 class ClienteRepositoryInterface(ABC):
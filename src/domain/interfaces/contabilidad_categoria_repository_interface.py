@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.entities.contabilidadCategoriaEntity import ContabilidadCategoriaEntity
+from src.domain.entities.contabilidadCategoriaEntity import ContabilidadCategoriaEntity
 
 
 class ContabilidadCategoriaRepositoryInterface(ABC):
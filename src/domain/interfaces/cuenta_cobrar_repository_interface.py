@@ -4,9 +4,9 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
-from domain.entities.abonoCuentaEntity import AbonoCuentaEntity
-from domain.entities.cuentaCobrarEntity import CuentaCobrarEntity
-from domain.enums.contabilidadEnums import CreditoEstado
+from src.domain.entities.abonoCuentaEntity import AbonoCuentaEntity
+from src.domain.entities.cuentaCobrarEntity import CuentaCobrarEntity
+from src.domain.enums.contabilidadEnums import CreditoEstado
 
 
 class CuentaCobrarRepositoryInterface(ABC):
@@ -5,7 +5,7 @@ from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from domain.entities.egresoEntity import EgresoEntity
+from src.domain.entities.egresoEntity import EgresoEntity
 
 
 class EgresoRepositoryInterface(ABC):
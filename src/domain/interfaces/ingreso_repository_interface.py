@@ -5,7 +5,7 @@ from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from domain.entities.ingresoEntity import IngresoEntity
+from src.domain.entities.ingresoEntity import IngresoEntity
 
 
 class IngresoRepositoryInterface(ABC):
@@ -4,8 +4,8 @@ from abc import ABC, abstractmethod
 from datetime import date
 from typing import List, Optional
 
-from domain.entities.movimientoFinancieroEntity import MovimientoFinancieroEntity
-from domain.enums.contabilidadEnums import CategoriaTipo
+from src.domain.entities.movimientoFinancieroEntity import MovimientoFinancieroEntity
+from src.domain.enums.contabilidadEnums import CategoriaTipo
 
 
 class MovimientoFinancieroRepositoryInterface(ABC):
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Iterable, Optional
+
+from src.domain.dtos.stockDto import MovimientoStockHistorialResponse
+from src.domain.enums.stockEnums import RefMovimientoStock
+
+
+class MovimientoStockRepositoryInterface(ABC):
+    @abstractmethod
+    def apply_deltas(
+        self,
+        movimientos: Iterable[tuple[int, int, Optional[str]]],
+        *,
+        ref: RefMovimientoStock,
+        realizado_por_id: Optional[int] = None,
+        nota: Optional[str] = None,
+    ) -> dict[int, int]:
+        """
+        Ajusta stock con (producto_id, delta, referencia_doc) y registra los
+        movimientos; devuelve la cantidad resultante por producto. No hace
+        commit ni rollback: ante ValueError el llamador deshace su transaccion.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def registrar_ajuste(
+        self,
+        producto_id: int,
+        delta: int,
+        *,
+        nota: Optional[str] = None,
+        referencia_doc: Optional[str] = None,
+        realizado_por_id: Optional[int] = None,
+    ) -> int:
+        """Aplica un ajuste manual, hace commit y devuelve la cantidad resultante."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def historial(
+        self,
+        producto_id: int,
+        *,
+        desde: date,
+        hasta: date,
+        limit: int = 500,
+    ) -> MovimientoStockHistorialResponse:
+        """Movimientos del producto (mas recientes primero) y su flujo neto por dia."""
+        raise NotImplementedError
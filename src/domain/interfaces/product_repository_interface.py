@@ -4,7 +4,8 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Optional
 
-from domain.entities.productsEntity import ProductEntity
+from src.domain.dtos.productsDto import ProductResponse
+from src.domain.entities.productsEntity import ProductEntity
 
 
 class ProductRepositoryInterface(ABC):
@@ -16,8 +17,8 @@ class ProductRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_products(self) -> List[ProductEntity]:
-        """Devuelve todos los productos."""
+    def list_products(self) -> List[ProductResponse]:
+        """Devuelve todos los productos ya proyectados al DTO de respuesta."""
         raise NotImplementedError
 
     @abstractmethod
@@ -26,8 +27,13 @@ class ProductRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def search_products(self, term: str) -> List[ProductEntity]:
-        """Busca productos por nombre, descripcion, codigo_barras, precio_venta, costo o estado."""
+    def get_product_by_barcode(self, codigo: str) -> Optional[ProductEntity]:
+        """Devuelve el producto con ese codigo_barras o None si no existe."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def search_products(self, term: str, limit: int = 50) -> List[ProductEntity]:
+        """Busca productos por nombre, descripcion, codigo_barras o precio, mas relevantes primero."""
         raise NotImplementedError
 
     @abstractmethod
@@ -53,7 +59,28 @@ class ProductRepositoryInterface(ABC):
         """Elimina un producto y devuelve True si existia."""
         raise NotImplementedError
 
+    @abstractmethod
+    def upsert_products(
+        self, products: List[ProductEntity]
+    ) -> tuple[int, int, int]:
+        """Crea o actualiza precios/estado por codigo_barras; devuelve (creados, actualizados, sin cambios)."""
+        raise NotImplementedError
+
     @abstractmethod
     def import_products(self, products: List[ProductEntity]) -> tuple[int, int]:
         """Importa productos en lote y devuelve (creados, omitidos)."""
         raise NotImplementedError
+
+
+class AsyncProductRepositoryInterface(ABC):
+    """Contrato async para las lecturas de productos del camino caliente."""
+
+    @abstractmethod
+    async def get_product(self, product_id: int) -> Optional[ProductEntity]:
+        """Devuelve un producto por su ID o None si no existe."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_products(self, term: str, limit: int = 50) -> List[ProductEntity]:
+        """Busca productos por nombre, descripcion, codigo_barras o precio, mas relevantes primero."""
+        raise NotImplementedError
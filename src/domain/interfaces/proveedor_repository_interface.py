@@ -3,7 +3,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.entities.proveedorEntity import ProveedorEntity
+from src.domain.entities.proveedorEntity import ProveedorEntity
 
 
 class ProveedorRepositoryInterface(ABC):
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date
+
+from src.domain.dtos.reporteDto import AgrupacionRotacion, RotacionProductosResponse
+
+
+class ReporteRepositoryInterface(ABC):
+    @abstractmethod
+    def rotacion_productos(
+        self,
+        *,
+        desde: date,
+        hasta: date,
+        top: int,
+        agrupacion: AgrupacionRotacion,
+    ) -> RotacionProductosResponse:
+        """Top de productos por cantidad e ingreso (ventas no anuladas) con su serie por periodo."""
+        raise NotImplementedError
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Iterable, List, Optional
 from uuid import UUID
 
-from domain.entities.resumenVentaDiariaEntity import ResumenVentaDiariaEntity
+from src.domain.entities.resumenVentaDiariaEntity import ResumenVentaDiariaEntity
 
 
 class ResumenVentaDiariaRepositoryInterface(ABC):
@@ -29,3 +30,25 @@ class ResumenVentaDiariaRepositoryInterface(ABC):
     ) -> List[ResumenVentaDiariaEntity]:
         raise NotImplementedError
 
+    @abstractmethod
+    def apply_venta(
+        self,
+        fecha: datetime,
+        tipo_pago: Optional[str],
+        total: Decimal,
+        signo: int = 1,
+        cantidad: int = 1,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def rebuild_pendientes(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def refresh_dias(self, fechas: Iterable[date]) -> List[ResumenVentaDiariaEntity]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def refresh_rango(self, desde: date, hasta: date) -> List[ResumenVentaDiariaEntity]:
+        raise NotImplementedError
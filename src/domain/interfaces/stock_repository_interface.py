@@ -3,7 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from domain.entities.stockEntity import StockEntity
+from src.domain.dtos.stockDto import StockBajoMinimoResponse
+from src.domain.entities.stockEntity import StockEntity
 
 
 class StockRepositoryInterface(ABC):
@@ -28,3 +29,15 @@ class StockRepositoryInterface(ABC):
     def search_stock(self, term: str) -> List[StockEntity]:
         """Busca stock por producto_id, cantidades o estado de texto."""
         raise NotImplementedError
+
+    @abstractmethod
+    def list_bajo_minimo(
+        self,
+        *,
+        limit: int = 100,
+        cursor: Optional[tuple[int, int]] = None,
+        categoria_id: Optional[int] = None,
+        solo_activos: bool = True,
+    ) -> tuple[List[StockBajoMinimoResponse], Optional[tuple[int, int]]]:
+        """Pagina del stock en o bajo el minimo y la clave (producto_id, stock_id) para seguir."""
+        raise NotImplementedError
@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Optional
 
-from domain.entities.userEntity import UserEntity
+from src.domain.entities.userEntity import UserEntity
 
 
 class UserRepositoryInterface(ABC):
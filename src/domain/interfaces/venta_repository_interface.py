@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, Iterator, List, Optional
 
-from domain.entities.ventaDetalleEntity import VentaDetalleEntity
-from domain.entities.ventaEntity import VentaEntity
-from domain.dtos.ventaDto import VentaResumenResponse
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity
+from src.domain.entities.ventaEntity import VentaEntity
+from src.domain.dtos.ventaDto import (
+    VentaBatchItemResult,
+    VentaResponse,
+    VentaResumenResponse,
+)
 
 
 class VentaRepositoryInterface(ABC):
@@ -23,8 +27,39 @@ class VentaRepositoryInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def list_ventas(self) -> List[VentaEntity]:
-        """Devuelve todas las ventas."""
+    def create_ventas_batch(
+        self,
+        ventas: List[tuple[int, VentaEntity, List[VentaDetalleEntity]]],
+    ) -> List[VentaBatchItemResult]:
+        """Persiste un lote de ventas (index, venta, detalles) en una transaccion."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_ventas(self) -> List[VentaResponse]:
+        """Devuelve todas las ventas ya proyectadas al DTO de respuesta."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_ventas_page(
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[tuple[datetime, int]] = None,
+    ) -> tuple[List[VentaResponse], Optional[tuple[datetime, int]]]:
+        """Devuelve una pagina de ventas y la posicion (fecha, venta_id) de la siguiente."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_ventas_export(
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        """Recorre ventas y detalles aplanados con un cursor del servidor."""
         raise NotImplementedError
 
     @abstractmethod
@@ -82,3 +117,17 @@ class VentaRepositoryInterface(ABC):
     def delete_venta(self, venta_id: int) -> bool:
         """Elimina fisicamente una venta por ID."""
         raise NotImplementedError
+
+
+class AsyncVentaRepositoryInterface(ABC):
+    """Contrato async para el registro de ventas en el camino caliente."""
+
+    @abstractmethod
+    async def create_venta(
+        self,
+        venta_entity: VentaEntity,
+        detalles: List[VentaDetalleEntity],
+        stock_deltas: Optional[dict[int, int]] = None,
+    ) -> VentaEntity:
+        """Persiste una venta y sus detalles."""
+        raise NotImplementedError
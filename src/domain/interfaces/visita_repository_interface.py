@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 from uuid import UUID
 
-from domain.entities.visitaEntity import VisitaEntity
+from src.domain.entities.visitaEntity import VisitaEntity
 
 
 class VisitaRepositoryInterface(ABC):
@@ -3,10 +3,10 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from domain.dtos.clienteDto import ClienteRequest, ClienteResponse, ClienteUpdateRequest
-from domain.entities.clienteEntity import ClienteEntity
-from domain.interfaces.cliente_repository_interface import ClienteRepositoryInterface
-from domain.interfaces.IClientService import IClientService
+from src.domain.dtos.clienteDto import ClienteRequest, ClienteResponse, ClienteUpdateRequest
+from src.domain.entities.clienteEntity import ClienteEntity
+from src.domain.interfaces.cliente_repository_interface import ClienteRepositoryInterface
+from src.domain.interfaces.IClientService import IClientService
 
 
 def _normalizar_nombre(nombre: str) -> str:
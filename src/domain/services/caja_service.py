@@ -2,9 +2,15 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.cajaDto import CajaCerrarRequest, CajaRequest, CajaResponse, CajaUpdateRequest
-from domain.entities.cajaEntity import CajaEntity
-from domain.interfaces.caja_repository_interface import CajaRepositoryInterface
+from src.domain.dtos.cajaDto import (
+    CajaBalanceResponse,
+    CajaCerrarRequest,
+    CajaRequest,
+    CajaResponse,
+    CajaUpdateRequest,
+)
+from src.domain.entities.cajaEntity import CajaEntity
+from src.domain.interfaces.caja_repository_interface import CajaRepositoryInterface
 
 
 class CajaService:
@@ -32,6 +38,12 @@ class CajaService:
             return None
         return CajaResponse.model_validate(caja)
 
+    def get_balance(self, caja_id: int) -> Optional[CajaBalanceResponse]:
+        balance = self.repository.get_balance(caja_id)
+        if not balance:
+            return None
+        return CajaBalanceResponse.model_validate(balance)
+
     def list_cajas(self) -> List[CajaResponse]:
         cajas = self.repository.list_cajas()
         return [CajaResponse.model_validate(c) for c in cajas]
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.cajaSesionDto import (
+from src.domain.dtos.cajaSesionDto import (
     CajaSesionRequest,
     CajaSesionResponse,
     CajaSesionUpdateRequest,
 )
-from domain.entities.cajaSesionEntity import CajaSesionEntity
-from domain.interfaces.caja_sesion_repository_interface import (
+from src.domain.entities.cajaSesionEntity import CajaSesionEntity
+from src.domain.interfaces.caja_sesion_repository_interface import (
     CajaSesionRepositoryInterface,
 )
 
@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.cajasCervezaDto import (
+from src.domain.dtos.cajasCervezaDto import (
     CajasCervezaRequest,
     CajasCervezaResponse,
     CajasCervezaUpdateRequest,
 )
-from domain.entities.cajasCervezaEntity import CajasCervezaEntity
-from domain.interfaces.cajas_cerveza_repository_interface import (
+from src.domain.entities.cajasCervezaEntity import CajasCervezaEntity
+from src.domain.interfaces.cajas_cerveza_repository_interface import (
     CajasCervezaRepositoryInterface,
 )
 
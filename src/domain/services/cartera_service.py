@@ -3,13 +3,13 @@ from __future__ import annotations
 from datetime import date
 from typing import List, Optional
 
-from domain.dtos.carteraDto import (
+from src.domain.dtos.carteraDto import (
     CarteraRequest,
     CarteraResponse,
     CarteraUpdateRequest,
 )
-from domain.entities.carteraEntity import CarteraEntity
-from domain.interfaces.cartera_repository_interface import CarteraRepositoryInterface
+from src.domain.entities.carteraEntity import CarteraEntity
+from src.domain.interfaces.cartera_repository_interface import CarteraRepositoryInterface
 
 
 class CarteraService:
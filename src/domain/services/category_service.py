@@ -2,16 +2,16 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.categoryDto import (
+from src.domain.dtos.categoryDto import (
     CategoryRequest,
     CategoryResponse,
     CategoryStatusRequest,
 )
-from domain.entities.categoryEntity import CategoryEntity
-from domain.interfaces.category_repository_interface import (
+from src.domain.entities.categoryEntity import CategoryEntity
+from src.domain.interfaces.category_repository_interface import (
     CategoryRepositoryInterface,
 )
-from domain.interfaces.ICategoryService import ICategoryService
+from src.domain.interfaces.ICategoryService import ICategoryService
 
 
 class CategoryService(ICategoryService):
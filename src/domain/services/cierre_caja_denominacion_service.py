@@ -3,13 +3,13 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import List, Optional
 
-from domain.dtos.cierreCajaDenominacionDto import (
+from src.domain.dtos.cierreCajaDenominacionDto import (
     CierreCajaDenominacionRequest,
     CierreCajaDenominacionResponse,
     CierreCajaDenominacionUpdateRequest,
 )
-from domain.entities.cierreCajaDenominacionEntity import CierreCajaDenominacionEntity
-from domain.interfaces.cierre_caja_denominacion_repository_interface import (
+from src.domain.entities.cierreCajaDenominacionEntity import CierreCajaDenominacionEntity
+from src.domain.interfaces.cierre_caja_denominacion_repository_interface import (
     CierreCajaDenominacionRepositoryInterface,
 )
 
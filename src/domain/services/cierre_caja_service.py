@@ -4,9 +4,9 @@ from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from domain.dtos.cierreCajaDto import CierreCajaRequest, CierreCajaResponse
-from domain.entities.cierreCajaEntity import CierreCajaEntity
-from domain.interfaces.cierre_caja_repository_interface import (
+from src.domain.dtos.cierreCajaDto import CierreCajaRequest, CierreCajaResponse
+from src.domain.entities.cierreCajaEntity import CierreCajaEntity
+from src.domain.interfaces.cierre_caja_repository_interface import (
     CierreCajaRepositoryInterface,
 )
 
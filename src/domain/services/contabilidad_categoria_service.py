@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.contabilidadCategoriaDto import (
+from src.domain.dtos.contabilidadCategoriaDto import (
     ContabilidadCategoriaRequest,
     ContabilidadCategoriaResponse,
     ContabilidadCategoriaUpdateRequest,
 )
-from domain.entities.contabilidadCategoriaEntity import ContabilidadCategoriaEntity
-from domain.interfaces.contabilidad_categoria_repository_interface import (
+from src.domain.entities.contabilidadCategoriaEntity import ContabilidadCategoriaEntity
+from src.domain.interfaces.contabilidad_categoria_repository_interface import (
     ContabilidadCategoriaRepositoryInterface,
 )
 
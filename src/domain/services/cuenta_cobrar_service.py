@@ -6,19 +6,19 @@ from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
 
-from domain.dtos.abonoCuentaDto import AbonoCuentaRequest, AbonoCuentaResponse
-from domain.dtos.cuentaCobrarDto import (
+from src.domain.dtos.abonoCuentaDto import AbonoCuentaRequest, AbonoCuentaResponse
+from src.domain.dtos.cuentaCobrarDto import (
     CuentaCobrarRequest,
     CuentaCobrarResponse,
     CuentaCobrarUpdateRequest,
 )
-from domain.entities.abonoCuentaEntity import AbonoCuentaEntity
-from domain.entities.cuentaCobrarEntity import CuentaCobrarEntity
-from domain.enums.contabilidadEnums import CreditoEstado
-from domain.interfaces.cuenta_cobrar_repository_interface import (
+from src.domain.entities.abonoCuentaEntity import AbonoCuentaEntity
+from src.domain.entities.cuentaCobrarEntity import CuentaCobrarEntity
+from src.domain.enums.contabilidadEnums import CreditoEstado
+from src.domain.interfaces.cuenta_cobrar_repository_interface import (
     CuentaCobrarRepositoryInterface,
 )
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class CuentaCobrarService:
@@ -3,9 +3,9 @@ from __future__ import annotations
 from datetime import date
 from typing import List, Optional
 
-from domain.dtos.egresoDto import EgresoRequest, EgresoResponse, EgresoUpdateRequest
-from domain.entities.egresoEntity import EgresoEntity
-from domain.interfaces.egreso_repository_interface import EgresoRepositoryInterface
+from src.domain.dtos.egresoDto import EgresoRequest, EgresoResponse, EgresoUpdateRequest
+from src.domain.entities.egresoEntity import EgresoEntity
+from src.domain.interfaces.egreso_repository_interface import EgresoRepositoryInterface
 
 
 class EgresoService:
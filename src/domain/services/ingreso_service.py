@@ -3,13 +3,13 @@ from __future__ import annotations
 from datetime import date
 from typing import List, Optional
 
-from domain.dtos.ingresoDto import (
+from src.domain.dtos.ingresoDto import (
     IngresoRequest,
     IngresoResponse,
     IngresoUpdateRequest,
 )
-from domain.entities.ingresoEntity import IngresoEntity
-from domain.interfaces.ingreso_repository_interface import IngresoRepositoryInterface
+from src.domain.entities.ingresoEntity import IngresoEntity
+from src.domain.interfaces.ingreso_repository_interface import IngresoRepositoryInterface
 
 
 class IngresoService:
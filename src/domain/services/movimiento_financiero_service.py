@@ -3,14 +3,14 @@ from __future__ import annotations
 from datetime import date
 from typing import List, Optional
 
-from domain.dtos.movimientoFinancieroDto import (
+from src.domain.dtos.movimientoFinancieroDto import (
     MovimientoFinancieroRequest,
     MovimientoFinancieroResponse,
     MovimientoFinancieroUpdateRequest,
 )
-from domain.entities.movimientoFinancieroEntity import MovimientoFinancieroEntity
-from domain.enums.contabilidadEnums import CategoriaTipo
-from domain.interfaces.movimiento_financiero_repository_interface import (
+from src.domain.entities.movimientoFinancieroEntity import MovimientoFinancieroEntity
+from src.domain.enums.contabilidadEnums import CategoriaTipo
+from src.domain.interfaces.movimiento_financiero_repository_interface import (
     MovimientoFinancieroRepositoryInterface,
 )
 
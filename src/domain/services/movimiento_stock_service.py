@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Optional
+
+from src.domain.dtos.stockDto import (
+    AjusteStockRequest,
+    AjusteStockResponse,
+    MovimientoStockHistorialResponse,
+)
+from src.domain.interfaces.movimiento_stock_repository_interface import (
+    MovimientoStockRepositoryInterface,
+)
+from src.utils.timezone import now_utc_minus_5
+
+HISTORIAL_DIAS_DEFAULT = 30
+
+
+class MovimientoStockService:
+    """Caso de uso para ajustes y auditoria de movimientos de stock."""
+
+    def __init__(self, repository: MovimientoStockRepositoryInterface):
+        self.repository = repository
+
+    def registrar_ajuste(self, data: AjusteStockRequest) -> AjusteStockResponse:
+        cantidad = self.repository.registrar_ajuste(
+            data.producto_id,
+            data.delta,
+            nota=data.nota,
+            referencia_doc=data.referencia_doc,
+            realizado_por_id=data.realizado_por_id,
+        )
+        return AjusteStockResponse(producto_id=data.producto_id, cantidad_actual=cantidad)
+
+    def historial(
+        self,
+        producto_id: int,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        limit: int = 500,
+    ) -> MovimientoStockHistorialResponse:
+        hasta = hasta or now_utc_minus_5().date()
+        desde = desde or hasta - timedelta(days=HISTORIAL_DIAS_DEFAULT)
+        if desde > hasta:
+            raise ValueError("desde no puede ser mayor que hasta")
+        return self.repository.historial(
+            producto_id, desde=desde, hasta=hasta, limit=limit
+        )
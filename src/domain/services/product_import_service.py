@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Any, Callable, Iterable, Literal, Optional
+
+from pydantic import ValidationError
+
+from src.domain.dtos.productsDto import (
+    ProductImportError,
+    ProductImportJobResponse,
+    ProductImportResponse,
+    ProductRequest,
+)
+from src.domain.services.product_service import ProductService
+from src.utils.timezone import now_utc_minus_5
+
+IMPORT_CHUNK_SIZE = 2000
+MAX_IMPORT_PRICE = Decimal("99999999.99")
+NUMERIC_FIELDS = ("precio_venta", "costo", "margen", "iva")
+
+logger = logging.getLogger("productos.import")
+
+JOB_RETENTION = timedelta(hours=1)
+
+ImportMode = Literal["create", "upsert"]
+ProgressCallback = Callable[[ProductImportResponse], None]
+ImportRunner = Callable[[ProgressCallback], ProductImportResponse]
+
+
+def _numeric_error(row_index: int, field_name: str, msg: str, value: Any) -> ProductImportError:
+    return ProductImportError(
+        row=row_index,
+        message=str(
+            [
+                {
+                    "type": "value_error",
+                    "loc": (field_name,),
+                    "msg": msg,
+                    "input": value,
+                }
+            ]
+        ),
+    )
+
+
+class ProductImportService:
+    """Importa un catalogo fila a fila, validando y escribiendo por bloques."""
+
+    def __init__(self, product_service: ProductService):
+        self.product_service = product_service
+
+    def import_rows(
+        self,
+        rows: Iterable[tuple[Any, ...]],
+        *,
+        mode: ImportMode = "create",
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> ProductImportResponse:
+        """
+        ``rows`` incluye la fila de encabezados. Cada bloque de ``chunk_size``
+        filas validas se escribe (y confirma) antes de seguir leyendo;
+        ``progress`` recibe el acumulado despues de cada bloque. Con
+        ``mode="upsert"`` los codigos existentes actualizan precios y estado.
+        """
+        rows = iter(rows)
+        header_map = self._header_map(next(rows, None))
+        result = ProductImportResponse(created=0, importados=0, skipped=0, invalid=0)
+        chunk: list[ProductRequest] = []
+        for row_index, row in enumerate(rows, start=2):
+            if all(value is None or value == "" for value in row):
+                continue
+            result.processed += 1
+            item = self._parse_row(row_index, row, header_map, result)
+            if item is not None:
+                chunk.append(item)
+            if len(chunk) >= chunk_size:
+                self._write_chunk(chunk, mode, result, progress)
+                chunk = []
+        self._write_chunk(chunk, mode, result, progress)
+        return result
+
+    def _write_chunk(
+        self,
+        chunk: list[ProductRequest],
+        mode: ImportMode,
+        result: ProductImportResponse,
+        progress: Optional[ProgressCallback],
+    ) -> None:
+        if chunk and mode == "upsert":
+            created, updated, unchanged = self.product_service.upsert_products(chunk)
+            result.created += created
+            result.importados += created
+            result.updated += updated
+            result.unchanged += unchanged
+            # Codigos repetidos dentro del bloque: solo cuenta la ultima fila.
+            result.skipped += len(chunk) - created - updated - unchanged
+        elif chunk:
+            created, skipped = self.product_service.import_products(chunk)
+            result.created += created
+            result.importados += created
+            result.skipped += skipped
+        logger.info(
+            "Importacion de productos: %s filas, %s creados, %s actualizados, "
+            "%s sin cambios, %s omitidos, %s invalidos",
+            result.processed,
+            result.created,
+            result.updated,
+            result.unchanged,
+            result.skipped,
+            result.invalid,
+        )
+        if progress:
+            progress(result)
+
+    def _header_map(self, header_row: Optional[tuple[Any, ...]]) -> dict[int, str]:
+        if not header_row:
+            raise ValueError("El archivo no tiene encabezados")
+        field_map = {name.lower(): name for name in ProductRequest.model_fields}
+        headers = [str(h).strip() if h is not None else "" for h in header_row]
+        header_map = {
+            idx: field_map[h.lower()] for idx, h in enumerate(headers) if h.lower() in field_map
+        }
+        required_fields = [
+            name for name, field in ProductRequest.model_fields.items() if field.is_required()
+        ]
+        missing = [name for name in required_fields if name not in header_map.values()]
+        if missing:
+            raise ValueError(f"Faltan columnas requeridas: {', '.join(missing)}")
+        return header_map
+
+    def _parse_row(
+        self,
+        row_index: int,
+        row: tuple[Any, ...],
+        header_map: dict[int, str],
+        result: ProductImportResponse,
+    ) -> Optional[ProductRequest]:
+        payload = {}
+        for idx, value in enumerate(row):
+            field_name = header_map.get(idx)
+            if not field_name:
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+                if value == "":
+                    value = None
+            payload[field_name] = value
+
+        error = self._normalize_numeric(row_index, payload)
+        if error is None:
+            try:
+                return ProductRequest(**payload)
+            except ValidationError as exc:
+                error = ProductImportError(row=row_index, message=str(exc.errors()))
+        result.invalid += 1
+        result.errors.append(error)
+        return None
+
+    def _normalize_numeric(
+        self, row_index: int, payload: dict[str, Any]
+    ) -> Optional[ProductImportError]:
+        for field_name in NUMERIC_FIELDS:
+            raw_value = payload.get(field_name)
+            if raw_value is None:
+                continue
+            try:
+                value = Decimal(str(raw_value))
+            except (InvalidOperation, ValueError):
+                return _numeric_error(row_index, field_name, "El precio debe ser un numero valido", raw_value)
+            if value.is_nan() or value.is_infinite():
+                return _numeric_error(row_index, field_name, "El precio debe ser un numero valido", raw_value)
+            try:
+                value = value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            except (InvalidOperation, ValueError):
+                return _numeric_error(row_index, field_name, "El precio debe tener un formato valido", raw_value)
+            if value < 0:
+                return _numeric_error(row_index, field_name, "El precio no puede ser negativo", raw_value)
+            if value > MAX_IMPORT_PRICE:
+                return _numeric_error(row_index, field_name, "El precio excede el maximo permitido", raw_value)
+        return None
+
+
+class ProductImportJobs:
+    """
+    Importaciones en segundo plano dentro del proceso.
+
+    Un solo hilo de trabajo procesa los archivos en orden, de modo que el
+    worker de uvicorn queda libre para las ventas. El estado vive en memoria:
+    se consulta en el mismo proceso y los trabajos terminados se descartan
+    despues de ``JOB_RETENTION``.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="product-import"
+        )
+        self._jobs: dict[str, ProductImportJobResponse] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, run: ImportRunner) -> ProductImportJobResponse:
+        job = ProductImportJobResponse(
+            job_id=uuid.uuid4().hex,
+            estado="pendiente",
+            fecha_creacion=now_utc_minus_5(),
+        )
+        with self._lock:
+            self._purge()
+            self._jobs[job.job_id] = job
+        self._executor.submit(self._run, job.job_id, run)
+        return job.model_copy()
+
+    def get(self, job_id: str) -> Optional[ProductImportJobResponse]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.model_copy() if job else None
+
+    def _run(self, job_id: str, run: ImportRunner) -> None:
+        self._update(job_id, estado="procesando")
+        try:
+            result = run(lambda progress: self._progress(job_id, progress))
+        except Exception as exc:
+            logger.exception("Importacion de productos %s fallida", job_id)
+            self._update(job_id, estado="fallido", error=str(exc), fecha_fin=now_utc_minus_5())
+            return
+        self._progress(job_id, result)
+        self._update(job_id, estado="completado", fecha_fin=now_utc_minus_5())
+
+    def _progress(self, job_id: str, result: ProductImportResponse) -> None:
+        self._update(
+            job_id,
+            processed=result.processed,
+            created=result.created,
+            skipped=result.skipped,
+            invalid=result.invalid,
+            updated=result.updated,
+            unchanged=result.unchanged,
+            errors=list(result.errors),
+        )
+
+    def _update(self, job_id: str, **values: Any) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job:
+                self._jobs[job_id] = job.model_copy(update=values)
+
+    def _purge(self) -> None:
+        limite = now_utc_minus_5() - JOB_RETENTION
+        for job_id, job in list(self._jobs.items()):
+            if job.fecha_fin is not None and job.fecha_fin < limite:
+                del self._jobs[job_id]
+
+
+import_jobs = ProductImportJobs()
@@ -1,22 +1,110 @@
 from __future__ import annotations
-from typing import List, Optional
 
-from domain.dtos.productsDto import (
+import os
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+from src.domain.dtos.productsDto import (
     ProductRequest,
     ProductResponse,
     ProductStatusUpdate,
 )
-from domain.entities.productsEntity import ProductEntity
-from domain.interfaces.product_repository_interface import (
+from src.domain.entities.productsEntity import ProductEntity
+from src.domain.interfaces.product_repository_interface import (
+    AsyncProductRepositoryInterface,
     ProductRepositoryInterface,
 )
 
 
+class ProductBarcodeIndex:
+    """
+    Indice en memoria codigo_barras -> ProductResponse para el escaner.
+
+    Se carga completo al iniciar y las escrituras de ProductService lo
+    mantienen al dia. Cada proceso tiene su copia: un fallo de busqueda se
+    consulta en la base y el indice se recarga tras ``ttl_seconds`` para
+    recoger cambios hechos por otros workers. La recarga la hace un solo
+    hilo; los demas siguen leyendo el mapa anterior mientras tanto.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self._por_codigo: dict[str, ProductResponse] = {}
+        self._codigo_por_id: dict[int, str] = {}
+        self._cargado_en: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        return (
+            self._cargado_en is None
+            or time.monotonic() - self._cargado_en > self.ttl_seconds
+        )
+
+    def load(self, productos: Iterable[ProductResponse]) -> None:
+        por_codigo: dict[str, ProductResponse] = {}
+        codigo_por_id: dict[int, str] = {}
+        for producto in productos:
+            if producto.codigo_barras:
+                por_codigo[producto.codigo_barras] = producto
+                codigo_por_id[producto.producto_id] = producto.codigo_barras
+        with self._lock:
+            self._por_codigo = por_codigo
+            self._codigo_por_id = codigo_por_id
+            self._cargado_en = time.monotonic()
+
+    def refresh_if_stale(self, loader: Callable[[], Iterable[ProductResponse]]) -> bool:
+        """Recarga si vencio y ningun otro hilo lo esta haciendo; nunca espera."""
+        if not self.is_stale() or not self._refresh_lock.acquire(blocking=False):
+            return False
+        try:
+            if not self.is_stale():
+                return False
+            self.load(loader())
+            return True
+        finally:
+            self._refresh_lock.release()
+
+    def get(self, codigo: str) -> Optional[ProductResponse]:
+        return self._por_codigo.get(codigo)
+
+    def put(self, producto: ProductResponse) -> None:
+        with self._lock:
+            self._discard(producto.producto_id)
+            if producto.codigo_barras:
+                self._por_codigo[producto.codigo_barras] = producto
+                self._codigo_por_id[producto.producto_id] = producto.codigo_barras
+
+    def remove(self, producto_id: int) -> None:
+        with self._lock:
+            self._discard(producto_id)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._cargado_en = None
+
+    def _discard(self, producto_id: int) -> None:
+        codigo = self._codigo_por_id.pop(producto_id, None)
+        if codigo is not None:
+            self._por_codigo.pop(codigo, None)
+
+
+barcode_index = ProductBarcodeIndex(
+    ttl_seconds=float(os.getenv("PRODUCT_BARCODE_INDEX_TTL", "300"))
+)
+
+
 class ProductService:
     """Caso de uso para operaciones de productos."""
 
-    def __init__(self, repository: ProductRepositoryInterface):
+    def __init__(
+        self,
+        repository: ProductRepositoryInterface,
+        index: ProductBarcodeIndex = barcode_index,
+    ):
         self.repository = repository
+        self.index = index
 
     def create_product(self, data: ProductRequest) -> ProductResponse:
         """Crea un producto usando el repositorio."""
@@ -36,11 +124,12 @@ class ProductService:
             estado=data.estado,
         )
         created = self.repository.create_product(entity)
-        return ProductResponse.model_validate(created)
+        response = ProductResponse.model_validate(created)
+        self.index.put(response)
+        return response
 
     def list_products(self) -> List[ProductResponse]:
-        productos = self.repository.list_products()
-        return [ProductResponse.model_validate(prod) for prod in productos]
+        return self.repository.list_products()
 
     def get_product(self, product_id: int) -> Optional[ProductResponse]:
         producto = self.repository.get_product(product_id)
@@ -48,8 +137,24 @@ class ProductService:
             return None
         return ProductResponse.model_validate(producto)
 
-    def search_products(self, term: str) -> List[ProductResponse]:
-        productos = self.repository.search_products(term)
+    def warm_barcode_index(self) -> None:
+        self.index.load(self.repository.list_products())
+
+    def get_product_by_barcode(self, codigo: str) -> Optional[ProductResponse]:
+        """Resuelve un escaneo desde el indice en memoria; la base solo ante un fallo."""
+        self.index.refresh_if_stale(self.repository.list_products)
+        producto = self.index.get(codigo)
+        if producto:
+            return producto
+        entity = self.repository.get_product_by_barcode(codigo)
+        if not entity:
+            return None
+        producto = ProductResponse.model_validate(entity)
+        self.index.put(producto)
+        return producto
+
+    def search_products(self, term: str, limit: int = 50) -> List[ProductResponse]:
+        productos = self.repository.search_products(term, limit=limit)
         return [ProductResponse.model_validate(prod) for prod in productos]
 
     def update_product(
@@ -73,7 +178,9 @@ class ProductService:
         updated = self.repository.update_product(product_id, entity)
         if not updated:
             return None
-        return ProductResponse.model_validate(updated)
+        response = ProductResponse.model_validate(updated)
+        self.index.put(response)
+        return response
 
     def update_product_status(
         self, product_id: int, data: ProductStatusUpdate
@@ -86,13 +193,32 @@ class ProductService:
         )
         if not updated:
             return None
-        return ProductResponse.model_validate(updated)
+        response = ProductResponse.model_validate(updated)
+        self.index.put(response)
+        return response
 
     def delete_product(self, product_id: int) -> bool:
-        return self.repository.delete_product(product_id)
+        deleted = self.repository.delete_product(product_id)
+        if deleted:
+            self.index.remove(product_id)
+        return deleted
 
     def import_products(self, items: List[ProductRequest]) -> tuple[int, int]:
-        entities = [
+        created, skipped = self.repository.import_products(self._import_entities(items))
+        if created:
+            self.index.invalidate()
+        return created, skipped
+
+    def upsert_products(self, items: List[ProductRequest]) -> tuple[int, int, int]:
+        created, updated, unchanged = self.repository.upsert_products(
+            self._import_entities(items)
+        )
+        if created or updated:
+            self.index.invalidate()
+        return created, updated, unchanged
+
+    def _import_entities(self, items: List[ProductRequest]) -> List[ProductEntity]:
+        return [
             ProductEntity(
                 codigo_barras=item.codigo_barras,
                 nombre=item.nombre,
@@ -110,4 +236,20 @@ class ProductService:
             )
             for item in items
         ]
-        return self.repository.import_products(entities)
+
+
+class AsyncProductService:
+    """Lecturas de productos del camino caliente sobre un repositorio async."""
+
+    def __init__(self, repository: AsyncProductRepositoryInterface):
+        self.repository = repository
+
+    async def get_product(self, product_id: int) -> Optional[ProductResponse]:
+        producto = await self.repository.get_product(product_id)
+        if not producto:
+            return None
+        return ProductResponse.model_validate(producto)
+
+    async def search_products(self, term: str, limit: int = 50) -> List[ProductResponse]:
+        productos = await self.repository.search_products(term, limit=limit)
+        return [ProductResponse.model_validate(prod) for prod in productos]
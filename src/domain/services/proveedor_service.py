@@ -2,13 +2,13 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.proveedorDto import (
+from src.domain.dtos.proveedorDto import (
     ProveedorRequest,
     ProveedorResponse,
     ProveedorUpdateRequest,
 )
-from domain.entities.proveedorEntity import ProveedorEntity
-from domain.interfaces.proveedor_repository_interface import ProveedorRepositoryInterface
+from src.domain.entities.proveedorEntity import ProveedorEntity
+from src.domain.interfaces.proveedor_repository_interface import ProveedorRepositoryInterface
 
 
 def _normalizar_nombre(nombre: str) -> str:
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Optional
+
+from src.domain.dtos.reporteDto import AgrupacionRotacion, RotacionProductosResponse
+from src.domain.interfaces.reporte_repository_interface import ReporteRepositoryInterface
+from src.utils.timezone import now_utc_minus_5
+
+ROTACION_DIAS_DEFAULT = 30
+ROTACION_DIAS_MAX = 366
+
+
+class ReporteService:
+    """Caso de uso para reportes de ventas agregados en la base."""
+
+    def __init__(self, repository: ReporteRepositoryInterface):
+        self.repository = repository
+
+    def rotacion_productos(
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        top: int = 20,
+        agrupacion: AgrupacionRotacion = "dia",
+    ) -> RotacionProductosResponse:
+        hasta = hasta or now_utc_minus_5().date()
+        desde = desde or hasta - timedelta(days=ROTACION_DIAS_DEFAULT - 1)
+        if desde > hasta:
+            raise ValueError("desde no puede ser mayor que hasta")
+        if (hasta - desde).days >= ROTACION_DIAS_MAX:
+            raise ValueError(f"El rango no puede superar {ROTACION_DIAS_MAX} dias")
+        return self.repository.rotacion_productos(
+            desde=desde, hasta=hasta, top=top, agrupacion=agrupacion
+        )
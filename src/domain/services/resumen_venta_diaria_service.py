@@ -4,12 +4,12 @@ from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
-from domain.dtos.resumenVentaDiariaDto import (
+from src.domain.dtos.resumenVentaDiariaDto import (
     ResumenVentaDiariaRequest,
     ResumenVentaDiariaResponse,
 )
-from domain.entities.resumenVentaDiariaEntity import ResumenVentaDiariaEntity
-from domain.interfaces.resumen_venta_diaria_repository_interface import (
+from src.domain.entities.resumenVentaDiariaEntity import ResumenVentaDiariaEntity
+from src.domain.interfaces.resumen_venta_diaria_repository_interface import (
     ResumenVentaDiariaRepositoryInterface,
 )
 
@@ -25,6 +25,7 @@ class ResumenVentaDiariaService:
             total_efectivo=data.total_efectivo,
             total_tarjeta=data.total_tarjeta,
             total_transferencia=data.total_transferencia,
+            total_credito=data.total_credito,
             cantidad_transacciones=data.cantidad_transacciones,
             generado_por_whatsapp_user_id=data.generado_por_whatsapp_user_id,
         )
@@ -49,3 +50,8 @@ class ResumenVentaDiariaService:
         resumenes = self.repository.list_resumenes(desde=desde, hasta=hasta)
         return [ResumenVentaDiariaResponse.model_validate(r) for r in resumenes]
 
+    def recalcular(self, *, desde: date, hasta: date) -> List[ResumenVentaDiariaResponse]:
+        if hasta < desde:
+            raise ValueError("hasta no puede ser anterior a desde")
+        resumenes = self.repository.refresh_rango(desde, hasta)
+        return [ResumenVentaDiariaResponse.model_validate(r) for r in resumenes]
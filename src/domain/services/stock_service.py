@@ -2,10 +2,15 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.stockDto import StockRequest, StockResponse
-from domain.entities.stockEntity import StockEntity
-from domain.interfaces.IStockService import IStockService
-from domain.interfaces.stock_repository_interface import StockRepositoryInterface
+from src.domain.dtos.stockDto import (
+    StockBajoMinimoPageResponse,
+    StockRequest,
+    StockResponse,
+)
+from src.domain.entities.stockEntity import StockEntity
+from src.domain.interfaces.IStockService import IStockService
+from src.domain.interfaces.stock_repository_interface import StockRepositoryInterface
+from src.utils.pagination import decode_key_cursor, encode_key_cursor
 
 
 class StockService(IStockService):
@@ -39,3 +44,23 @@ class StockService(IStockService):
     def search_stock(self, term: str) -> List[StockResponse]:
         stocks = self.repository.search_stock(term)
         return [StockResponse.model_validate(stock) for stock in stocks]
+
+    def list_bajo_minimo(
+        self,
+        *,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        categoria_id: Optional[int] = None,
+        solo_activos: bool = True,
+    ) -> StockBajoMinimoPageResponse:
+        position = decode_key_cursor(cursor, 2) if cursor else None
+        items, next_position = self.repository.list_bajo_minimo(
+            limit=limit,
+            cursor=position,
+            categoria_id=categoria_id,
+            solo_activos=solo_activos,
+        )
+        return StockBajoMinimoPageResponse(
+            items=items,
+            next_cursor=encode_key_cursor(*next_position) if next_position else None,
+        )
@@ -2,15 +2,15 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from domain.dtos.userDto import (
+from src.domain.dtos.userDto import (
     UserRequest,
     UserResponse,
     UserStatusRequest,
     UserUpdateRequest,
 )
-from domain.entities.userEntity import UserEntity
-from domain.interfaces.IUserService import IUserService
-from domain.interfaces.user_repository_interface import UserRepositoryInterface
+from src.domain.entities.userEntity import UserEntity
+from src.domain.interfaces.IUserService import IUserService
+from src.domain.interfaces.user_repository_interface import UserRepositoryInterface
 
 
 class UserService(IUserService):
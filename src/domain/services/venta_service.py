@@ -1,32 +1,53 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
 from datetime import datetime
 from decimal import Decimal
 from datetime import date
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional
+from uuid import UUID
 
-from domain.dtos.ventaDto import (
+from src.domain.dtos.ventaDto import (
+    VENTA_EXPORT_COLUMNS,
     VentaAnulacionRequest,
+    VentaBatchItemResult,
+    VentaBatchRequest,
+    VentaBatchResponse,
     VentaRequest,
     VentaResponse,
     VentaDetallesUpdateRequest,
+    VentaPageResponse,
     VentaResumenResponse,
     VentaStatusRequest,
     VentaUpdateRequest,
     VentaDetalleRequest,
 )
-from domain.entities.ventaDetalleEntity import VentaDetalleEntity
-from domain.entities.ventaEntity import VentaEntity
-from domain.interfaces.IVentaService import IVentaService
-from domain.interfaces.venta_repository_interface import VentaRepositoryInterface
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity
+from src.domain.entities.ventaEntity import VentaEntity
+from src.domain.interfaces.IVentaService import IVentaService
+from src.domain.interfaces.venta_repository_interface import (
+    AsyncVentaRepositoryInterface,
+    VentaRepositoryInterface,
+)
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
-class VentaService(IVentaService):
-    """Caso de uso para operaciones de ventas."""
+EXPORT_CHUNK_SIZE = 64 * 1024
 
-    def __init__(self, repository: VentaRepositoryInterface):
-        self.repository = repository
+
+def _export_value(value: Any) -> Any:
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    if isinstance(value, datetime):
+        return ensure_utc_minus_5(value).isoformat()
+    return value
+
+
+class _VentaBuilder:
+    """Armado y validacion de ventas, comun a VentaService y AsyncVentaService."""
 
     def _build_detalles(
         self, items: list[VentaDetalleEntity]
@@ -52,12 +73,19 @@ class VentaService(IVentaService):
         return subtotal, detalles
 
     def _validate_stock(self, detalles: list[VentaDetalleEntity]) -> None:
-        # Stock temporalmente aislado.
-        return
+        # La disponibilidad se valida de forma atomica al descontar el stock
+        # (MovimientoStockRepository.apply_deltas); aqui solo la entrada.
+        for detalle in detalles:
+            if detalle.cantidad <= 0:
+                raise ValueError(
+                    f"Cantidad invalida para producto {detalle.producto_id}"
+                )
 
-    def _validate_stock_deltas(self, deltas: dict[int, int]) -> None:
-        # Stock temporalmente aislado.
-        return
+    def _stock_deltas_venta(self, detalles: list[VentaDetalleEntity]) -> dict[int, int]:
+        deltas: dict[int, int] = {}
+        for detalle in detalles:
+            deltas[detalle.producto_id] = deltas.get(detalle.producto_id, 0) - detalle.cantidad
+        return deltas
 
     def _recalcular_impuesto_descuento(
         self,
@@ -77,7 +105,9 @@ class VentaService(IVentaService):
         descuento_nuevo = subtotal_nuevo * descuento_rate
         return impuesto_nuevo, descuento_nuevo
 
-    def create_venta(self, data: VentaRequest) -> VentaResponse:
+    def _build_venta(
+        self, data: VentaRequest
+    ) -> tuple[VentaEntity, list[VentaDetalleEntity]]:
         es_credito = data.es_credito
         if data.tipo_pago is None:
             es_credito = True
@@ -101,7 +131,6 @@ class VentaService(IVentaService):
             ]
         )
         self._validate_stock(detalles)
-        stock_deltas = None
 
         impuesto = Decimal(data.impuesto)
         descuento = Decimal(data.descuento)
@@ -121,13 +150,102 @@ class VentaService(IVentaService):
             numero_factura=data.numero_factura,
             cliente_id=data.cliente_id,
             user_id=data.user_id,
+            idempotency_key=data.idempotency_key,
         )
+        return venta_entity, detalles
+
+
+class VentaService(_VentaBuilder, IVentaService):
+    """Caso de uso para operaciones de ventas."""
+
+    def __init__(self, repository: VentaRepositoryInterface):
+        self.repository = repository
+
+    def create_venta(self, data: VentaRequest) -> VentaResponse:
+        venta_entity, detalles = self._build_venta(data)
+        stock_deltas = self._stock_deltas_venta(detalles)
         created = self.repository.create_venta(venta_entity, detalles, stock_deltas)
         return VentaResponse.model_validate(created)
 
+    def create_ventas_batch(self, data: VentaBatchRequest) -> VentaBatchResponse:
+        """Registra ventas hechas sin conexion; los errores se reportan por item."""
+        resultados: list[VentaBatchItemResult] = []
+        pendientes = []
+        for index, item in enumerate(data.ventas):
+            try:
+                venta_entity, detalles = self._build_venta(item)
+            except ValueError as exc:
+                resultados.append(
+                    VentaBatchItemResult(
+                        index=index,
+                        idempotency_key=item.idempotency_key,
+                        estado="error",
+                        error=str(exc),
+                    )
+                )
+                continue
+            pendientes.append((index, venta_entity, detalles))
+        resultados.extend(self.repository.create_ventas_batch(pendientes))
+        resultados.sort(key=lambda resultado: resultado.index)
+        return VentaBatchResponse(
+            creadas=sum(1 for r in resultados if r.estado == "creada"),
+            duplicadas=sum(1 for r in resultados if r.estado == "duplicada"),
+            errores=sum(1 for r in resultados if r.estado == "error"),
+            resultados=resultados,
+        )
+
     def list_ventas(self) -> List[VentaResponse]:
-        ventas = self.repository.list_ventas()
-        return [VentaResponse.model_validate(venta) for venta in ventas]
+        return self.repository.list_ventas()
+
+    def list_ventas_page(
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> VentaPageResponse:
+        position = decode_cursor(cursor) if cursor else None
+        ventas, next_position = self.repository.list_ventas_page(
+            desde=desde,
+            hasta=hasta,
+            limit=limit,
+            cursor=position,
+        )
+        return VentaPageResponse.model_construct(
+            items=ventas,
+            next_cursor=encode_cursor(*next_position) if next_position else None,
+        )
+
+    def export_ventas(
+        self,
+        *,
+        formato: str = "ndjson",
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+    ) -> Iterator[str]:
+        """Genera la exportacion en bloques de texto NDJSON o CSV."""
+        if formato not in {"ndjson", "csv"}:
+            raise ValueError("formato debe ser ndjson o csv")
+        rows = self.repository.iter_ventas_export(desde=desde, hasta=hasta)
+        buffer = io.StringIO()
+        writer = None
+        if formato == "csv":
+            writer = csv.DictWriter(buffer, fieldnames=VENTA_EXPORT_COLUMNS)
+            writer.writeheader()
+        for row in rows:
+            values = {column: _export_value(row.get(column)) for column in VENTA_EXPORT_COLUMNS}
+            if writer is not None:
+                writer.writerow(values)
+            else:
+                buffer.write(json.dumps(values, ensure_ascii=False))
+                buffer.write("\n")
+            if buffer.tell() >= EXPORT_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        if buffer.tell():
+            yield buffer.getvalue()
 
     def list_ventas_resumen(
         self, *, desde: Optional[date] = None, hasta: Optional[date] = None
@@ -166,7 +284,6 @@ class VentaService(IVentaService):
             stock_deltas[detalle.producto_id] = (
                 stock_deltas.get(detalle.producto_id, 0) + detalle.cantidad
             )
-        self._validate_stock_deltas(stock_deltas)
 
         updated = self.repository.anular_venta(
             venta_id,
@@ -213,7 +330,6 @@ class VentaService(IVentaService):
             stock_deltas = {}
             for producto_id in set(old_qtys) | set(new_qtys):
                 stock_deltas[producto_id] = old_qtys.get(producto_id, 0) - new_qtys.get(producto_id, 0)
-            self._validate_stock_deltas(stock_deltas)
         else:
             subtotal = current.subtotal
 
@@ -326,3 +442,16 @@ class VentaService(IVentaService):
 
     def delete_venta(self, venta_id: int) -> bool:
         return self.repository.delete_venta(venta_id)
+
+
+class AsyncVentaService(_VentaBuilder):
+    """Registro de ventas del camino caliente sobre un repositorio async."""
+
+    def __init__(self, repository: AsyncVentaRepositoryInterface):
+        self.repository = repository
+
+    async def create_venta(self, data: VentaRequest) -> VentaResponse:
+        venta_entity, detalles = self._build_venta(data)
+        stock_deltas = self._stock_deltas_venta(detalles)
+        created = await self.repository.create_venta(venta_entity, detalles, stock_deltas)
+        return VentaResponse.model_validate(created)
@@ -3,13 +3,13 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from domain.dtos.visitaDto import (
+from src.domain.dtos.visitaDto import (
     VisitaRequest,
     VisitaResponse,
     VisitaUpdateRequest,
 )
-from domain.entities.visitaEntity import VisitaEntity
-from domain.interfaces.visita_repository_interface import VisitaRepositoryInterface
+from src.domain.entities.visitaEntity import VisitaEntity
+from src.domain.interfaces.visita_repository_interface import VisitaRepositoryInterface
 
 
 class VisitaService:
@@ -1,49 +1,307 @@
+from __future__ import annotations
+
+import bisect
+import logging
 import os
-from pathlib import Path
-from typing import Generator
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from contextlib import contextmanager
+from sqlalchemy import create_engine, event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
-# importa Base desde tu módulo de modelos
-from .models.models import Base
-# <-- cambiado: importar configuración centralizada
-from ..config import DATABASE_URL, DB_ECHO
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine
 
-# Opciones de conexión para sqlite vs otras bases
-connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+logger = logging.getLogger("db.pool")
 
-engine = create_engine(DATABASE_URL, echo=DB_ECHO, future=True, connect_args=connect_args)
+# Limites (ms) de los histogramas de espera y de checkout.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
 
-# Session factory (sin autocommit, sin autoflush por defecto)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 
-def init_db() -> None:
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    return int(raw) if raw not in (None, "") else default
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """
+    Tamano del pool por proceso. Por defecto ``pool_size + max_overflow``
+    iguala los 40 hilos con los que FastAPI corre los endpoints sync, para
+    que un hilo no quede esperando conexion mientras la base tiene cupo.
+    """
+
+    pool_size: int = 10
+    max_overflow: int = 30
+    pool_timeout: int = 30
+    # Por debajo del cierre de conexiones inactivas de RDS/proxies.
+    pool_recycle: int = 1800
+    # Solo se verifica la conexion si estuvo inactiva mas de esto (segundos).
+    ping_idle_seconds: int = 300
+    echo: bool = False
+
+    @classmethod
+    def from_env(
+        cls, prefix: str = "DB_", defaults: Optional["PoolSettings"] = None
+    ) -> "PoolSettings":
+        """Lee ``<prefix>POOL_SIZE``, ``<prefix>MAX_OVERFLOW``, etc."""
+        defaults = defaults or cls()
+        return cls(
+            pool_size=_env_int(f"{prefix}POOL_SIZE", defaults.pool_size),
+            max_overflow=_env_int(f"{prefix}MAX_OVERFLOW", defaults.max_overflow),
+            pool_timeout=_env_int(f"{prefix}POOL_TIMEOUT", defaults.pool_timeout),
+            pool_recycle=_env_int(f"{prefix}POOL_RECYCLE", defaults.pool_recycle),
+            ping_idle_seconds=_env_int(f"{prefix}POOL_PING_IDLE", defaults.ping_idle_seconds),
+            echo=os.getenv(f"{prefix}ECHO", "").strip().lower() in {"1", "true", "yes", "on"},
+        )
+
+
+class LatencyHistogram:
+    def __init__(self, buckets_ms: tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.counts = [0] * (len(buckets_ms) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets_ms, ms)] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        acumulado = 0
+        buckets = {}
+        for limite, cantidad in zip((*self.buckets_ms, "+Inf"), self.counts):
+            acumulado += cantidad
+            buckets[str(limite)] = acumulado
+        return {
+            "count": self.total,
+            "sum_ms": round(self.sum_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+            "buckets_ms": buckets,
+        }
+
+
+class PoolMetrics:
+    """Contadores del pool compartido; los actualizan los eventos del engine."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.wait = LatencyHistogram()
+        self.checkout = LatencyHistogram()
+        self.timeouts = 0
+        self.pings = 0
+        self.disconnects = 0
+        self.invalidations = 0
+
+    def observe_wait(self, ms: float) -> None:
+        with self._lock:
+            self.wait.observe(ms)
+
+    def observe_checkout(self, ms: float) -> None:
+        with self._lock:
+            self.checkout.observe(ms)
+
+    def incr(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "wait": self.wait.snapshot(),
+                "checkout": self.checkout.snapshot(),
+                "timeouts": self.timeouts,
+                "pings": self.pings,
+                "disconnects": self.disconnects,
+                "invalidations": self.invalidations,
+            }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool que mide cuanto espera cada checkout por una conexion libre."""
+
+    metrics: Optional[PoolMetrics] = None
+    settings: Optional[PoolSettings] = None
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.incr("timeouts")
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_wait((time.perf_counter() - inicio) * 1000)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        pool.settings = self.settings
+        return pool
+
+
+class InstrumentedAsyncQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """La misma medicion sobre la cola del pool asyncio."""
+
+
+def create_db_engine(url: str, settings: Optional[PoolSettings] = None) -> Engine:
+    """
+    Unica fabrica de engines de la app. En lugar de ``pool_pre_ping`` (un
+    viaje extra por cada checkout) las conexiones se reciclan antes del
+    timeout del servidor y solo se verifican las que estuvieron inactivas
+    mas de ``ping_idle_seconds``; si esa verificacion falla el pool descarta
+    la conexion y reintenta con una nueva (``DisconnectionError``).
+    """
+    settings = settings or PoolSettings.from_env()
+    if url.startswith("sqlite"):
+        return create_engine(
+            url, echo=settings.echo, connect_args={"check_same_thread": False}
+        )
+
+    engine = create_engine(
+        url,
+        echo=settings.echo,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=False,
+    )
+    metrics = PoolMetrics()
+    engine.pool.metrics = metrics
+    engine.pool.settings = settings
+    _instrument(engine, settings, metrics)
+    return engine
+
+
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """
+    La misma base con su driver asyncio. En PostgreSQL ``sslmode`` (libpq)
+    se pasa como ``ssl``, que es el nombre que entiende asyncpg.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or parsed.get_driver_name() == driver:
+        return url
+    parsed = parsed.set(drivername=f"{backend}+{driver}")
+    sslmode = parsed.query.get("sslmode")
+    if backend == "postgresql" and sslmode:
+        parsed = parsed.difference_update_query(["sslmode"]).update_query_dict(
+            {"ssl": sslmode}
+        )
+    return parsed.render_as_string(hide_password=False)
+
+
+# Las corrutinas comparten el event loop y liberan la conexion al terminar
+# la consulta: pocas conexiones atienden muchas peticiones concurrentes.
+ASYNC_POOL_DEFAULTS = PoolSettings(pool_size=5, max_overflow=5)
+
+
+def create_async_db_engine(url: str, settings: Optional[PoolSettings] = None) -> "AsyncEngine":
     """
-    Crea las tablas declaradas en Base.metadata. Llamar al iniciar la aplicación.
+    Engine asyncio para las rutas del camino caliente. Tiene su propio pool
+    (``DB_ASYNC_*``, por defecto 5 + 5), con la misma politica de reciclado,
+    ping y metricas que el engine sync.
+
+    Presupuesto de conexiones: cada proceso abre hasta
+    ``DB_POOL_SIZE + DB_MAX_OVERFLOW + DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW``
+    (40 + 10 = 50 por defecto). Multiplicado por los workers debe quedar por
+    debajo de ``max_connections`` de Postgres (o del limite del proxy).
     """
-    Base.metadata.create_all(bind=engine)
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    settings = settings or PoolSettings.from_env("DB_ASYNC_", ASYNC_POOL_DEFAULTS)
+    url = async_database_url(url)
+    if url.startswith("sqlite"):
+        return create_async_engine(url, echo=settings.echo)
+
+    engine = create_async_engine(
+        url,
+        echo=settings.echo,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=False,
+    )
+    metrics = PoolMetrics()
+    engine.sync_engine.pool.metrics = metrics
+    engine.sync_engine.pool.settings = settings
+    _instrument(engine.sync_engine, settings, metrics)
+    return engine
+
+
+def _instrument(engine: Engine, settings: PoolSettings, metrics: PoolMetrics) -> None:
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        inicio = time.perf_counter()
+        ultimo_uso = connection_record.info.get("checkin_at")
+        if ultimo_uso is not None and time.monotonic() - ultimo_uso > settings.ping_idle_seconds:
+            metrics.incr("pings")
+            try:
+                cursor = dbapi_connection.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                finally:
+                    cursor.close()
+                # Sin autocommit el ping abre una transaccion; se cierra aqui.
+                dbapi_connection.rollback()
+            except Exception as error:
+                metrics.incr("disconnects")
+                logger.warning("Conexion inactiva descartada: %s", error)
+                # El pool invalida esta conexion y reintenta el checkout.
+                raise exc.DisconnectionError() from error
+        metrics.observe_checkout((time.perf_counter() - inicio) * 1000)
 
-@contextmanager
-def get_db() -> Generator[Session, None, None]:
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        connection_record.info["checkin_at"] = time.monotonic()
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    """Estado actual del pool y sus metricas acumuladas."""
+    pool = engine.pool
+    status: dict[str, Any] = {"pool": pool.__class__.__name__}
+    settings: Optional[PoolSettings] = getattr(pool, "settings", None)
+    if isinstance(pool, QueuePool) and settings is not None:
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=settings.max_overflow,
+            timeout=settings.pool_timeout,
+            recycle=settings.pool_recycle,
+        )
+    metrics: Optional[PoolMetrics] = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
+
+
+def init_db() -> None:
     """
-    Context manager simple para obtener una sesión SQLAlchemy.
-    Uso:
-        with get_db() as db:
-            ... usar db (db es Session)
-    Para FastAPI, usar un generador con yield en la dependencia.
+    Crea las tablas declaradas en Base.metadata sobre el engine compartido.
     """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    from src.config import get_engine
+    from src.infrastructure.models.models import Base
 
-# FastAPI-compatible dependency (ejemplo)
-def get_db_dependency():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    Base.metadata.create_all(bind=get_engine())
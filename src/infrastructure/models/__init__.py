@@ -1 +1,5 @@
 """Model package for SQLAlchemy ORM definitions."""
+from src.infrastructure.models.models import Base
+from src.infrastructure.models import caja_balance_events  # noqa: F401  (registra listeners)
+
+__all__ = ["Base"]
@@ -0,0 +1,68 @@
+"""Mantiene `caja_balance` al insertar, editar o borrar movimientos financieros."""
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import event, inspect, or_, update
+
+from src.infrastructure.models.models import CajaBalance, MovimientoFinanciero
+from src.utils.timezone import now_utc_minus_5
+
+_balance = CajaBalance.__table__
+_TRACKED_ATTRS = ("caja_id", "tipo", "monto", "fecha")
+
+
+def _apply(connection, caja_id: Any, tipo: Any, monto: Any, fecha: Any, signo: int) -> None:
+    if caja_id is None or monto is None or tipo is None:
+        return
+    tipo = getattr(tipo, "value", tipo)
+    columna = (
+        _balance.c.total_ingresos
+        if str(tipo).upper() == "INGRESO"
+        else _balance.c.total_egresos
+    )
+    # Solo cuentan los movimientos del turno actual (fecha >= desde). Si la
+    # caja aun no tiene fila de balance no se hace nada: se reconstruye al leerla.
+    stmt = (
+        update(_balance)
+        .where(
+            _balance.c.caja_id == caja_id,
+            or_(_balance.c.desde.is_(None), _balance.c.desde <= fecha),
+        )
+        .values({columna: columna + Decimal(monto) * signo, "updated_at": now_utc_minus_5()})
+    )
+    connection.execute(stmt)
+
+
+def _previous_values(target: MovimientoFinanciero) -> dict[str, Any] | None:
+    state = inspect(target)
+    changed = False
+    previous: dict[str, Any] = {}
+    for name in _TRACKED_ATTRS:
+        history = state.attrs[name].history
+        if history.deleted:
+            changed = True
+            previous[name] = history.deleted[0]
+        else:
+            previous[name] = getattr(target, name)
+    return previous if changed else None
+
+
+@event.listens_for(MovimientoFinanciero, "after_insert")
+def _movimiento_insertado(mapper, connection, target: MovimientoFinanciero) -> None:
+    _apply(connection, target.caja_id, target.tipo, target.monto, target.fecha, 1)
+
+
+@event.listens_for(MovimientoFinanciero, "after_update")
+def _movimiento_actualizado(mapper, connection, target: MovimientoFinanciero) -> None:
+    previous = _previous_values(target)
+    if previous is None:
+        return
+    _apply(connection, previous["caja_id"], previous["tipo"], previous["monto"], previous["fecha"], -1)
+    _apply(connection, target.caja_id, target.tipo, target.monto, target.fecha, 1)
+
+
+@event.listens_for(MovimientoFinanciero, "after_delete")
+def _movimiento_eliminado(mapper, connection, target: MovimientoFinanciero) -> None:
+    _apply(connection, target.caja_id, target.tipo, target.monto, target.fecha, -1)
@@ -3,9 +3,9 @@ import datetime
 import decimal
 import uuid
 
-from sqlalchemy import Boolean, CheckConstraint, DateTime, Enum, ForeignKeyConstraint, Identity, Index, Integer, Numeric, PrimaryKeyConstraint, String, Text, UniqueConstraint, Uuid, text
+from sqlalchemy import Boolean, CheckConstraint, Date, DateTime, Enum, ForeignKeyConstraint, Identity, Index, Integer, Numeric, PrimaryKeyConstraint, String, Text, UniqueConstraint, Uuid, text
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
-from utils.timezone import now_utc_minus_5
+from src.utils.timezone import now_utc_minus_5
 
 class Base(DeclarativeBase):
     pass
@@ -114,6 +114,7 @@ class Cliente(Base):
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, default=now_utc_minus_5)
     descuento_pesos: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(12, 2))
     descuento_porcentaje: Mapped[Optional[decimal.Decimal]] = mapped_column(Numeric(5, 2))
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, default=now_utc_minus_5, onupdate=now_utc_minus_5)
 
     visitas: Mapped[list['Visita']] = relationship('Visita', back_populates='cliente')
 
@@ -277,6 +278,7 @@ class Venta(Base):
         ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='SET NULL', name='venta_user_id_fkey'),
         PrimaryKeyConstraint('venta_id', name='venta_pkey'),
         UniqueConstraint('numero_factura', name='venta_numero_factura_key'),
+        UniqueConstraint('idempotency_key', name='venta_idempotency_key_key'),
         Index('ix_venta_fecha', 'fecha'),
         Index('ix_venta_venta_id', 'venta_id')
     )
@@ -294,6 +296,8 @@ class Venta(Base):
     numero_factura: Mapped[Optional[str]] = mapped_column(String(50))
     cliente_id: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid)
     user_id: Mapped[Optional[int]] = mapped_column(Integer)
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(64))
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, default=now_utc_minus_5, onupdate=now_utc_minus_5)
 
     cliente: Mapped[Optional['Cliente']] = relationship('Cliente')
     usuario: Mapped[Optional['User']] = relationship('User', back_populates='ventas')
@@ -339,7 +343,14 @@ class Stock(Base):
         ForeignKeyConstraint(['creado_por_id'], ['user.id'], ondelete='SET NULL', name='stock_creado_por_id_fkey'),
         ForeignKeyConstraint(['producto_id'], ['product.producto_id'], ondelete='CASCADE', name='stock_producto_id_fkey'),
         PrimaryKeyConstraint('stock_id', name='stock_pkey'),
-        Index('ix_stock_stock_id', 'stock_id')
+        Index('ix_stock_stock_id', 'stock_id'),
+        Index(
+            'ix_stock_bajo_minimo',
+            'producto_id',
+            'stock_id',
+            postgresql_where=text('cantidad_actual <= cantidad_minima'),
+            sqlite_where=text('cantidad_actual <= cantidad_minima'),
+        )
     )
 
     stock_id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
@@ -366,7 +377,8 @@ class MovimientosStock(Base):
         ForeignKeyConstraint(['stock_id'], ['stock.stock_id'], ondelete='CASCADE', name='movimientos_stock_stock_id_fkey'),
         ForeignKeyConstraint(['tipo_movimiento_id'], ['tipo_movimiento.tipo_movimiento_id'], name='movimientos_stock_tipo_movimiento_id_fkey'),
         PrimaryKeyConstraint('movimiento_id', name='movimientos_stock_pkey'),
-        Index('ix_movimientos_stock_movimiento_id', 'movimiento_id')
+        Index('ix_movimientos_stock_movimiento_id', 'movimiento_id'),
+        Index('ix_movimientos_stock_producto_fecha', 'producto_id', 'fecha_creacion')
     )
 
     movimiento_id: Mapped[int] = mapped_column(Integer, Identity(start=1, increment=1, minvalue=1, maxvalue=2147483647, cycle=False, cache=1), primary_key=True)
@@ -411,6 +423,7 @@ class Caja(Base):
     movimientos_financieros: Mapped[list['MovimientoFinanciero']] = relationship('MovimientoFinanciero', back_populates='caja')
     usuario: Mapped[Optional['User']] = relationship('User', back_populates='cajas')
     caja_sesiones: Mapped[list['CajaSesion']] = relationship('CajaSesion', back_populates='caja')
+    balance: Mapped[Optional['CajaBalance']] = relationship('CajaBalance', back_populates='caja', uselist=False)
     cierre_caja_denominaciones: Mapped[list['CierreCajaDenominacion']] = relationship(
         'CierreCajaDenominacion',
         back_populates='caja',
@@ -443,6 +456,22 @@ class CajaSesion(Base):
     usuario: Mapped[Optional['User']] = relationship('User', back_populates='caja_sesiones')
 
 
+class CajaBalance(Base):
+    __tablename__ = 'caja_balance'
+    __table_args__ = (
+        ForeignKeyConstraint(['caja_id'], ['cierre_cajas.id'], ondelete='CASCADE', name='caja_balance_caja_id_fkey'),
+        PrimaryKeyConstraint('caja_id', name='caja_balance_pkey'),
+    )
+
+    caja_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    total_ingresos: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=decimal.Decimal('0.00'))
+    total_egresos: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=decimal.Decimal('0.00'))
+    desde: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(True))
+    updated_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, default=now_utc_minus_5)
+
+    caja: Mapped['Caja'] = relationship('Caja', back_populates='balance')
+
+
 class CierreCajaDenominacion(Base):
     __tablename__ = 'cierre_caja_denominaciones'
     __table_args__ = (
@@ -630,3 +659,23 @@ class AbonoCuenta(Base):
 
     cuenta: Mapped['CuentaCobrar'] = relationship('CuentaCobrar', back_populates='abonos')
     movimiento: Mapped['MovimientoFinanciero'] = relationship('MovimientoFinanciero')
+
+
+class ResumenVentaDiaria(Base):
+    __tablename__ = 'resumen_venta_diaria'
+    __table_args__ = (
+        PrimaryKeyConstraint('id', name='resumen_venta_diaria_pkey'),
+        UniqueConstraint('fecha', name='resumen_venta_diaria_fecha_key'),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    fecha: Mapped[datetime.date] = mapped_column(Date, nullable=False)
+    total_ventas: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=decimal.Decimal('0.00'))
+    total_efectivo: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=decimal.Decimal('0.00'))
+    total_tarjeta: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=decimal.Decimal('0.00'))
+    total_transferencia: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=decimal.Decimal('0.00'))
+    total_credito: Mapped[decimal.Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=decimal.Decimal('0.00'))
+    cantidad_transacciones: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    generado_por_whatsapp_user_id: Mapped[Optional[str]] = mapped_column(String(255))
+    created_at: Mapped[datetime.datetime] = mapped_column(DateTime(True), nullable=False, default=now_utc_minus_5)
+    updated_at: Mapped[Optional[datetime.datetime]] = mapped_column(DateTime(True))
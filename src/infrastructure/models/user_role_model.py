@@ -1,6 +1,6 @@
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, UniqueConstraint
 
-from utils.timezone import now_utc_minus_5
+from src.utils.timezone import now_utc_minus_5
 
 from src.infrastructure.models.base import Base
 
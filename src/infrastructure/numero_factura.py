@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+SEQUENCE_NAME = "venta_numero_factura_seq"
+DEFAULT_BLOCK_SIZE = 20
+
+FetchBlock = Callable[[int], Iterable[int]]
+
+
+def format_numero_factura(valor: int) -> str:
+    return f"POS-{int(valor):06d}"
+
+
+class NumeroFacturaAllocator:
+    """
+    Reparte numeros de factura POS desde bloques reservados en memoria.
+
+    La secuencia se asegura una sola vez (al iniciar la app) y cada bloque se
+    reserva con un unico ``nextval`` sobre ``generate_series``; las ventas
+    toman numeros del bloque sin ir a la base. Como la secuencia es la unica
+    fuente, varios procesos no repiten numeros, aunque no salen en orden
+    estricto entre procesos. Los numeros reservados y no usados al reiniciar
+    quedan como huecos, igual que con ``CACHE`` en la secuencia.
+    """
+
+    def __init__(
+        self,
+        engine: Optional[Engine] = None,
+        *,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        fetch_block: Optional[FetchBlock] = None,
+    ):
+        if engine is None and fetch_block is None:
+            raise ValueError("Se requiere engine o fetch_block")
+        self.engine = engine
+        self.block_size = max(1, int(block_size))
+        self._fetch_block = fetch_block or self._fetch_from_sequence
+        self._disponibles: deque[int] = deque()
+        self._lock = threading.Lock()
+        self._sequence_ready = fetch_block is not None
+
+    def ensure_sequence(self) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(text(f"CREATE SEQUENCE IF NOT EXISTS {SEQUENCE_NAME}"))
+        self._sequence_ready = True
+
+    def next_numeros(self, cantidad: int = 1) -> list[str]:
+        """Devuelve ``cantidad`` numeros unicos; solo va a la base al agotar el bloque."""
+        if cantidad <= 0:
+            return []
+        with self._lock:
+            faltantes = cantidad - len(self._disponibles)
+            if faltantes > 0:
+                self._disponibles.extend(
+                    self._fetch_block(max(faltantes, self.block_size))
+                )
+            return [
+                format_numero_factura(self._disponibles.popleft())
+                for _ in range(cantidad)
+            ]
+
+    def try_take(self, cantidad: int = 1) -> Optional[list[str]]:
+        """
+        Toma ``cantidad`` numeros del bloque sin esperar: ``None`` si otro hilo
+        tiene el lock (quiza reservando un bloque) o si habria que ir a la base.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            if len(self._disponibles) < cantidad:
+                return None
+            return [
+                format_numero_factura(self._disponibles.popleft())
+                for _ in range(cantidad)
+            ]
+        finally:
+            self._lock.release()
+
+    def _fetch_from_sequence(self, cantidad: int) -> list[int]:
+        if not self._sequence_ready:
+            self.ensure_sequence()
+        # nextval no es transaccional: los valores quedan reservados aunque la
+        # conexion se cierre sin commit.
+        with self.engine.connect() as connection:
+            return list(
+                connection.execute(
+                    text(
+                        f"SELECT nextval('{SEQUENCE_NAME}') "
+                        "FROM generate_series(1, :cantidad)"
+                    ),
+                    {"cantidad": cantidad},
+                ).scalars()
+            )
+
+
+_allocator: Optional[NumeroFacturaAllocator] = None
+_allocator_lock = threading.Lock()
+
+
+def get_numero_factura_allocator() -> NumeroFacturaAllocator:
+    global _allocator
+    if _allocator is None:
+        with _allocator_lock:
+            if _allocator is None:
+                from src.config import get_engine
+
+                _allocator = NumeroFacturaAllocator(
+                    get_engine(),
+                    block_size=int(
+                        os.getenv("NUMERO_FACTURA_BLOCK_SIZE", str(DEFAULT_BLOCK_SIZE))
+                    ),
+                )
+    return _allocator
@@ -7,10 +7,10 @@ from uuid import UUID
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from domain.entities.clienteEntity import ClienteEntity
-from domain.interfaces.cliente_repository_interface import ClienteRepositoryInterface
+from src.domain.entities.clienteEntity import ClienteEntity
+from src.domain.interfaces.cliente_repository_interface import ClienteRepositoryInterface
 from src.infrastructure.models.models import Cliente
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class ClienteRepository(ClienteRepositoryInterface):
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.productsEntity import ProductEntity
+from src.domain.interfaces.product_repository_interface import (
+    AsyncProductRepositoryInterface,
+)
+from src.infrastructure.repository.createProductsRepository import ProductRepository
+
+
+class AsyncProductRepository(AsyncProductRepositoryInterface):
+    """
+    Lecturas de productos sobre ``AsyncSession``; reutiliza las consultas de
+    ProductRepository mediante ``run_sync``.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_product(self, product_id: int) -> Optional[ProductEntity]:
+        return await self.db.run_sync(
+            lambda session: ProductRepository(session).get_product(product_id)
+        )
+
+    async def search_products(self, term: str, limit: int = 50) -> List[ProductEntity]:
+        return await self.db.run_sync(
+            lambda session: ProductRepository(session).search_products(term, limit=limit)
+        )
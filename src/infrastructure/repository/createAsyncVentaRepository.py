@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+from anyio import to_thread
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity
+from src.domain.entities.ventaEntity import VentaEntity
+from src.domain.interfaces.venta_repository_interface import (
+    AsyncVentaRepositoryInterface,
+)
+from src.infrastructure.numero_factura import (
+    NumeroFacturaAllocator,
+    get_numero_factura_allocator,
+)
+from src.infrastructure.repository.createVentaRepository import VentaRepository
+
+
+class AsyncVentaRepository(AsyncVentaRepositoryInterface):
+    """
+    Registro de ventas sobre ``AsyncSession``. La transaccion es la misma de
+    VentaRepository, ejecutada con ``run_sync``: las consultas van por el
+    driver asyncio sin ocupar un hilo del pool de FastAPI y la logica de
+    stock, resumen y cartera no se duplica.
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        numero_allocator: Optional[NumeroFacturaAllocator] = None,
+    ):
+        self.db = db
+        self._numero_allocator = numero_allocator
+
+    async def create_venta(
+        self,
+        venta_entity: VentaEntity,
+        detalles: List[VentaDetalleEntity],
+        stock_deltas: Optional[dict[int, int]] = None,
+    ) -> VentaEntity:
+        if not venta_entity.numero_factura:
+            # Un reintento idempotente descarta este numero: queda un hueco,
+            # como los de NumeroFacturaAllocator al reiniciar.
+            venta_entity = venta_entity.model_copy(
+                update={"numero_factura": await self._next_numero_factura()}
+            )
+        return await self.db.run_sync(
+            lambda session: VentaRepository(session).create_venta(
+                venta_entity, detalles, stock_deltas
+            )
+        )
+
+    async def _next_numero_factura(self) -> str:
+        """
+        El allocator usa el engine sync y un ``threading.Lock``: en el event
+        loop solo se toma un numero si el lock esta libre y el bloque alcanza;
+        si no (bloque agotado u otro hilo reservando), se espera en un hilo.
+        """
+        if self._numero_allocator is None:
+            self._numero_allocator = get_numero_factura_allocator()
+        allocator = self._numero_allocator
+        numeros = allocator.try_take(1)
+        if numeros is None:
+            numeros = await to_thread.run_sync(allocator.next_numeros, 1)
+        return numeros[0]
@@ -4,19 +4,22 @@ from decimal import Decimal
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, true, update
+from sqlalchemy.orm import Session, aliased
 
-from domain.entities.cajaEntity import CajaEntity
-from domain.enums.contabilidadEnums import CajaEstado
-from domain.interfaces.caja_repository_interface import CajaRepositoryInterface
+from src.domain.entities.cajaBalanceEntity import CajaBalanceEntity
+from src.domain.entities.cajaEntity import CajaEntity
+from src.domain.enums.contabilidadEnums import CajaEstado
+from src.domain.interfaces.caja_repository_interface import CajaRepositoryInterface
 from src.infrastructure.models.models import (
     Caja,
+    CajaBalance,
     CajaSesion,
     CierreCajaDenominacion,
     MovimientoFinanciero,
 )
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.infrastructure.response_cache import CACHE_CAJAS, response_cache
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class CajaRepository(CajaRepositoryInterface):
@@ -54,7 +57,16 @@ class CajaRepository(CajaRepositoryInterface):
             created_at=created_at,
         )
         self.db.add(caja_orm)
+        self.db.flush()
+        self.db.add(
+            CajaBalance(
+                caja_id=caja_orm.id,
+                desde=caja_orm.fecha_apertura,
+                updated_at=now_utc_minus_5(),
+            )
+        )
         self.db.commit()
+        response_cache.invalidate(CACHE_CAJAS)
         self.db.refresh(caja_orm)
         return self._to_entity(caja_orm)
 
@@ -64,6 +76,21 @@ class CajaRepository(CajaRepositoryInterface):
             return None
         return self._to_entity(record)
 
+    def get_balance(self, caja_id: int) -> Optional[CajaBalanceEntity]:
+        row = self.db.execute(
+            select(Caja, CajaBalance)
+            .outerjoin(CajaBalance, CajaBalance.caja_id == Caja.id)
+            .where(Caja.id == caja_id)
+        ).first()
+        if row is None:
+            return None
+        record, balance = row
+        # Un balance con otro ``desde`` quedo del turno anterior.
+        if balance is None or balance.desde != record.fecha_apertura:
+            balance = self._rebuild_balance(record)
+            self.db.commit()
+        return self._to_balance_entity(record, balance)
+
     def list_cajas(self) -> List[CajaEntity]:
         records = self.db.query(Caja).all()
         return [self._to_entity(row) for row in records]
@@ -72,6 +99,7 @@ class CajaRepository(CajaRepositoryInterface):
         record = self.db.get(Caja, caja_id)
         if not record:
             return None
+        fecha_apertura_anterior = record.fecha_apertura
         record.nombre = entity.nombre
         record.saldo_inicial = entity.saldo_inicial
         record.estado = entity.estado
@@ -89,7 +117,11 @@ class CajaRepository(CajaRepositoryInterface):
         )
         record.saldo_final_efectivo = entity.saldo_final_efectivo
         record.diferencia = entity.diferencia
+        if record.fecha_apertura != fecha_apertura_anterior:
+            # Nuevo turno: el balance acumulado parte de la nueva apertura.
+            self._rebuild_balance(record)
         self.db.commit()
+        response_cache.invalidate(CACHE_CAJAS)
         self.db.refresh(record)
         return self._to_entity(record)
 
@@ -99,54 +131,19 @@ class CajaRepository(CajaRepositoryInterface):
         *,
         usuario_id: Optional[int] = None,
     ) -> Optional[CajaEntity]:
-        record = self.db.get(Caja, caja_id)
-        if not record:
+        row = self.db.execute(self._cierre_statement(caja_id)).first()
+        if row is None:
             return None
-
-        cierre_time = now_utc_minus_5()
-        fecha_apertura = record.fecha_apertura
-
-        ingresos_query = self.db.query(
-            func.coalesce(func.sum(MovimientoFinanciero.monto), 0)
-        ).filter(
-            MovimientoFinanciero.caja_id == caja_id,
-            MovimientoFinanciero.tipo == "INGRESO",
-            MovimientoFinanciero.fecha <= cierre_time,
-        )
-        egresos_query = self.db.query(
-            func.coalesce(func.sum(MovimientoFinanciero.monto), 0)
-        ).filter(
-            MovimientoFinanciero.caja_id == caja_id,
-            MovimientoFinanciero.tipo == "EGRESO",
-            MovimientoFinanciero.fecha <= cierre_time,
-        )
-        if fecha_apertura is not None:
-            ingresos_query = ingresos_query.filter(
-                MovimientoFinanciero.fecha >= fecha_apertura
-            )
-            egresos_query = egresos_query.filter(
-                MovimientoFinanciero.fecha >= fecha_apertura
-            )
-        total_ingresos = Decimal(ingresos_query.scalar() or 0)
-        total_egresos = Decimal(egresos_query.scalar() or 0)
-
-        ultimo_conteo = (
-            self.db.query(func.max(CierreCajaDenominacion.fecha_conteo))
-            .filter(CierreCajaDenominacion.caja_id == caja_id)
-            .scalar()
-        )
+        record, balance, ultimo_conteo, efectivo_contado, sesion_id = row
         if ultimo_conteo is None:
             raise ValueError("No hay conteo de denominaciones para esta caja")
 
-        saldo_final_efectivo = Decimal(
-            self.db.query(func.coalesce(func.sum(CierreCajaDenominacion.subtotal), 0))
-            .filter(
-                CierreCajaDenominacion.caja_id == caja_id,
-                CierreCajaDenominacion.fecha_conteo == ultimo_conteo,
-            )
-            .scalar()
-            or 0
-        )
+        cierre_time = now_utc_minus_5()
+        if balance is None or balance.desde != record.fecha_apertura:
+            balance = self._rebuild_balance(record)
+        total_ingresos = Decimal(balance.total_ingresos or 0)
+        total_egresos = Decimal(balance.total_egresos or 0)
+        saldo_final_efectivo = Decimal(efectivo_contado or 0)
 
         saldo_teorico = (
             Decimal(record.saldo_inicial) + total_ingresos - total_egresos
@@ -161,21 +158,114 @@ class CajaRepository(CajaRepositoryInterface):
         if usuario_id is not None:
             record.usuario_id = usuario_id
 
-        open_session = (
-            self.db.query(CajaSesion)
-            .filter(
+        if sesion_id is not None:
+            self.db.execute(
+                update(CajaSesion)
+                .where(CajaSesion.id == sesion_id)
+                .values(fecha_cierre=cierre_time)
+            )
+
+        self.db.commit()
+        response_cache.invalidate(CACHE_CAJAS)
+        self.db.refresh(record)
+        return self._to_entity(record)
+
+    def _cierre_statement(self, caja_id: int):
+        """
+        Lee en un solo viaje la caja y su balance (ambos bloqueados), el ultimo conteo
+        de denominaciones y la sesion abierta mas reciente.
+        """
+        ultimo_conteo = (
+            select(
+                CierreCajaDenominacion.fecha_conteo.label("fecha_conteo"),
+                func.sum(CierreCajaDenominacion.subtotal).label("efectivo_contado"),
+            )
+            .where(CierreCajaDenominacion.caja_id == caja_id)
+            .group_by(CierreCajaDenominacion.fecha_conteo)
+            .order_by(CierreCajaDenominacion.fecha_conteo.desc())
+            .limit(1)
+            .cte("ultimo_conteo")
+        )
+        sesion_abierta = (
+            select(CajaSesion.id.label("sesion_id"))
+            .where(
                 CajaSesion.caja_id == caja_id,
                 CajaSesion.fecha_cierre.is_(None),
             )
             .order_by(CajaSesion.fecha_apertura.desc())
-            .first()
+            .limit(1)
+            .cte("sesion_abierta")
+        )
+        # Postgres no admite FOR UPDATE OF sobre el lado nulo de un LEFT JOIN:
+        # el balance se bloquea en su propio subselect.
+        balance = aliased(
+            CajaBalance,
+            select(CajaBalance)
+            .where(CajaBalance.caja_id == caja_id)
+            .with_for_update()
+            .subquery("caja_balance"),
+        )
+        return (
+            select(
+                Caja,
+                balance,
+                ultimo_conteo.c.fecha_conteo,
+                ultimo_conteo.c.efectivo_contado,
+                sesion_abierta.c.sesion_id,
+            )
+            .outerjoin(balance, balance.caja_id == Caja.id)
+            .outerjoin(ultimo_conteo, true())
+            .outerjoin(sesion_abierta, true())
+            .where(Caja.id == caja_id)
+            .with_for_update(of=Caja)
         )
-        if open_session:
-            open_session.fecha_cierre = cierre_time
 
-        self.db.commit()
-        self.db.refresh(record)
-        return self._to_entity(record)
+    def _rebuild_balance(self, record: Caja) -> CajaBalance:
+        """Recalcula el balance del turno actual con un solo recorrido de movimientos."""
+        stmt = select(
+            func.coalesce(
+                func.sum(MovimientoFinanciero.monto).filter(
+                    MovimientoFinanciero.tipo == "INGRESO"
+                ),
+                0,
+            ),
+            func.coalesce(
+                func.sum(MovimientoFinanciero.monto).filter(
+                    MovimientoFinanciero.tipo == "EGRESO"
+                ),
+                0,
+            ),
+        ).where(MovimientoFinanciero.caja_id == record.id)
+        if record.fecha_apertura is not None:
+            stmt = stmt.where(MovimientoFinanciero.fecha >= record.fecha_apertura)
+        total_ingresos, total_egresos = self.db.execute(stmt).one()
+
+        balance = self.db.get(CajaBalance, record.id, with_for_update=True)
+        if balance is None:
+            balance = CajaBalance(caja_id=record.id)
+            self.db.add(balance)
+        balance.total_ingresos = Decimal(total_ingresos or 0)
+        balance.total_egresos = Decimal(total_egresos or 0)
+        balance.desde = record.fecha_apertura
+        balance.updated_at = now_utc_minus_5()
+        self.db.flush()
+        return balance
+
+    def _to_balance_entity(self, record: Caja, balance: CajaBalance) -> CajaBalanceEntity:
+        saldo_inicial = Decimal(record.saldo_inicial or 0)
+        total_ingresos = Decimal(balance.total_ingresos or 0)
+        total_egresos = Decimal(balance.total_egresos or 0)
+        return CajaBalanceEntity(
+            caja_id=record.id,
+            saldo_inicial=saldo_inicial,
+            total_ingresos=total_ingresos,
+            total_egresos=total_egresos,
+            saldo_teorico=(saldo_inicial + total_ingresos - total_egresos).quantize(
+                Decimal("0.01")
+            ),
+            desde=balance.desde,
+            updated_at=balance.updated_at,
+        )
 
     def _to_entity(self, record: Caja) -> CajaEntity:
         return CajaEntity.from_model(record)
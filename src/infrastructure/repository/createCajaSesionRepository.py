@@ -5,12 +5,12 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
-from domain.entities.cajaSesionEntity import CajaSesionEntity
-from domain.interfaces.caja_sesion_repository_interface import (
+from src.domain.entities.cajaSesionEntity import CajaSesionEntity
+from src.domain.interfaces.caja_sesion_repository_interface import (
     CajaSesionRepositoryInterface,
 )
 from src.infrastructure.models.models import CajaSesion
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class CajaSesionRepository(CajaSesionRepositoryInterface):
@@ -5,12 +5,12 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
-from domain.entities.cajasCervezaEntity import CajasCervezaEntity
-from domain.interfaces.cajas_cerveza_repository_interface import (
+from src.domain.entities.cajasCervezaEntity import CajasCervezaEntity
+from src.domain.interfaces.cajas_cerveza_repository_interface import (
     CajasCervezaRepositoryInterface,
 )
 from src.infrastructure.models.models import CajasCerveza
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class CajasCervezaRepository(CajasCervezaRepositoryInterface):
@@ -5,10 +5,10 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
-from domain.entities.carteraEntity import CarteraEntity
-from domain.interfaces.cartera_repository_interface import CarteraRepositoryInterface
+from src.domain.entities.carteraEntity import CarteraEntity
+from src.domain.interfaces.cartera_repository_interface import CarteraRepositoryInterface
 from src.infrastructure.models.models import Cartera
-from utils.timezone import end_of_day, ensure_utc_minus_5, start_of_day
+from src.utils.timezone import end_of_day, ensure_utc_minus_5, start_of_day
 
 
 class CarteraRepository(CarteraRepositoryInterface):
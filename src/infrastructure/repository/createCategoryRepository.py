@@ -6,10 +6,11 @@ from typing import List, Optional
 from sqlalchemy import or_
 from sqlalchemy.orm import Session, joinedload
 
-from domain.entities.categoryEntity import CategoryEntity
-from domain.interfaces.category_repository_interface import CategoryRepositoryInterface
+from src.domain.entities.categoryEntity import CategoryEntity
+from src.domain.interfaces.category_repository_interface import CategoryRepositoryInterface
 from src.infrastructure.models.models import Categoria
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.infrastructure.response_cache import CACHE_CATEGORIAS, CACHE_PRODUCTOS, response_cache
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class CategoryRepository(CategoryRepositoryInterface):
@@ -42,6 +43,7 @@ class CategoryRepository(CategoryRepositoryInterface):
 
         self.db.add(categoria_orm)
         self.db.commit()
+        response_cache.invalidate(CACHE_CATEGORIAS, CACHE_PRODUCTOS)
         self.db.refresh(categoria_orm)
         return self._to_entity(categoria_orm)
 
@@ -102,6 +104,7 @@ class CategoryRepository(CategoryRepositoryInterface):
             return False
         self.db.delete(record)
         self.db.commit()
+        response_cache.invalidate(CACHE_CATEGORIAS, CACHE_PRODUCTOS)
         return True
 
     def update_category_status(
@@ -123,6 +126,7 @@ class CategoryRepository(CategoryRepositoryInterface):
             else now_utc_minus_5()
         )
         self.db.commit()
+        response_cache.invalidate(CACHE_CATEGORIAS, CACHE_PRODUCTOS)
         self.db.refresh(record)
         return self._to_entity(record)
 
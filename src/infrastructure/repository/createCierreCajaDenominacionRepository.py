@@ -5,12 +5,12 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
-from domain.entities.cierreCajaDenominacionEntity import CierreCajaDenominacionEntity
-from domain.interfaces.cierre_caja_denominacion_repository_interface import (
+from src.domain.entities.cierreCajaDenominacionEntity import CierreCajaDenominacionEntity
+from src.domain.interfaces.cierre_caja_denominacion_repository_interface import (
     CierreCajaDenominacionRepositoryInterface,
 )
 from src.infrastructure.models.models import CierreCajaDenominacion
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class CierreCajaDenominacionRepository(CierreCajaDenominacionRepositoryInterface):
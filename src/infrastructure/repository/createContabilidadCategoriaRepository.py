@@ -4,12 +4,13 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
-from domain.entities.contabilidadCategoriaEntity import ContabilidadCategoriaEntity
-from domain.enums.contabilidadEnums import CategoriaTipo
-from domain.interfaces.contabilidad_categoria_repository_interface import (
+from src.domain.entities.contabilidadCategoriaEntity import ContabilidadCategoriaEntity
+from src.domain.enums.contabilidadEnums import CategoriaTipo
+from src.domain.interfaces.contabilidad_categoria_repository_interface import (
     ContabilidadCategoriaRepositoryInterface,
 )
 from src.infrastructure.models.models import CategoriaContabilidad
+from src.infrastructure.response_cache import CACHE_CONTABILIDAD_CATEGORIAS, response_cache
 
 
 class ContabilidadCategoriaRepository(ContabilidadCategoriaRepositoryInterface):
@@ -25,6 +26,7 @@ class ContabilidadCategoriaRepository(ContabilidadCategoriaRepositoryInterface):
         )
         self.db.add(categoria_orm)
         self.db.commit()
+        response_cache.invalidate(CACHE_CONTABILIDAD_CATEGORIAS)
         self.db.refresh(categoria_orm)
         return ContabilidadCategoriaEntity.from_model(categoria_orm)
 
@@ -57,6 +59,7 @@ class ContabilidadCategoriaRepository(ContabilidadCategoriaRepositoryInterface):
         record.nombre = entity.nombre
         record.tipo_categoria = self._to_tipo_categoria(entity.tipo_categoria)
         self.db.commit()
+        response_cache.invalidate(CACHE_CONTABILIDAD_CATEGORIAS)
         self.db.refresh(record)
         return ContabilidadCategoriaEntity.from_model(record)
 
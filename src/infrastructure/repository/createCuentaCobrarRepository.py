@@ -7,15 +7,15 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session, selectinload
 
-from domain.entities.abonoCuentaEntity import AbonoCuentaEntity
-from domain.entities.cuentaCobrarEntity import CuentaCobrarEntity
-from domain.enums.contabilidadEnums import CreditoEstado
-from domain.interfaces.cuenta_cobrar_repository_interface import (
+from src.domain.entities.abonoCuentaEntity import AbonoCuentaEntity
+from src.domain.entities.cuentaCobrarEntity import CuentaCobrarEntity
+from src.domain.enums.contabilidadEnums import CreditoEstado
+from src.domain.interfaces.cuenta_cobrar_repository_interface import (
     CuentaCobrarRepositoryInterface,
 )
 from src.infrastructure.models.models import AbonoCuenta, CuentaCobrar, MovimientoFinanciero, Venta, VentaDetalle
-from domain.entities.ventaDetalleEntity import VentaDetalleEntity
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class CuentaCobrarRepository(CuentaCobrarRepositoryInterface):
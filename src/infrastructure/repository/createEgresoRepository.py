@@ -5,11 +5,11 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
-from domain.entities.egresoEntity import EgresoEntity
-from domain.enums.contabilidadEnums import MedioPago
-from domain.interfaces.egreso_repository_interface import EgresoRepositoryInterface
+from src.domain.entities.egresoEntity import EgresoEntity
+from src.domain.enums.contabilidadEnums import MedioPago
+from src.domain.interfaces.egreso_repository_interface import EgresoRepositoryInterface
 from src.infrastructure.models.models import Egreso
-from utils.timezone import end_of_day, start_of_day
+from src.utils.timezone import end_of_day, start_of_day
 
 
 class EgresoRepository(EgresoRepositoryInterface):
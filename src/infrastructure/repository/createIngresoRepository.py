@@ -5,11 +5,11 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session
 
-from domain.entities.ingresoEntity import IngresoEntity
-from domain.enums.contabilidadEnums import MedioPago
-from domain.interfaces.ingreso_repository_interface import IngresoRepositoryInterface
+from src.domain.entities.ingresoEntity import IngresoEntity
+from src.domain.enums.contabilidadEnums import MedioPago
+from src.domain.interfaces.ingreso_repository_interface import IngresoRepositoryInterface
 from src.infrastructure.models.models import Ingreso
-from utils.timezone import end_of_day, ensure_utc_minus_5, start_of_day
+from src.utils.timezone import end_of_day, ensure_utc_minus_5, start_of_day
 
 
 class IngresoRepository(IngresoRepositoryInterface):
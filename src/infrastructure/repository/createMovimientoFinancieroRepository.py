@@ -5,13 +5,13 @@ from typing import List, Optional
 
 from sqlalchemy.orm import Session, selectinload
 
-from domain.entities.movimientoFinancieroEntity import MovimientoFinancieroEntity
-from domain.enums.contabilidadEnums import CategoriaTipo
-from domain.interfaces.movimiento_financiero_repository_interface import (
+from src.domain.entities.movimientoFinancieroEntity import MovimientoFinancieroEntity
+from src.domain.enums.contabilidadEnums import CategoriaTipo
+from src.domain.interfaces.movimiento_financiero_repository_interface import (
     MovimientoFinancieroRepositoryInterface,
 )
 from src.infrastructure.models.models import MovimientoFinanciero
-from utils.timezone import end_of_day, ensure_utc_minus_5, start_of_day
+from src.utils.timezone import end_of_day, ensure_utc_minus_5, start_of_day
 
 
 class MovimientoFinancieroRepository(MovimientoFinancieroRepositoryInterface):
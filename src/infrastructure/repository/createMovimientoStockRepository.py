@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Integer,
+    String,
+    case,
+    cast,
+    column,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.orm import Session
+
+from src.domain.dtos.stockDto import (
+    FlujoStockDiarioResponse,
+    MovimientoStockHistorialResponse,
+    MovimientoStockResponse,
+)
+from src.domain.enums.stockEnums import RefMovimientoStock, TipoMovimientoStock
+from src.domain.interfaces.movimiento_stock_repository_interface import (
+    MovimientoStockRepositoryInterface,
+)
+from src.infrastructure.models.models import (
+    MovimientosStock,
+    RefMovimiento,
+    Stock,
+    TipoMovimiento,
+)
+from src.utils.timezone import end_of_day, now_utc_minus_5, start_of_day
+
+
+class MovimientoStockRepository(MovimientoStockRepositoryInterface):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply_deltas(
+        self,
+        movimientos: Iterable[tuple[int, int, Optional[str]]],
+        *,
+        ref: RefMovimientoStock,
+        realizado_por_id: Optional[int] = None,
+        nota: Optional[str] = None,
+    ) -> dict[int, int]:
+        """
+        Una sola sentencia: UPDATE stock ... FROM (VALUES ...) RETURNING mas el
+        INSERT de movimientos_stock en un CTE. Cada producto ajusta una sola
+        fila de stock (la de menor stock_id; producto_id no es unico) y el
+        WHERE descarta la que quedaria negativa, de forma atomica frente a
+        otras ventas. Si algun producto no se actualizo se lanza ValueError;
+        el resto de la sentencia ya se aplico, asi que quien llama decide si
+        hace rollback de su transaccion (o de su savepoint).
+        """
+        filas = [(int(p), int(d), doc) for p, d, doc in movimientos if int(d) != 0]
+        if not filas:
+            return {}
+
+        ahora = now_utc_minus_5()
+        stock = Stock.__table__
+        entrada = (
+            select(
+                values(
+                    column("producto_id", Integer),
+                    column("delta", Integer),
+                    column("referencia_doc", String),
+                    name="v",
+                ).data(filas)
+            )
+        ).cte("entrada")
+        neto = (
+            select(entrada.c.producto_id, func.sum(entrada.c.delta).label("delta"))
+            .group_by(entrada.c.producto_id)
+            .cte("neto")
+        )
+        objetivo = (
+            select(
+                func.min(stock.c.stock_id).label("stock_id"),
+                neto.c.producto_id,
+                neto.c.delta,
+            )
+            .join(neto, neto.c.producto_id == stock.c.producto_id)
+            .group_by(neto.c.producto_id, neto.c.delta)
+            .cte("objetivo")
+        )
+        actualizado = (
+            update(stock)
+            .where(
+                stock.c.stock_id == objetivo.c.stock_id,
+                or_(objetivo.c.delta >= 0, stock.c.cantidad_actual + objetivo.c.delta >= 0),
+            )
+            .values(
+                cantidad_actual=stock.c.cantidad_actual + objetivo.c.delta,
+                ultima_actualizacion=ahora,
+                actualizado_por_id=func.coalesce(
+                    literal(realizado_por_id, Integer), stock.c.actualizado_por_id
+                ),
+            )
+            .returning(stock.c.stock_id, stock.c.producto_id, stock.c.cantidad_actual)
+            .cte("actualizado")
+        )
+        tipo_id = case(
+            (entrada.c.delta > 0, self._lookup(TipoMovimiento, TipoMovimientoStock.ENTRADA)),
+            else_=self._lookup(TipoMovimiento, TipoMovimientoStock.SALIDA),
+        )
+        registro = (
+            insert(MovimientosStock.__table__)
+            .from_select(
+                [
+                    "stock_id",
+                    "producto_id",
+                    "tipo_movimiento_id",
+                    "ref_movimiento_id",
+                    "cantidad",
+                    "fecha_creacion",
+                    "referencia_doc",
+                    "nota",
+                    "realizado_por_id",
+                ],
+                select(
+                    actualizado.c.stock_id,
+                    entrada.c.producto_id,
+                    tipo_id,
+                    self._lookup(RefMovimiento, ref),
+                    func.abs(entrada.c.delta),
+                    literal(ahora, DateTime(timezone=True)),
+                    entrada.c.referencia_doc,
+                    literal(nota, String),
+                    literal(realizado_por_id, Integer),
+                ).select_from(
+                    entrada.join(
+                        actualizado, actualizado.c.producto_id == entrada.c.producto_id
+                    )
+                ),
+            )
+            .cte("registro")
+        )
+        stmt = select(actualizado.c.producto_id, actualizado.c.cantidad_actual).add_cte(
+            registro
+        )
+        resultado = {
+            int(producto_id): int(cantidad)
+            for producto_id, cantidad in self.db.execute(stmt)
+        }
+
+        netos: dict[int, int] = {}
+        for producto_id, delta, _ in filas:
+            netos[producto_id] = netos.get(producto_id, 0) + delta
+        rechazados = sorted(set(netos) - set(resultado))
+        if rechazados:
+            self._raise_rechazados(rechazados, netos)
+        return resultado
+
+    def _raise_rechazados(self, producto_ids: list[int], netos: dict[int, int]) -> None:
+        """Solo ante un rechazo: distingue stock inexistente de insuficiente."""
+        disponibles = {
+            int(producto_id): int(cantidad)
+            for producto_id, cantidad in self.db.execute(
+                select(Stock.producto_id, Stock.cantidad_actual)
+                .where(Stock.producto_id.in_(producto_ids))
+                .order_by(Stock.producto_id, Stock.stock_id.desc())
+            )
+        }
+        faltantes = [producto_id for producto_id in producto_ids if producto_id not in disponibles]
+        if faltantes:
+            raise ValueError(f"Stock no encontrado para productos {faltantes}")
+        producto_id = producto_ids[0]
+        raise ValueError(
+            f"Stock insuficiente para producto {producto_id} "
+            f"(disponible {disponibles[producto_id]}, ajuste {netos[producto_id]})"
+        )
+
+    def registrar_ajuste(
+        self,
+        producto_id: int,
+        delta: int,
+        *,
+        nota: Optional[str] = None,
+        referencia_doc: Optional[str] = None,
+        realizado_por_id: Optional[int] = None,
+    ) -> int:
+        try:
+            resultado = self.apply_deltas(
+                [(producto_id, delta, referencia_doc)],
+                ref=RefMovimientoStock.AJUSTE_MANUAL,
+                realizado_por_id=realizado_por_id,
+                nota=nota,
+            )
+        except ValueError:
+            self.db.rollback()
+            raise
+        self.db.commit()
+        return resultado[producto_id]
+
+    def historial(
+        self,
+        producto_id: int,
+        *,
+        desde: date,
+        hasta: date,
+        limit: int = 500,
+    ) -> MovimientoStockHistorialResponse:
+        """
+        Una consulta sobre ix_movimientos_stock_producto_fecha: cada fila trae
+        los totales de su dia como funciones de ventana, calculadas antes del
+        LIMIT, asi que el flujo de cada dia devuelto esta completo.
+        """
+        mov = MovimientosStock
+        es_entrada = TipoMovimiento.nombre == TipoMovimientoStock.ENTRADA.value
+        delta = case((es_entrada, mov.cantidad), else_=-mov.cantidad)
+        # Etc/GMT+5 es UTC-5 fijo (el signo de las zonas Etc va invertido).
+        dia = cast(func.timezone("Etc/GMT+5", mov.fecha_creacion), Date)
+        stmt = (
+            select(
+                mov.movimiento_id,
+                mov.producto_id,
+                TipoMovimiento.nombre.label("tipo"),
+                RefMovimiento.nombre.label("referencia"),
+                mov.cantidad,
+                delta.label("delta"),
+                mov.fecha_creacion,
+                mov.referencia_doc,
+                mov.nota,
+                mov.realizado_por_id,
+                dia.label("dia"),
+                func.coalesce(
+                    func.sum(mov.cantidad).filter(es_entrada).over(partition_by=dia), 0
+                ).label("entradas"),
+                func.coalesce(
+                    func.sum(mov.cantidad).filter(~es_entrada).over(partition_by=dia), 0
+                ).label("salidas"),
+                func.sum(delta).over(partition_by=dia).label("neto"),
+            )
+            .join(TipoMovimiento, TipoMovimiento.tipo_movimiento_id == mov.tipo_movimiento_id)
+            .join(RefMovimiento, RefMovimiento.ref_movimiento_id == mov.ref_movimiento_id)
+            .where(
+                mov.producto_id == producto_id,
+                mov.fecha_creacion >= start_of_day(desde),
+                mov.fecha_creacion <= end_of_day(hasta),
+            )
+            .order_by(mov.fecha_creacion.desc(), mov.movimiento_id.desc())
+            .limit(limit)
+        )
+
+        movimientos: list[MovimientoStockResponse] = []
+        flujo: dict[date, FlujoStockDiarioResponse] = {}
+        for row in self.db.execute(stmt).mappings():
+            movimientos.append(MovimientoStockResponse.model_validate(dict(row)))
+            if row["dia"] not in flujo:
+                flujo[row["dia"]] = FlujoStockDiarioResponse(
+                    fecha=row["dia"],
+                    entradas=row["entradas"],
+                    salidas=row["salidas"],
+                    neto=row["neto"],
+                )
+        return MovimientoStockHistorialResponse(
+            producto_id=producto_id,
+            movimientos=movimientos,
+            flujo_diario=list(flujo.values()),
+        )
+
+    def _lookup(self, model, nombre: str):
+        tabla = model.__table__
+        pk = list(tabla.primary_key.columns)[0]
+        return select(pk).where(tabla.c.nombre == getattr(nombre, "value", nombre)).scalar_subquery()
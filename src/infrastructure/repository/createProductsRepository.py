@@ -1,16 +1,57 @@
 from __future__ import annotations
 
+import re
+import unicodedata
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from typing import List, Optional
 
-from sqlalchemy import or_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, aliased, joinedload
 
-from domain.entities.productsEntity import ProductEntity
-from domain.interfaces.product_repository_interface import ProductRepositoryInterface
-from src.infrastructure.models.models import Product
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.domain.dtos.productsDto import ProductResponse
+from src.domain.entities.productsEntity import ProductEntity
+from src.domain.interfaces.product_repository_interface import ProductRepositoryInterface
+from src.infrastructure.models.models import Categoria, Product, User
+from src.infrastructure.response_cache import CACHE_PRODUCTOS, response_cache
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+
+BARCODE_PATTERN = re.compile(r"^\d{6,14}$")
+# model_construct no corre los validadores "before": la normalizacion de
+# codigo_barras y nombre (strip, '' -> None) se hace en la consulta.
+PRODUCT_RESPONSE_COLUMNS = (
+    Product.producto_id,
+    func.nullif(func.trim(Product.codigo_barras), "").label("codigo_barras"),
+    func.trim(Product.nombre).label("nombre"),
+    Product.categoria_id,
+    Product.descripcion,
+    Product.precio_venta,
+    Product.costo,
+    Product.margen,
+    Product.iva,
+    Product.creado_por_id,
+    Product.actualizado_por_id,
+    Product.fecha_creacion,
+    Product.fecha_actualizacion,
+    Product.estado,
+)
+# 2000 filas x 13 columnas queda lejos del limite de 65535 parametros.
+IMPORT_BATCH_SIZE = 2000
+# Columnas que refresca una lista de precios (mode=upsert).
+UPSERT_COLUMNS = ("precio_venta", "costo", "margen", "iva", "estado")
+
+
+def normalize_search_term(term: str) -> str:
+    """Minusculas y sin tildes, igual que product_search_text en PostgreSQL."""
+    decomposed = unicodedata.normalize("NFKD", term.strip().lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def _like_pattern(term: str) -> str:
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
 
 class ProductRepository(ProductRepositoryInterface):
@@ -50,20 +91,34 @@ class ProductRepository(ProductRepositoryInterface):
 
         self.db.add(product_orm)
         self.db.commit()
+        response_cache.invalidate(CACHE_PRODUCTOS)
         self.db.refresh(product_orm)
         return self._to_entity(product_orm)
 
-    def list_products(self) -> List[ProductEntity]:
-        records = (
-            self.db.query(Product)
-            .options(
-                joinedload(Product.categoria),
-                joinedload(Product.creado_por),
-                joinedload(Product.actualizado_por),
+    def list_products(self) -> List[ProductResponse]:
+        """
+        Proyeccion directa de columnas al DTO de respuesta: los datos ya se
+        validaron al escribirse, asi que se construyen sin revalidar
+        (``model_construct``) en lugar de pasar por entidad + DTO. Lo que
+        normalizaban los validadores lo hace PRODUCT_RESPONSE_COLUMNS.
+        """
+        creado_por = aliased(User)
+        actualizado_por = aliased(User)
+        stmt = (
+            select(
+                *PRODUCT_RESPONSE_COLUMNS,
+                Categoria.nombre.label("categoria_nombre"),
+                creado_por.username.label("creado_por_nombre"),
+                actualizado_por.username.label("actualizado_por_nombre"),
             )
-            .all()
+            .outerjoin(Categoria, Categoria.categoria_id == Product.categoria_id)
+            .outerjoin(creado_por, creado_por.user_id == Product.creado_por_id)
+            .outerjoin(actualizado_por, actualizado_por.user_id == Product.actualizado_por_id)
         )
-        return [self._to_entity(row) for row in records]
+        return [
+            ProductResponse.model_construct(**row)
+            for row in self.db.execute(stmt).mappings()
+        ]
 
     def get_product(self, product_id: int) -> Optional[ProductEntity]:
         record = (
@@ -80,7 +135,54 @@ class ProductRepository(ProductRepositoryInterface):
             return None
         return self._to_entity(record)
 
-    def search_products(self, term: str) -> List[ProductEntity]:
+    def get_product_by_barcode(self, codigo: str) -> Optional[ProductEntity]:
+        record = self._with_relations().filter(Product.codigo_barras == codigo).first()
+        if not record:
+            return None
+        return self._to_entity(record)
+
+    def search_products(self, term: str, limit: int = 50) -> List[ProductEntity]:
+        """
+        Busqueda del POS. Un termino con forma de codigo de barras se resuelve
+        primero por igualdad sobre ix_product_codigo_barras. En PostgreSQL se
+        usan los indices trigram de scripts/create_product_search_indexes.sql
+        (sin tildes, ordenado por similitud); en otros motores se mantiene la
+        busqueda ILIKE.
+        """
+        term = term.strip()
+        if BARCODE_PATTERN.match(term):
+            exacto = self.get_product_by_barcode(term)
+            if exacto:
+                return [exacto]
+
+        if self.db.get_bind().dialect.name != "postgresql":
+            return self._search_products_like(term, limit)
+
+        normalized = normalize_search_term(term)
+        documento = func.product_search_text(Product.nombre, Product.descripcion)
+        filters = [
+            documento.ilike(_like_pattern(normalized), escape="\\"),
+            Product.codigo_barras.ilike(_like_pattern(term), escape="\\"),
+        ]
+        try:
+            filters.append(Product.precio_venta == Decimal(term))
+        except InvalidOperation:
+            pass
+
+        records = (
+            self._with_relations()
+            .filter(or_(*filters))
+            .order_by(
+                case((Product.codigo_barras == term, 0), else_=1),
+                func.word_similarity(normalized, documento).desc(),
+                Product.nombre,
+            )
+            .limit(limit)
+            .all()
+        )
+        return [self._to_entity(row) for row in records]
+
+    def _search_products_like(self, term: str, limit: int) -> List[ProductEntity]:
         like_term = f"%{term}%"
         filters = [
             Product.nombre.ilike(like_term),
@@ -112,6 +214,7 @@ class ProductRepository(ProductRepositoryInterface):
                 joinedload(Product.actualizado_por),
             )
             .filter(or_(*filters))
+            .limit(limit)
             .all()
         )
         return [self._to_entity(row) for row in records]
@@ -152,6 +255,7 @@ class ProductRepository(ProductRepositoryInterface):
         )
 
         self.db.commit()
+        response_cache.invalidate(CACHE_PRODUCTOS)
         self.db.refresh(record)
         return self._to_entity(record)
 
@@ -185,6 +289,7 @@ class ProductRepository(ProductRepositoryInterface):
         )
 
         self.db.commit()
+        response_cache.invalidate(CACHE_PRODUCTOS)
         self.db.refresh(record)
         return self._to_entity(record)
 
@@ -194,65 +299,134 @@ class ProductRepository(ProductRepositoryInterface):
             return False
         self.db.delete(record)
         self.db.commit()
+        response_cache.invalidate(CACHE_PRODUCTOS)
         return True
 
     def import_products(self, products: List[ProductEntity]) -> tuple[int, int]:
+        """
+        Inserta por lotes con INSERT ... ON CONFLICT (codigo_barras) DO NOTHING;
+        los codigos existentes o repetidos en el archivo cuentan como omitidos.
+        """
         if not products:
             return 0, 0
 
-        codes = [p.codigo_barras for p in products if p.codigo_barras]
-        existing_codes = set()
-        if codes:
-            rows = (
-                self.db.query(Product.codigo_barras)
-                .filter(Product.codigo_barras.in_(codes))
-                .all()
+        ahora = now_utc_minus_5()
+        rows = [self._import_row(entity, ahora) for entity in products]
+        table = Product.__table__
+        created = 0
+        for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+            stmt = (
+                self._insert()(table)
+                .values(rows[start:start + IMPORT_BATCH_SIZE])
+                .on_conflict_do_nothing(index_elements=[table.c.codigo_barras])
+                .returning(table.c.producto_id)
             )
-            existing_codes = {row[0] for row in rows}
+            created += len(self.db.execute(stmt).all())
+        self.db.commit()
+        response_cache.invalidate(CACHE_PRODUCTOS)
+        return created, len(rows) - created
 
-        seen = set()
-        created = 0
-        skipped = 0
+    def upsert_products(
+        self, products: List[ProductEntity]
+    ) -> tuple[int, int, int]:
+        """
+        Un INSERT ... ON CONFLICT (codigo_barras) DO UPDATE por lote. Solo se
+        reescriben las filas cuyo precio, costo, margen, iva o estado cambio;
+        si un codigo se repite en el lote gana la ultima fila.
+        """
+        if not products:
+            return 0, 0, 0
+
+        ahora = now_utc_minus_5()
+        por_codigo: dict[str, dict] = {}
+        sin_codigo: list[dict] = []
         for entity in products:
-            code = entity.codigo_barras
-            if code and (code in existing_codes or code in seen):
-                skipped += 1
-                continue
-            if code:
-                seen.add(code)
-
-            fecha_creacion = (
-                ensure_utc_minus_5(entity.fecha_creacion)
-                if entity.fecha_creacion
-                else now_utc_minus_5()
-            )
-            fecha_actualizacion = (
-                ensure_utc_minus_5(entity.fecha_actualizacion)
-                if entity.fecha_actualizacion
-                else fecha_creacion
+            row = self._import_row(entity, ahora)
+            if row["codigo_barras"]:
+                por_codigo[row["codigo_barras"]] = row
+            else:
+                sin_codigo.append(row)
+        rows = list(por_codigo.values())
+
+        table = Product.__table__
+        created = updated = unchanged = 0
+        for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+            batch = rows[start:start + IMPORT_BATCH_SIZE]
+            codigos = [row["codigo_barras"] for row in batch]
+            existentes = set(
+                self.db.execute(
+                    select(table.c.codigo_barras).where(table.c.codigo_barras.in_(codigos))
+                ).scalars()
             )
-            product_orm = Product(
-                producto_id=entity.producto_id,
-                codigo_barras=entity.codigo_barras,
-                nombre=entity.nombre,
-                categoria_id=entity.categoria_id,
-                descripcion=entity.descripcion,
-                precio_venta=entity.precio_venta,
-                costo=entity.costo,
-                margen=entity.margen,
-                iva=entity.iva,
-                creado_por_id=entity.creado_por_id,
-                actualizado_por_id=entity.actualizado_por_id,
-                fecha_creacion=fecha_creacion,
-                fecha_actualizacion=fecha_actualizacion,
-                estado=entity.estado,
+            stmt = self._insert()(table).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.codigo_barras],
+                set_={
+                    **{column: stmt.excluded[column] for column in UPSERT_COLUMNS},
+                    "actualizado_por_id": func.coalesce(
+                        stmt.excluded.actualizado_por_id, table.c.actualizado_por_id
+                    ),
+                    "fecha_actualizacion": stmt.excluded.fecha_actualizacion,
+                },
+                where=or_(
+                    *(
+                        table.c[column].is_distinct_from(stmt.excluded[column])
+                        for column in UPSERT_COLUMNS
+                    )
+                ),
+            ).returning(table.c.codigo_barras)
+            escritos = set(self.db.execute(stmt).scalars())
+            created += len(escritos - existentes)
+            updated += len(escritos & existentes)
+            unchanged += len(existentes - escritos)
+
+        for start in range(0, len(sin_codigo), IMPORT_BATCH_SIZE):
+            stmt = (
+                self._insert()(table)
+                .values(sin_codigo[start:start + IMPORT_BATCH_SIZE])
+                .returning(table.c.producto_id)
             )
-            self.db.add(product_orm)
-            created += 1
+            created += len(self.db.execute(stmt).all())
+        self.db.commit()
+        response_cache.invalidate(CACHE_PRODUCTOS)
+        return created, updated, unchanged
+
+    def _import_row(self, entity: ProductEntity, ahora: datetime) -> dict:
+        fecha_creacion = (
+            ensure_utc_minus_5(entity.fecha_creacion) if entity.fecha_creacion else ahora
+        )
+        fecha_actualizacion = (
+            ensure_utc_minus_5(entity.fecha_actualizacion)
+            if entity.fecha_actualizacion
+            else fecha_creacion
+        )
+        return {
+            "codigo_barras": entity.codigo_barras,
+            "nombre": entity.nombre,
+            "categoria_id": entity.categoria_id,
+            "descripcion": entity.descripcion,
+            "precio_venta": entity.precio_venta,
+            "costo": entity.costo,
+            "margen": entity.margen,
+            "iva": entity.iva,
+            "creado_por_id": entity.creado_por_id,
+            "actualizado_por_id": entity.actualizado_por_id,
+            "fecha_creacion": fecha_creacion,
+            "fecha_actualizacion": fecha_actualizacion,
+            "estado": entity.estado,
+        }
+
+    def _insert(self):
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert
+        return pg_insert
 
-        if created:
-            self.db.commit()
-        return created, skipped
+    def _with_relations(self):
+        return self.db.query(Product).options(
+            joinedload(Product.categoria),
+            joinedload(Product.creado_por),
+            joinedload(Product.actualizado_por),
+        )
 
     def _to_entity(self, record: Product) -> ProductEntity:
         entity = ProductEntity.from_model(record)
@@ -6,10 +6,11 @@ from typing import List, Optional
 from sqlalchemy import or_, func
 from sqlalchemy.orm import Session
 
-from domain.entities.proveedorEntity import ProveedorEntity
-from domain.interfaces.proveedor_repository_interface import ProveedorRepositoryInterface
+from src.domain.entities.proveedorEntity import ProveedorEntity
+from src.domain.interfaces.proveedor_repository_interface import ProveedorRepositoryInterface
 from src.infrastructure.models.models import Proveedor
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.infrastructure.response_cache import CACHE_PROVEEDORES, response_cache
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class ProveedorRepository(ProveedorRepositoryInterface):
@@ -32,6 +33,7 @@ class ProveedorRepository(ProveedorRepositoryInterface):
         )
         self.db.add(proveedor_orm)
         self.db.commit()
+        response_cache.invalidate(CACHE_PROVEEDORES)
         self.db.refresh(proveedor_orm)
         return self._to_entity(proveedor_orm)
 
@@ -75,6 +77,7 @@ class ProveedorRepository(ProveedorRepositoryInterface):
         record.telefono = entity.telefono
         record.email = entity.email
         self.db.commit()
+        response_cache.invalidate(CACHE_PROVEEDORES)
         self.db.refresh(record)
         return self._to_entity(record)
 
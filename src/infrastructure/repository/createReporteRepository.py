@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, cast, func, or_, select
+from sqlalchemy.orm import Session
+
+from src.domain.dtos.reporteDto import (
+    AgrupacionRotacion,
+    RotacionPeriodoResponse,
+    RotacionProductoResponse,
+    RotacionProductosResponse,
+)
+from src.domain.interfaces.reporte_repository_interface import ReporteRepositoryInterface
+from src.infrastructure.models.models import Product, Venta, VentaDetalle
+from src.utils.timezone import end_of_day, start_of_day
+
+_DATE_TRUNC = {"dia": "day", "semana": "week"}
+_CENTAVOS = Decimal("0.01")
+
+
+class ReporteRepository(ReporteRepositoryInterface):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def rotacion_productos(
+        self,
+        *,
+        desde: date,
+        hasta: date,
+        top: int,
+        agrupacion: AgrupacionRotacion,
+    ) -> RotacionProductosResponse:
+        """
+        Una consulta: el rango se filtra por ix_venta_fecha y los detalles se
+        agregan por producto y periodo en la base; el ranking usa funciones de
+        ventana sobre los totales, asi que solo viajan las filas del top.
+        """
+        # Etc/GMT+5 es UTC-5 fijo (el signo de las zonas Etc va invertido).
+        periodo = cast(
+            func.date_trunc(_DATE_TRUNC[agrupacion], func.timezone("Etc/GMT+5", Venta.fecha)),
+            Date,
+        ).label("periodo")
+        por_periodo = (
+            select(
+                VentaDetalle.producto_id,
+                periodo,
+                func.sum(VentaDetalle.cantidad).label("cantidad"),
+                func.sum(VentaDetalle.subtotal).label("ingreso"),
+            )
+            .join(Venta, Venta.venta_id == VentaDetalle.venta_id)
+            .where(
+                Venta.estado.is_(True),
+                Venta.fecha >= start_of_day(desde),
+                Venta.fecha <= end_of_day(hasta),
+            )
+            .group_by(VentaDetalle.producto_id, periodo)
+            .cte("por_periodo")
+        )
+        cantidad_total = func.sum(por_periodo.c.cantidad)
+        ingreso_total = func.sum(por_periodo.c.ingreso)
+        totales = (
+            select(
+                por_periodo.c.producto_id,
+                cantidad_total.label("cantidad"),
+                ingreso_total.label("ingreso"),
+                func.row_number()
+                .over(order_by=(cantidad_total.desc(), por_periodo.c.producto_id))
+                .label("rank_cantidad"),
+                func.row_number()
+                .over(order_by=(ingreso_total.desc(), por_periodo.c.producto_id))
+                .label("rank_ingreso"),
+            )
+            .group_by(por_periodo.c.producto_id)
+            .cte("totales")
+        )
+        stmt = (
+            select(
+                totales.c.producto_id,
+                totales.c.cantidad,
+                totales.c.ingreso,
+                totales.c.rank_cantidad,
+                totales.c.rank_ingreso,
+                Product.codigo_barras,
+                Product.nombre,
+                Product.costo,
+                por_periodo.c.periodo,
+                por_periodo.c.cantidad.label("periodo_cantidad"),
+                por_periodo.c.ingreso.label("periodo_ingreso"),
+            )
+            .join(Product, Product.producto_id == totales.c.producto_id)
+            .join(por_periodo, por_periodo.c.producto_id == totales.c.producto_id)
+            .where(or_(totales.c.rank_cantidad <= top, totales.c.rank_ingreso <= top))
+            .order_by(totales.c.producto_id, por_periodo.c.periodo)
+        )
+
+        dias = Decimal((hasta - desde).days + 1)
+        productos: dict[int, RotacionProductoResponse] = {}
+        ranks: dict[int, tuple[int, int]] = {}
+        for row in self.db.execute(stmt).mappings():
+            producto = productos.get(row["producto_id"])
+            if producto is None:
+                ingreso = Decimal(row["ingreso"] or 0)
+                costo = (Decimal(row["costo"] or 0) * row["cantidad"]).quantize(_CENTAVOS)
+                margen = ingreso - costo
+                producto = productos[row["producto_id"]] = RotacionProductoResponse(
+                    producto_id=row["producto_id"],
+                    codigo_barras=row["codigo_barras"],
+                    nombre=row["nombre"],
+                    cantidad=row["cantidad"],
+                    ingreso=ingreso,
+                    costo_estimado=costo,
+                    margen=margen,
+                    margen_pct=(margen * 100 / ingreso).quantize(_CENTAVOS) if ingreso else None,
+                    promedio_diario=(Decimal(row["cantidad"]) / dias).quantize(_CENTAVOS),
+                )
+                ranks[row["producto_id"]] = (row["rank_cantidad"], row["rank_ingreso"])
+            producto.periodos.append(
+                RotacionPeriodoResponse(
+                    periodo=row["periodo"],
+                    cantidad=row["periodo_cantidad"],
+                    ingreso=row["periodo_ingreso"],
+                )
+            )
+
+        def _top(posicion: int) -> list[RotacionProductoResponse]:
+            ordenados = sorted(
+                (pid for pid in productos if ranks[pid][posicion] <= top),
+                key=lambda pid: ranks[pid][posicion],
+            )
+            return [productos[pid] for pid in ordenados]
+
+        return RotacionProductosResponse(
+            desde=desde,
+            hasta=hasta,
+            agrupacion=agrupacion,
+            top=top,
+            por_cantidad=_top(0),
+            por_ingreso=_top(1),
+        )
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Iterable, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from src.domain.entities.resumenVentaDiariaEntity import ResumenVentaDiariaEntity
+from src.domain.interfaces.resumen_venta_diaria_repository_interface import (
+    ResumenVentaDiariaRepositoryInterface,
+)
+from src.infrastructure.models.models import ResumenVentaDiaria, Venta
+from src.utils.timezone import end_of_day, ensure_utc_minus_5, now_utc_minus_5, start_of_day
+
+# tipo_pago -> columna acumulada; una venta sin tipo_pago es credito.
+TOTAL_COLUMNS = {
+    "efectivo": "total_efectivo",
+    "tarjeta": "total_tarjeta",
+    "transferencia": "total_transferencia",
+    "credito": "total_credito",
+}
+REFRESH_MAX_DIAS = 31
+
+logger = logging.getLogger("resumen_venta_diaria")
+
+
+class ResumenVentaDiariaRepository(ResumenVentaDiariaRepositoryInterface):
+    def __init__(self, db: Session):
+        self.db = db
+        self._dias_pendientes: set[date] = set()
+
+    def create_resumen(
+        self, entity: ResumenVentaDiariaEntity
+    ) -> ResumenVentaDiariaEntity:
+        record = ResumenVentaDiaria(
+            fecha=entity.fecha,
+            total_ventas=entity.total_ventas,
+            total_efectivo=entity.total_efectivo,
+            total_tarjeta=entity.total_tarjeta,
+            total_transferencia=entity.total_transferencia,
+            total_credito=entity.total_credito,
+            cantidad_transacciones=entity.cantidad_transacciones,
+            generado_por_whatsapp_user_id=entity.generado_por_whatsapp_user_id,
+            created_at=now_utc_minus_5(),
+        )
+        self.db.add(record)
+        self.db.commit()
+        self.db.refresh(record)
+        return ResumenVentaDiariaEntity.from_model(record)
+
+    def get_resumen(self, resumen_id: UUID) -> Optional[ResumenVentaDiariaEntity]:
+        record = self.db.get(ResumenVentaDiaria, resumen_id)
+        if not record:
+            return None
+        return ResumenVentaDiariaEntity.from_model(record)
+
+    def get_by_fecha(self, fecha: date) -> Optional[ResumenVentaDiariaEntity]:
+        record = (
+            self.db.query(ResumenVentaDiaria)
+            .filter(ResumenVentaDiaria.fecha == fecha)
+            .first()
+        )
+        if not record:
+            return None
+        return ResumenVentaDiariaEntity.from_model(record)
+
+    def list_resumenes(
+        self, *, desde: Optional[date] = None, hasta: Optional[date] = None
+    ) -> List[ResumenVentaDiariaEntity]:
+        query = self.db.query(ResumenVentaDiaria)
+        if desde:
+            query = query.filter(ResumenVentaDiaria.fecha >= desde)
+        if hasta:
+            query = query.filter(ResumenVentaDiaria.fecha <= hasta)
+        records = query.order_by(ResumenVentaDiaria.fecha.desc()).all()
+        return [ResumenVentaDiariaEntity.from_model(row) for row in records]
+
+    def apply_venta(
+        self,
+        fecha: datetime,
+        tipo_pago: Optional[str],
+        total: Decimal,
+        signo: int = 1,
+        cantidad: int = 1,
+    ) -> None:
+        """
+        Suma (signo=1) o resta (signo=-1) una venta al resumen de su dia.
+
+        ``total`` y ``cantidad`` pueden agrupar varias ventas del mismo dia y
+        tipo de pago (ingesta por lotes).
+
+        Se ejecuta como un unico INSERT ... ON CONFLICT DO UPDATE dentro de la
+        transaccion del llamador; el bloqueo de la fila del dia serializa las
+        ventas concurrentes sin perder incrementos. No hace commit.
+
+        Una resta que no encuentra la fila del dia o la dejaria negativa indica
+        que el resumen ya no cuadra con ``venta``: el dia queda pendiente y
+        ``rebuild_pendientes`` lo reconstruye antes del commit.
+        """
+        dia = ensure_utc_minus_5(fecha).date()
+        monto = Decimal(total)
+        columna = TOTAL_COLUMNS.get((tipo_pago or "credito").strip().lower(), "total_credito")
+        table = ResumenVentaDiaria.__table__
+        if signo < 0:
+            result = self.db.execute(
+                update(table)
+                .where(
+                    table.c.fecha == dia,
+                    table.c.total_ventas >= monto,
+                    table.c[columna] >= monto,
+                    table.c.cantidad_transacciones >= cantidad,
+                )
+                .values(
+                    {
+                        "total_ventas": table.c.total_ventas - monto,
+                        columna: table.c[columna] - monto,
+                        "cantidad_transacciones": table.c.cantidad_transacciones - cantidad,
+                        "updated_at": now_utc_minus_5(),
+                    }
+                )
+            )
+            if result.rowcount == 0:
+                logger.warning(
+                    "resumen_venta_diaria no cuadra con venta para %s; se reconstruye", dia
+                )
+                self._dias_pendientes.add(dia)
+            return
+
+        valores = {
+            "id": uuid4(),
+            "fecha": dia,
+            "total_ventas": monto,
+            "total_efectivo": Decimal("0.00"),
+            "total_tarjeta": Decimal("0.00"),
+            "total_transferencia": Decimal("0.00"),
+            "total_credito": Decimal("0.00"),
+            "cantidad_transacciones": cantidad,
+            "created_at": now_utc_minus_5(),
+        }
+        valores[columna] = monto
+        stmt = self._insert()(table).values(**valores)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.fecha],
+            set_={
+                "total_ventas": table.c.total_ventas + stmt.excluded.total_ventas,
+                columna: table.c[columna] + stmt.excluded[columna],
+                "cantidad_transacciones": (
+                    table.c.cantidad_transacciones + stmt.excluded.cantidad_transacciones
+                ),
+                "updated_at": now_utc_minus_5(),
+            },
+        )
+        self.db.execute(stmt)
+
+    def rebuild_pendientes(self) -> None:
+        """
+        Reconstruye desde ``venta`` los dias que ``apply_venta`` no pudo restar.
+        Va justo antes del commit, con la venta ya en su estado final. No hace commit.
+        """
+        dias = sorted(self._dias_pendientes)
+        self._dias_pendientes.clear()
+        for start in range(0, len(dias), REFRESH_MAX_DIAS):
+            self._refresh_chunk(dias[start : start + REFRESH_MAX_DIAS])
+
+    def refresh_dias(self, fechas: Iterable[date]) -> List[ResumenVentaDiariaEntity]:
+        dias = sorted(set(fechas))
+        for start in range(0, len(dias), REFRESH_MAX_DIAS):
+            self._refresh_chunk(dias[start : start + REFRESH_MAX_DIAS])
+        self.db.commit()
+        if not dias:
+            return []
+        return self.list_resumenes(desde=dias[0], hasta=dias[-1])
+
+    def refresh_rango(self, desde: date, hasta: date) -> List[ResumenVentaDiariaEntity]:
+        dias = [desde + timedelta(days=n) for n in range((hasta - desde).days + 1)]
+        return self.refresh_dias(dias)
+
+    def _refresh_chunk(self, dias: list[date]) -> None:
+        if not dias:
+            return
+        # Una sola consulta agrupada: cada rango diario cae en su propio
+        # bucket via CASE y el OR de rangos permite usar ix_venta_fecha.
+        rangos = [(dia, start_of_day(dia), end_of_day(dia)) for dia in dias]
+        dia_expr = case(
+            *[
+                (and_(Venta.fecha >= inicio, Venta.fecha <= fin), dia)
+                for dia, inicio, fin in rangos
+            ]
+        ).label("dia")
+        stmt = (
+            select(
+                dia_expr,
+                Venta.tipo_pago,
+                func.count(Venta.venta_id).label("cantidad"),
+                func.coalesce(func.sum(Venta.total), 0).label("total"),
+            )
+            .where(
+                Venta.estado.is_(True),
+                or_(
+                    *[
+                        and_(Venta.fecha >= inicio, Venta.fecha <= fin)
+                        for _, inicio, fin in rangos
+                    ]
+                ),
+            )
+            .group_by(dia_expr, Venta.tipo_pago)
+        )
+        acumulado = {dia: self._zero_totals() for dia in dias}
+        for row in self.db.execute(stmt):
+            dia = row.dia if isinstance(row.dia, date) else date.fromisoformat(str(row.dia))
+            totales = acumulado[dia]
+            columna = TOTAL_COLUMNS.get((row.tipo_pago or "credito").lower(), "total_credito")
+            totales["total_ventas"] += Decimal(row.total)
+            totales[columna] += Decimal(row.total)
+            totales["cantidad_transacciones"] += int(row.cantidad)
+
+        existentes = {
+            record.fecha: record
+            for record in self.db.query(ResumenVentaDiaria)
+            .filter(ResumenVentaDiaria.fecha.in_(dias))
+            .all()
+        }
+        now = now_utc_minus_5()
+        for dia, totales in acumulado.items():
+            record = existentes.get(dia)
+            if record is None:
+                record = ResumenVentaDiaria(fecha=dia, created_at=now)
+                self.db.add(record)
+            for campo, valor in totales.items():
+                setattr(record, campo, valor)
+            record.updated_at = now
+        self.db.flush()
+
+    def _zero_totals(self) -> dict[str, Decimal | int]:
+        totales: dict[str, Decimal | int] = {
+            "total_ventas": Decimal("0.00"),
+            "cantidad_transacciones": 0,
+        }
+        for columna in TOTAL_COLUMNS.values():
+            totales[columna] = Decimal("0.00")
+        return totales
+
+    def _insert(self):
+        if self.db.get_bind().dialect.name == "sqlite":
+            return sqlite_insert
+        return pg_insert
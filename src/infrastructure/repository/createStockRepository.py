@@ -3,13 +3,14 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import or_
+from sqlalchemy import or_, tuple_
 from sqlalchemy.orm import Session
 
-from domain.entities.stockEntity import StockEntity
-from domain.interfaces.stock_repository_interface import StockRepositoryInterface
-from src.infrastructure.models.models import Stock
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.domain.dtos.stockDto import StockBajoMinimoResponse
+from src.domain.entities.stockEntity import StockEntity
+from src.domain.interfaces.stock_repository_interface import StockRepositoryInterface
+from src.infrastructure.models.models import Categoria, Product, Stock
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class StockRepository(StockRepositoryInterface):
@@ -66,3 +67,45 @@ class StockRepository(StockRepositoryInterface):
             else self.db.query(Stock).all()
         )
         return [StockEntity.from_model(row) for row in records]
+
+    def list_bajo_minimo(
+        self,
+        *,
+        limit: int = 100,
+        cursor: Optional[tuple[int, int]] = None,
+        categoria_id: Optional[int] = None,
+        solo_activos: bool = True,
+    ) -> tuple[List[StockBajoMinimoResponse], Optional[tuple[int, int]]]:
+        # El filtro coincide con el predicado del indice parcial ix_stock_bajo_minimo.
+        query = (
+            self.db.query(
+                Stock.stock_id,
+                Stock.producto_id,
+                Product.nombre.label("producto_nombre"),
+                Product.codigo_barras,
+                Product.categoria_id,
+                Categoria.nombre.label("categoria_nombre"),
+                Stock.cantidad_actual,
+                Stock.cantidad_minima,
+                (Stock.cantidad_minima - Stock.cantidad_actual).label("faltante"),
+                Stock.ultima_actualizacion,
+            )
+            .join(Product, Product.producto_id == Stock.producto_id)
+            .outerjoin(Categoria, Categoria.categoria_id == Product.categoria_id)
+            .filter(Stock.cantidad_actual <= Stock.cantidad_minima)
+        )
+        if cursor is not None:
+            # producto_id no es unico en stock: el desempate es stock_id.
+            query = query.filter(tuple_(Stock.producto_id, Stock.stock_id) > tuple_(*cursor))
+        if categoria_id is not None:
+            query = query.filter(Product.categoria_id == categoria_id)
+        if solo_activos:
+            query = query.filter(Product.estado.is_(True))
+        rows = query.order_by(Stock.producto_id, Stock.stock_id).limit(limit + 1).all()
+
+        items = [
+            StockBajoMinimoResponse.model_validate(dict(row._mapping))
+            for row in rows[:limit]
+        ]
+        next_cursor = (items[-1].producto_id, items[-1].stock_id) if len(rows) > limit else None
+        return items, next_cursor
@@ -6,10 +6,10 @@ from typing import List, Optional
 from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
-from domain.entities.userEntity import UserEntity
-from domain.interfaces.user_repository_interface import UserRepositoryInterface
+from src.domain.entities.userEntity import UserEntity
+from src.domain.interfaces.user_repository_interface import UserRepositoryInterface
 from src.infrastructure.models.models import User
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class UserRepository(UserRepositoryInterface):
@@ -3,33 +3,85 @@ from __future__ import annotations
 import calendar
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional
 
-from sqlalchemy import or_, text
+from sqlalchemy import delete, func, insert, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, selectinload
 
-from domain.entities.ventaDetalleEntity import VentaDetalleEntity
-from domain.entities.ventaEntity import VentaEntity
-from domain.dtos.ventaDto import VentaResumenResponse
-from domain.interfaces.venta_repository_interface import VentaRepositoryInterface
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity
+from src.domain.entities.ventaEntity import VentaEntity
+from src.domain.dtos.ventaDto import (
+    VentaBatchItemResult,
+    VentaDetalleResponse,
+    VentaResponse,
+    VentaResumenResponse,
+)
+from src.domain.enums.stockEnums import RefMovimientoStock
+from src.domain.interfaces.venta_repository_interface import VentaRepositoryInterface
 from src.infrastructure.models.models import (
     AbonoCuenta,
     Cliente,
     CuentaCobrar,
     MovimientoFinanciero,
+    Product,
     Stock,
     User,
     Venta,
     VentaDetalle,
 )
-from utils.timezone import end_of_day, now_utc_minus_5, start_of_day
+from src.infrastructure.numero_factura import (
+    NumeroFacturaAllocator,
+    get_numero_factura_allocator,
+)
+from src.infrastructure.repository.createMovimientoStockRepository import (
+    MovimientoStockRepository,
+)
+from src.infrastructure.repository.createResumenVentaDiariaRepository import (
+    ResumenVentaDiariaRepository,
+)
+from src.utils.timezone import end_of_day, now_utc_minus_5, start_of_day
+
+VENTA_RESPONSE_COLUMNS = (
+    Venta.venta_id,
+    Venta.fecha,
+    Venta.subtotal,
+    Venta.impuesto,
+    Venta.descuento,
+    Venta.total,
+    Venta.tipo_pago,
+    Venta.es_credito,
+    Venta.estado,
+    Venta.nota_venta,
+    Venta.numero_factura,
+    Venta.cliente_id,
+    Venta.user_id,
+    Venta.idempotency_key,
+)
+VENTA_DETALLE_RESPONSE_COLUMNS = (
+    VentaDetalle.venta_detalle_id,
+    VentaDetalle.venta_id,
+    VentaDetalle.producto_id,
+    VentaDetalle.cantidad,
+    VentaDetalle.precio_unitario,
+    # Como VentaDetalleEntity: filas anteriores a la columna traen NULL.
+    func.coalesce(VentaDetalle.descuento, 0).label("descuento"),
+    VentaDetalle.subtotal,
+)
 
 
 class VentaRepository(VentaRepositoryInterface):
     """Repositorio para manejar operaciones relacionadas con ventas."""
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: Session,
+        numero_allocator: Optional[NumeroFacturaAllocator] = None,
+    ):
         self.db = db
+        self.resumen_repository = ResumenVentaDiariaRepository(db)
+        self.stock_repository = MovimientoStockRepository(db)
+        self._numero_allocator = numero_allocator
 
     def create_venta(
         self,
@@ -37,13 +89,13 @@ class VentaRepository(VentaRepositoryInterface):
         detalles: List[VentaDetalleEntity],
         stock_deltas: Optional[dict[int, int]] = None,
     ) -> VentaEntity:
+        if venta_entity.idempotency_key:
+            existing = self._get_by_idempotency_key(venta_entity.idempotency_key)
+            if existing:
+                return existing
         numero_factura = venta_entity.numero_factura
         if not numero_factura:
-            self.db.execute(text("CREATE SEQUENCE IF NOT EXISTS venta_numero_factura_seq"))
-            next_value = self.db.execute(
-                text("SELECT nextval('venta_numero_factura_seq')")
-            ).scalar_one()
-            numero_factura = f"POS-{int(next_value):06d}"
+            numero_factura = self._next_numeros_factura(1)[0]
         venta_orm = Venta(
             venta_id=venta_entity.venta_id,
             fecha=venta_entity.fecha,
@@ -58,6 +110,7 @@ class VentaRepository(VentaRepositoryInterface):
             numero_factura=numero_factura,
             cliente_id=venta_entity.cliente_id,
             user_id=venta_entity.user_id,
+            idempotency_key=venta_entity.idempotency_key,
         )
         self.db.add(venta_orm)
         self.db.flush()
@@ -93,19 +146,310 @@ class VentaRepository(VentaRepositoryInterface):
                 )
                 self.db.add(cuenta)
 
-        self._apply_stock_deltas(stock_deltas or {})
+        if venta_orm.estado:
+            self._apply_stock_deltas(
+                stock_deltas or {}, RefMovimientoStock.VENTA, venta_orm
+            )
+        self._apply_resumen(venta_orm, 1)
         self.db.commit()
         self.db.refresh(venta_orm)
         venta_orm.detalles = detalle_orms
         return VentaEntity.from_model(venta_orm)
 
-    def list_ventas(self) -> List[VentaEntity]:
-        records = (
-            self.db.query(Venta)
-            .options(selectinload(Venta.detalles).selectinload(VentaDetalle.producto))
-            .all()
+    def create_ventas_batch(
+        self,
+        ventas: List[tuple[int, VentaEntity, List[VentaDetalleEntity]]],
+    ) -> List[VentaBatchItemResult]:
+        """
+        Registra en una sola transaccion las ventas de un terminal sin conexion.
+
+        Cada venta trae ``idempotency_key``: las claves ya registradas (o
+        repetidas dentro del lote) se informan como duplicadas sin volver a
+        insertarse. Las referencias invalidas y las ventas sin stock suficiente
+        (descontado venta por venta en un savepoint) se informan por item; el
+        resto se inserta con INSERT multi-fila y un unico commit.
+        """
+        if not ventas:
+            return []
+        resultados: List[VentaBatchItemResult] = []
+        keys = {venta.idempotency_key for _, venta, _ in ventas}
+        registradas = {
+            key: (venta_id, numero_factura)
+            for key, venta_id, numero_factura in self.db.query(
+                Venta.idempotency_key, Venta.venta_id, Venta.numero_factura
+            ).filter(Venta.idempotency_key.in_(keys))
+        }
+        productos, clientes, usuarios = self._referencias_existentes(ventas)
+
+        pendientes: list[tuple[int, VentaEntity, List[VentaDetalleEntity]]] = []
+        repetidas: list[tuple[int, str]] = []
+        vistas: set[str] = set()
+        for index, venta, detalles in ventas:
+            key = venta.idempotency_key
+            if key in registradas or key in vistas:
+                repetidas.append((index, key))
+                continue
+            error = None
+            faltantes = sorted({d.producto_id for d in detalles} - productos)
+            if faltantes:
+                error = f"Productos no encontrados: {faltantes}"
+            elif venta.cliente_id is not None and venta.cliente_id not in clientes:
+                error = f"Cliente no encontrado: {venta.cliente_id}"
+            elif venta.user_id is not None and venta.user_id not in usuarios:
+                error = f"Usuario no encontrado: {venta.user_id}"
+            if error:
+                resultados.append(
+                    VentaBatchItemResult(
+                        index=index, idempotency_key=key, estado="error", error=error
+                    )
+                )
+                continue
+            vistas.add(key)
+            pendientes.append((index, venta, detalles))
+
+        try:
+            numeros = iter(
+                self._next_numeros_factura(
+                    sum(1 for _, venta, _ in pendientes if not venta.numero_factura)
+                )
+            )
+            filas = [
+                {
+                    "fecha": venta.fecha,
+                    "subtotal": venta.subtotal,
+                    "impuesto": venta.impuesto,
+                    "descuento": venta.descuento,
+                    "total": venta.total,
+                    "tipo_pago": venta.tipo_pago,
+                    "es_credito": venta.es_credito,
+                    "estado": venta.estado,
+                    "nota_venta": venta.nota_venta,
+                    "numero_factura": venta.numero_factura or next(numeros),
+                    "cliente_id": venta.cliente_id,
+                    "user_id": venta.user_id,
+                    "idempotency_key": venta.idempotency_key,
+                }
+                for _, venta, _ in pendientes
+            ]
+            insertadas: dict[str, tuple[int, str]] = {}
+            if filas:
+                # Un reintento concurrente con la misma clave no falla: queda fuera
+                # de RETURNING y se reporta como duplicada.
+                stmt = (
+                    pg_insert(Venta)
+                    .on_conflict_do_nothing(index_elements=["idempotency_key"])
+                    .returning(Venta.idempotency_key, Venta.venta_id, Venta.numero_factura)
+                )
+                insertadas = {
+                    key: (venta_id, numero_factura)
+                    for key, venta_id, numero_factura in self.db.execute(stmt, filas)
+                }
+
+            detalle_filas = []
+            rechazadas = []
+            cuenta_filas = []
+            resumen: dict[tuple[date, Optional[str]], list] = {}
+            vencimiento = self._fecha_vencimiento_credito()
+            for fila, (index, venta, detalles) in zip(filas, pendientes):
+                key = venta.idempotency_key
+                if key not in insertadas:
+                    repetidas.append((index, key))
+                    continue
+                venta_id, numero_factura = insertadas[key]
+                if venta.estado:
+                    referencia = f"VENTA-{venta_id}"
+                    try:
+                        with self.db.begin_nested():
+                            self.stock_repository.apply_deltas(
+                                (
+                                    (detalle.producto_id, -int(detalle.cantidad), referencia)
+                                    for detalle in detalles
+                                ),
+                                ref=RefMovimientoStock.VENTA,
+                                realizado_por_id=venta.user_id,
+                            )
+                    except ValueError as exc:
+                        rechazadas.append(venta_id)
+                        resultados.append(
+                            VentaBatchItemResult(
+                                index=index, idempotency_key=key, estado="error", error=str(exc)
+                            )
+                        )
+                        continue
+                detalle_filas.extend(
+                    {
+                        "venta_id": venta_id,
+                        "producto_id": detalle.producto_id,
+                        "cantidad": detalle.cantidad,
+                        "precio_unitario": detalle.precio_unitario,
+                        "descuento": detalle.descuento,
+                        "subtotal": detalle.subtotal,
+                    }
+                    for detalle in detalles
+                )
+                if venta.es_credito and venta.estado:
+                    cuenta_filas.append(
+                        {
+                            "venta_id": venta_id,
+                            "cliente_id": venta.cliente_id,
+                            "total": venta.total,
+                            "saldo": venta.total,
+                            "fecha_vencimiento": vencimiento,
+                            "estado": "PENDIENTE",
+                        }
+                    )
+                if venta.estado:
+                    acumulado = resumen.setdefault(
+                        (venta.fecha.date(), venta.tipo_pago), [venta.fecha, Decimal("0.00"), 0]
+                    )
+                    acumulado[1] += Decimal(venta.total)
+                    acumulado[2] += 1
+                resultados.append(
+                    VentaBatchItemResult(
+                        index=index,
+                        idempotency_key=key,
+                        estado="creada",
+                        venta_id=venta_id,
+                        numero_factura=numero_factura,
+                    )
+                )
+
+            if rechazadas:
+                self.db.execute(delete(Venta).where(Venta.venta_id.in_(rechazadas)))
+            if detalle_filas:
+                self.db.execute(insert(VentaDetalle), detalle_filas)
+            if cuenta_filas:
+                self.db.execute(insert(CuentaCobrar), cuenta_filas)
+            for (_, tipo_pago), (fecha, total, cantidad) in resumen.items():
+                self.resumen_repository.apply_venta(fecha, tipo_pago, total, 1, cantidad)
+            self.db.commit()
+        except Exception as exc:
+            self.db.rollback()
+            raise ValueError(f"No fue posible registrar el lote de ventas: {exc}") from exc
+
+        if repetidas:
+            previas = {
+                key: (venta_id, numero_factura)
+                for key, venta_id, numero_factura in self.db.query(
+                    Venta.idempotency_key, Venta.venta_id, Venta.numero_factura
+                ).filter(Venta.idempotency_key.in_({key for _, key in repetidas}))
+            }
+            for index, key in repetidas:
+                venta_id, numero_factura = previas.get(key, (None, None))
+                resultados.append(
+                    VentaBatchItemResult(
+                        index=index,
+                        idempotency_key=key,
+                        estado="duplicada",
+                        venta_id=venta_id,
+                        numero_factura=numero_factura,
+                    )
+                )
+        resultados.sort(key=lambda resultado: resultado.index)
+        return resultados
+
+    def list_ventas(self) -> List[VentaResponse]:
+        stmt = select(*VENTA_RESPONSE_COLUMNS)
+        return self._to_venta_responses(self.db.execute(stmt).mappings().all(), todas=True)
+
+    def list_ventas_page(
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        limit: int = 50,
+        cursor: Optional[tuple[datetime, int]] = None,
+    ) -> tuple[List[VentaResponse], Optional[tuple[datetime, int]]]:
+        stmt = select(*VENTA_RESPONSE_COLUMNS)
+        if desde:
+            stmt = stmt.where(Venta.fecha >= start_of_day(desde))
+        if hasta:
+            stmt = stmt.where(Venta.fecha <= end_of_day(hasta))
+        if cursor is not None:
+            # Comparacion de filas: usa ix_venta_fecha sin OFFSET.
+            stmt = stmt.where(tuple_(Venta.fecha, Venta.venta_id) < tuple_(*cursor))
+        rows = self.db.execute(
+            stmt.order_by(Venta.fecha.desc(), Venta.venta_id.desc()).limit(limit + 1)
+        ).mappings().all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]["fecha"], rows[-1]["venta_id"])
+        return self._to_venta_responses(rows, todas=False), next_cursor
+
+    def _to_venta_responses(self, rows, *, todas: bool) -> List[VentaResponse]:
+        """
+        Arma las respuestas desde columnas proyectadas con ``model_construct``:
+        los datos vienen de la base y ya se validaron al escribirse, asi que
+        no pasan por VentaEntity ni por una segunda validacion del DTO. Los
+        detalles salen de una sola consulta (todas o solo las de la pagina).
+        """
+        if not rows:
+            return []
+        stmt = (
+            select(*VENTA_DETALLE_RESPONSE_COLUMNS, Product.nombre.label("producto_nombre"))
+            .outerjoin(Product, Product.producto_id == VentaDetalle.producto_id)
+            .order_by(VentaDetalle.venta_id, VentaDetalle.venta_detalle_id)
         )
-        return [VentaEntity.from_model(row) for row in records]
+        if not todas:
+            stmt = stmt.where(VentaDetalle.venta_id.in_([row["venta_id"] for row in rows]))
+        detalles: dict[int, list[VentaDetalleResponse]] = {}
+        for detalle in self.db.execute(stmt).mappings():
+            detalles.setdefault(detalle["venta_id"], []).append(
+                VentaDetalleResponse.model_construct(**detalle)
+            )
+        return [
+            VentaResponse.model_construct(**row, detalles=detalles.get(row["venta_id"], []))
+            for row in rows
+        ]
+
+    def iter_ventas_export(
+        self,
+        *,
+        desde: Optional[date] = None,
+        hasta: Optional[date] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[dict[str, Any]]:
+        stmt = (
+            select(
+                Venta.venta_id,
+                Venta.fecha,
+                Venta.numero_factura,
+                Venta.tipo_pago,
+                Venta.es_credito,
+                Venta.estado,
+                Venta.cliente_id,
+                Venta.user_id,
+                Venta.subtotal.label("venta_subtotal"),
+                Venta.impuesto.label("venta_impuesto"),
+                Venta.descuento.label("venta_descuento"),
+                Venta.total.label("venta_total"),
+                Venta.nota_venta,
+                VentaDetalle.venta_detalle_id,
+                VentaDetalle.producto_id,
+                Product.nombre.label("producto_nombre"),
+                VentaDetalle.cantidad,
+                VentaDetalle.precio_unitario,
+                VentaDetalle.descuento.label("detalle_descuento"),
+                VentaDetalle.subtotal.label("detalle_subtotal"),
+            )
+            .outerjoin(VentaDetalle, VentaDetalle.venta_id == Venta.venta_id)
+            .outerjoin(Product, Product.producto_id == VentaDetalle.producto_id)
+        )
+        if desde:
+            stmt = stmt.where(Venta.fecha >= start_of_day(desde))
+        if hasta:
+            stmt = stmt.where(Venta.fecha <= end_of_day(hasta))
+        stmt = stmt.order_by(Venta.fecha, Venta.venta_id, VentaDetalle.venta_detalle_id)
+
+        # yield_per activa stream_results: el driver entrega filas por lotes
+        # desde un cursor del servidor en vez de cargar todo el resultado.
+        result = self.db.execute(stmt, execution_options={"yield_per": batch_size})
+        try:
+            for row in result.mappings():
+                yield dict(row)
+        finally:
+            result.close()
 
     def list_ventas_resumen(
         self,
@@ -184,7 +528,23 @@ class VentaRepository(VentaRepositoryInterface):
         record = self.db.get(Venta, venta_id)
         if not record:
             return None
+        estaba_activa = bool(record.estado)
+        if estaba_activa and not estado:
+            self._apply_resumen(record, -1)
         record.estado = estado
+        if estado and not estaba_activa:
+            self._apply_resumen(record, 1)
+        if estado != estaba_activa:
+            signo = -1 if estado else 1
+            self._apply_stock_deltas(
+                {
+                    producto_id: signo * cantidad
+                    for producto_id, cantidad in self._cantidades_vendidas(venta_id).items()
+                },
+                RefMovimientoStock.VENTA if estado else RefMovimientoStock.ANULACION_VENTA,
+                record,
+            )
+        self.resumen_repository.rebuild_pendientes()
         self.db.commit()
         self.db.refresh(record)
         return VentaEntity.from_model(record)
@@ -214,6 +574,7 @@ class VentaRepository(VentaRepositoryInterface):
             record.nota_venta = f"{record.nota_venta} | {nota_anulacion}"
         else:
             record.nota_venta = nota_anulacion
+        self._apply_resumen(record, -1)
         record.estado = False
 
         cuenta = (
@@ -248,7 +609,13 @@ class VentaRepository(VentaRepositoryInterface):
                 )
             )
 
-        self._apply_stock_deltas(stock_deltas or {})
+        self._apply_stock_deltas(
+            stock_deltas or {},
+            RefMovimientoStock.ANULACION_VENTA,
+            record,
+            nota=motivo_texto or None,
+        )
+        self.resumen_repository.rebuild_pendientes()
         self.db.commit()
         self.db.refresh(record)
         return VentaEntity.from_model(record)
@@ -268,6 +635,9 @@ class VentaRepository(VentaRepositoryInterface):
         if not record:
             return None
 
+        estaba_activa = bool(record.estado)
+        cantidades_previas = self._sumar_cantidades(record.detalles)
+        self._apply_resumen(record, -1)
         record.fecha = venta_entity.fecha
         record.subtotal = venta_entity.subtotal
         record.impuesto = venta_entity.impuesto
@@ -280,6 +650,8 @@ class VentaRepository(VentaRepositoryInterface):
         record.numero_factura = venta_entity.numero_factura
         record.cliente_id = venta_entity.cliente_id
         record.user_id = venta_entity.user_id
+        # Los detalles se reemplazan aparte; la marca cambia aunque la fila no.
+        record.updated_at = now_utc_minus_5()
 
         tipo_pago = (record.tipo_pago or "").strip().lower()
         should_be_credito = (bool(record.es_credito) or tipo_pago == "credito") and bool(record.estado)
@@ -339,7 +711,22 @@ class VentaRepository(VentaRepositoryInterface):
             if detalle_orms:
                 self.db.add_all(detalle_orms)
 
-        self._apply_stock_deltas(stock_deltas or {})
+        activa = bool(record.estado)
+        if estaba_activa and activa:
+            deltas = stock_deltas or {}
+        elif estaba_activa:
+            # La edicion desactiva la venta: vuelve al stock lo vendido.
+            deltas = cantidades_previas
+        elif activa:
+            cantidades = self._sumar_cantidades(
+                detalles if detalles is not None else record.detalles
+            )
+            deltas = {producto_id: -cantidad for producto_id, cantidad in cantidades.items()}
+        else:
+            deltas = {}
+        self._apply_stock_deltas(deltas, RefMovimientoStock.EDICION_VENTA, record)
+        self._apply_resumen(record, 1)
+        self.resumen_repository.rebuild_pendientes()
         self.db.commit()
         self.db.refresh(record)
         if detalles is not None:
@@ -373,42 +760,121 @@ class VentaRepository(VentaRepositoryInterface):
                 synchronize_session=False,
             )
 
+            if record.estado:
+                self._apply_stock_deltas(
+                    self._cantidades_vendidas(venta_id),
+                    RefMovimientoStock.ANULACION_VENTA,
+                    record,
+                    nota="Venta eliminada",
+                )
             self.db.query(VentaDetalle).filter(
                 VentaDetalle.venta_id == venta_id
             ).delete(synchronize_session=False)
 
+            self._apply_resumen(record, -1)
             self.db.delete(record)
+            self.resumen_repository.rebuild_pendientes()
             self.db.commit()
             return True
         except Exception as exc:
             self.db.rollback()
             raise ValueError(f"No fue posible eliminar la venta {venta_id}: {exc}") from exc
 
-    def _apply_stock_deltas(self, deltas: dict[int, int]) -> None:
-        # Deshabilitado temporalmente: no validar ni ajustar stock.
-        return
-        if not deltas:
-            return
-        now = now_utc_minus_5()
-        for producto_id, delta in deltas.items():
-            if delta == 0:
-                continue
-            record = (
-                self.db.query(Stock)
-                .filter(Stock.producto_id == producto_id)
-                .with_for_update()
-                .first()
+    def _apply_stock_deltas(
+        self,
+        deltas: dict[int, int],
+        ref: RefMovimientoStock,
+        record: Venta,
+        *,
+        nota: Optional[str] = None,
+    ) -> None:
+        try:
+            self.stock_repository.apply_deltas(
+                (
+                    (producto_id, delta, f"VENTA-{record.venta_id}")
+                    for producto_id, delta in deltas.items()
+                ),
+                ref=ref,
+                realizado_por_id=record.user_id,
+                nota=nota,
             )
-            if not record:
-                raise ValueError(f"Stock no encontrado para producto {producto_id}")
-            nueva_cantidad = int(record.cantidad_actual) + int(delta)
-            if nueva_cantidad < 0:
-                raise ValueError(
-                    f"Stock insuficiente para producto {producto_id} "
-                    f"(disponible {record.cantidad_actual}, ajuste {delta})"
-                )
-            record.cantidad_actual = nueva_cantidad
-            record.ultima_actualizacion = now
+        except ValueError:
+            self.db.rollback()
+            raise
+
+    def _next_numeros_factura(self, cantidad: int) -> list[str]:
+        if self._numero_allocator is None:
+            self._numero_allocator = get_numero_factura_allocator()
+        return self._numero_allocator.next_numeros(cantidad)
+
+    def _get_by_idempotency_key(self, key: str) -> Optional[VentaEntity]:
+        record = (
+            self.db.query(Venta)
+            .options(selectinload(Venta.detalles))
+            .filter(Venta.idempotency_key == key)
+            .first()
+        )
+        return VentaEntity.from_model(record) if record else None
+
+    def _referencias_existentes(
+        self, ventas: List[tuple[int, VentaEntity, List[VentaDetalleEntity]]]
+    ) -> tuple[set[int], set[Any], set[int]]:
+        producto_ids = {d.producto_id for _, _, detalles in ventas for d in detalles}
+        cliente_ids = {v.cliente_id for _, v, _ in ventas if v.cliente_id is not None}
+        user_ids = {v.user_id for _, v, _ in ventas if v.user_id is not None}
+        productos = (
+            set(
+                self.db.execute(
+                    select(Product.producto_id).where(Product.producto_id.in_(producto_ids))
+                ).scalars()
+            )
+            if producto_ids
+            else set()
+        )
+        clientes = (
+            set(
+                self.db.execute(
+                    select(Cliente.id).where(Cliente.id.in_(cliente_ids))
+                ).scalars()
+            )
+            if cliente_ids
+            else set()
+        )
+        usuarios = (
+            set(
+                self.db.execute(
+                    select(User.user_id).where(User.user_id.in_(user_ids))
+                ).scalars()
+            )
+            if user_ids
+            else set()
+        )
+        return productos, clientes, usuarios
+
+    def _cantidades_vendidas(self, venta_id: int) -> dict[int, int]:
+        rows = (
+            self.db.query(VentaDetalle.producto_id, func.sum(VentaDetalle.cantidad))
+            .filter(VentaDetalle.venta_id == venta_id)
+            .group_by(VentaDetalle.producto_id)
+            .all()
+        )
+        return {int(producto_id): int(cantidad) for producto_id, cantidad in rows}
+
+    def _sumar_cantidades(self, detalles) -> dict[int, int]:
+        cantidades: dict[int, int] = {}
+        for detalle in detalles or []:
+            cantidades[detalle.producto_id] = (
+                cantidades.get(detalle.producto_id, 0) + int(detalle.cantidad)
+            )
+        return cantidades
+
+    def _apply_resumen(self, record: Venta, signo: int) -> None:
+        # Solo las ventas vigentes cuentan en resumen_venta_diaria.
+        if not bool(record.estado):
+            return
+        self.resumen_repository.apply_venta(
+            record.fecha, record.tipo_pago, record.total, signo
+        )
 
     def _fecha_vencimiento_credito(self) -> date:
         hoy = now_utc_minus_5().date()
@@ -6,10 +6,10 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from domain.entities.visitaEntity import VisitaEntity
-from domain.interfaces.visita_repository_interface import VisitaRepositoryInterface
+from src.domain.entities.visitaEntity import VisitaEntity
+from src.domain.interfaces.visita_repository_interface import VisitaRepositoryInterface
 from src.infrastructure.models.models import Visita
-from utils.timezone import ensure_utc_minus_5, now_utc_minus_5
+from src.utils.timezone import ensure_utc_minus_5, now_utc_minus_5
 
 
 class VisitaRepository(VisitaRepositoryInterface):
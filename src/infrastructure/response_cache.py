@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional
+
+logger = logging.getLogger("response_cache")
+
+CACHE_PRODUCTOS = "productos"
+CACHE_CATEGORIAS = "categorias"
+CACHE_CONTABILIDAD_CATEGORIAS = "contabilidad_categorias"
+CACHE_PROVEEDORES = "proveedores"
+CACHE_CAJAS = "cajas"
+
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_ENTRIES = 256
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    body: bytes
+
+
+class CacheBackend(ABC):
+    """Almacen de respuestas serializadas y de la version de cada espacio."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def version(self, namespace: str) -> int:
+        raise NotImplementedError
+
+    @abstractmethod
+    def bump(self, namespace: str) -> int:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU con expiracion en memoria del proceso."""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._items: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        # Las versiones no entran al LRU: si se expulsaran volverian a 0 y
+        # reactivarian claves viejas.
+        self._versions: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= self._clock():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        with self._lock:
+            self._items[key] = (self._clock() + ttl_seconds, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    def bump(self, namespace: str) -> int:
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            return self._versions[namespace]
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend compartido entre procesos sobre cualquier cliente compatible con Redis."""
+
+    def __init__(self, client, *, prefix: str = "apipos:cache"):
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        try:
+            import redis
+        except ImportError as exc:
+            raise RuntimeError("RESPONSE_CACHE_URL requiere el paquete redis") from exc
+        return cls(redis.Redis.from_url(url))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(f"{self.prefix}:{key}")
+
+    def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self.client.set(f"{self.prefix}:{key}", value, ex=ttl_seconds)
+
+    def version(self, namespace: str) -> int:
+        return int(self.client.get(f"{self.prefix}:version:{namespace}") or 0)
+
+    def bump(self, namespace: str) -> int:
+        return int(self.client.incr(f"{self.prefix}:version:{namespace}"))
+
+
+class ResponseCache:
+    """
+    Cache de respuestas GET por espacio (catalogo) y ruta + query.
+
+    Cada espacio tiene un numero de version que forma parte de la clave;
+    invalidar solo incrementa la version, asi que una carga concurrente que
+    leyo datos viejos los guarda bajo una clave que ya nadie consulta. Con el
+    backend en memoria la invalidacion es local al proceso y los demas
+    workers ven el cambio al vencer el TTL.
+    """
+
+    def __init__(self, backend: CacheBackend, *, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.backend = backend
+        self.ttl_seconds = int(ttl_seconds)
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        url = os.getenv("RESPONSE_CACHE_URL")
+        if url:
+            backend: CacheBackend = RedisCacheBackend.from_url(url)
+        else:
+            backend = MemoryCacheBackend(
+                int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", str(DEFAULT_MAX_ENTRIES)))
+            )
+        return cls(
+            backend,
+            ttl_seconds=int(os.getenv("RESPONSE_CACHE_TTL", str(DEFAULT_TTL_SECONDS))),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def key(self, namespace: str, route_key: str) -> Optional[str]:
+        """Clave versionada; ``None`` si la cache esta apagada o no responde."""
+        if not self.enabled:
+            return None
+        try:
+            version = self.backend.version(namespace)
+        except Exception:
+            logger.warning("No se pudo leer la version de cache %s", namespace, exc_info=True)
+            return None
+        return f"{namespace}:{version}:{route_key}"
+
+    def get(self, key: Optional[str]) -> Optional[CachedResponse]:
+        if key is None:
+            return None
+        try:
+            raw = self.backend.get(key)
+        except Exception:
+            logger.warning("Fallo la lectura de cache %s", key, exc_info=True)
+            return None
+        if raw is None:
+            return None
+        etag, _, body = raw.partition(b"\n")
+        return CachedResponse(etag.decode("ascii"), body)
+
+    def set(self, key: Optional[str], body: bytes) -> CachedResponse:
+        entry = CachedResponse(make_etag(body), body)
+        if key is not None:
+            try:
+                self.backend.set(key, entry.etag.encode("ascii") + b"\n" + body, self.ttl_seconds)
+            except Exception:
+                logger.warning("Fallo la escritura de cache %s", key, exc_info=True)
+        return entry
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            try:
+                self.backend.bump(namespace)
+            except Exception:
+                logger.warning("No se pudo invalidar la cache %s", namespace, exc_info=True)
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+response_cache = ResponseCache.from_env()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.config import get_async_db, get_db
+from src.infrastructure.models.models import Cliente, CuentaCobrar, Product, Venta
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparacion debil de If-None-Match (RFC 9110): se ignora el prefijo W/."""
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def weak_etag(*parts: Any) -> str:
+    raw = ":".join(str(part) for part in parts).encode("utf-8")
+    return 'W/"' + hashlib.blake2b(raw, digest_size=12).hexdigest() + '"'
+
+
+def _path_identifier(request: Request, path_param: str, python_type: type) -> Any:
+    try:
+        return python_type(request.path_params[path_param])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _apply_etag(
+    request: Request, response: Response, tabla: str, identifier: Any, version: Any
+) -> Optional[str]:
+    if version is None:
+        return None
+    etag = weak_etag(tabla, identifier, version.isoformat())
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return etag
+
+
+def row_version_etag(version_column, pk_column, path_param: str) -> Callable[..., Optional[str]]:
+    """
+    Dependencia para GET de un recurso: lee solo ``version_column`` por clave
+    primaria y, si coincide con If-None-Match, corta con 304 antes de que el
+    endpoint cargue la fila y sus relaciones. Si la fila no existe no hace
+    nada y deja que el endpoint responda 404.
+    """
+    tabla = pk_column.class_.__tablename__
+    python_type = pk_column.type.python_type
+
+    def dependency(
+        request: Request,
+        response: Response,
+        db: Session = Depends(get_db),
+    ) -> Optional[str]:
+        identifier = _path_identifier(request, path_param, python_type)
+        if identifier is None:
+            return None
+        version = db.execute(
+            select(version_column).where(pk_column == identifier)
+        ).scalar_one_or_none()
+        return _apply_etag(request, response, tabla, identifier, version)
+
+    return dependency
+
+
+def async_row_version_etag(
+    version_column, pk_column, path_param: str
+) -> Callable[..., Awaitable[Optional[str]]]:
+    """``row_version_etag`` para rutas async: consulta con la AsyncSession del request."""
+    tabla = pk_column.class_.__tablename__
+    python_type = pk_column.type.python_type
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(get_async_db),
+    ) -> Optional[str]:
+        identifier = _path_identifier(request, path_param, python_type)
+        if identifier is None:
+            return None
+        version = (
+            await db.execute(select(version_column).where(pk_column == identifier))
+        ).scalar_one_or_none()
+        return _apply_etag(request, response, tabla, identifier, version)
+
+    return dependency
+
+
+# GET /productos/{id} es una ruta async.
+product_etag = async_row_version_etag(
+    Product.fecha_actualizacion, Product.producto_id, "product_id"
+)
+venta_etag = row_version_etag(Venta.updated_at, Venta.venta_id, "venta_id")
+cliente_etag = row_version_etag(Cliente.updated_at, Cliente.id, "cliente_id")
+cuenta_cobrar_etag = row_version_etag(
+    func.coalesce(CuentaCobrar.updated_at, CuentaCobrar.created_at),
+    CuentaCobrar.id,
+    "cuenta_id",
+)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.infrastructure.db import LatencyHistogram
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def metrics_enabled() -> bool:
+    """``REQUEST_METRICS``: middleware, hooks de consultas y /metrics. Apagado no cuesta nada."""
+    return os.getenv("REQUEST_METRICS", "").strip().lower() in {"1", "true", "yes", "on"}
+
+
+@dataclass
+class RequestStats:
+    """Consultas y tiempo de base de un request; lo llenan los hooks del engine."""
+
+    queries: int = 0
+    db_ms: float = 0.0
+
+
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+@dataclass
+class RouteMetrics:
+    duration: LatencyHistogram = field(default_factory=LatencyHistogram)
+    db: LatencyHistogram = field(default_factory=LatencyHistogram)
+    queries: int = 0
+    responses: dict[int, int] = field(default_factory=dict)
+
+
+class MetricsRegistry:
+    """Metricas por (metodo, plantilla de ruta) del proceso."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str], RouteMetrics] = {}
+
+    def observe(
+        self, method: str, route: str, status: int, duration_ms: float, stats: RequestStats
+    ) -> None:
+        with self._lock:
+            metrics = self._routes.get((method, route))
+            if metrics is None:
+                metrics = self._routes[(method, route)] = RouteMetrics()
+            metrics.duration.observe(duration_ms)
+            metrics.db.observe(stats.db_ms)
+            metrics.queries += stats.queries
+            metrics.responses[status] = metrics.responses.get(status, 0) + 1
+
+    def render_prometheus(self) -> str:
+        """Formato de texto de Prometheus (0.0.4); los tiempos en segundos."""
+        with self._lock:
+            rutas = sorted(self._routes.items())
+            lineas = [
+                "# HELP http_request_duration_seconds Duracion de los requests por ruta.",
+                "# TYPE http_request_duration_seconds histogram",
+            ]
+            for (method, route), metrics in rutas:
+                lineas += _histogram(
+                    "http_request_duration_seconds", _labels(method, route), metrics.duration
+                )
+            lineas += [
+                "# HELP http_request_db_duration_seconds Tiempo en la base por request.",
+                "# TYPE http_request_db_duration_seconds histogram",
+            ]
+            for (method, route), metrics in rutas:
+                lineas += _histogram(
+                    "http_request_db_duration_seconds", _labels(method, route), metrics.db
+                )
+            lineas += [
+                "# HELP http_request_db_queries_total Consultas a la base por ruta.",
+                "# TYPE http_request_db_queries_total counter",
+            ]
+            for (method, route), metrics in rutas:
+                lineas.append(
+                    f"http_request_db_queries_total{{{_labels(method, route)}}} {metrics.queries}"
+                )
+            lineas += [
+                "# HELP http_responses_total Respuestas por ruta y codigo de estado.",
+                "# TYPE http_responses_total counter",
+            ]
+            for (method, route), metrics in rutas:
+                labels = _labels(method, route)
+                for status, cantidad in sorted(metrics.responses.items()):
+                    lineas.append(f'http_responses_total{{{labels},status="{status}"}} {cantidad}')
+        return "\n".join(lineas) + "\n"
+
+
+def _labels(method: str, route: str) -> str:
+    route = route.replace("\\", "\\\\").replace('"', '\\"')
+    return f'method="{method}",route="{route}"'
+
+
+def _histogram(name: str, labels: str, histogram: LatencyHistogram) -> list[str]:
+    lineas = []
+    acumulado = 0
+    for limite, cantidad in zip((*histogram.buckets_ms, None), histogram.counts):
+        acumulado += cantidad
+        le = "+Inf" if limite is None else f"{limite / 1000:g}"
+        lineas.append(f'{name}_bucket{{{labels},le="{le}"}} {acumulado}')
+    lineas.append(f"{name}_sum{{{labels}}} {histogram.sum_ms / 1000:.6f}")
+    lineas.append(f"{name}_count{{{labels}}} {histogram.total}")
+    return lineas
+
+
+registry = MetricsRegistry()
+
+
+def instrument_queries(engine: Engine) -> None:
+    """
+    Cuenta y cronometra cada sentencia del engine dentro del request en
+    curso. Fuera de un request (jobs, lifespan) los hooks no registran nada.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("request_metrics_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        stats = _current.get()
+        inicios = conn.info.get("request_metrics_start")
+        if stats is None or not inicios:
+            return
+        stats.queries += 1
+        stats.db_ms += (time.perf_counter() - inicios.pop()) * 1000
+
+
+class RequestMetricsMiddleware:
+    """
+    Middleware ASGI: mide cada request HTTP, agrega ``Server-Timing``
+    (``app`` y ``db``) a la respuesta y registra la ruta por su plantilla
+    (``/productos/{product_id}``) para acotar las series.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = registry, server_timing: bool = True):
+        self.app = app
+        self.registry = registry
+        self.server_timing = server_timing
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        inicio = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    app_ms = (time.perf_counter() - inicio) * 1000
+                    valor = (
+                        f'app;dur={app_ms:.1f}, '
+                        f'db;dur={stats.db_ms:.1f};desc="{stats.queries} queries"'
+                    )
+                    message = {
+                        **message,
+                        "headers": [
+                            *message.get("headers", []),
+                            (b"server-timing", valor.encode("latin-1")),
+                        ],
+                    }
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            self.registry.observe(
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                status_code,
+                (time.perf_counter() - inicio) * 1000,
+                stats,
+            )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    # Dinero como texto, igual que la serializacion JSON de Pydantic.
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Tipo no serializable a JSON: {type(value).__name__}")
+
+
+class POSJSONResponse(JSONResponse):
+    """
+    Respuesta JSON por defecto de la API renderizada con orjson. FastAPI ya
+    entrega el contenido en modo JSON (Decimal como texto cuando hay
+    response_model); orjson reemplaza a ``json.dumps`` y maneja datetime y
+    UUID de forma nativa.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
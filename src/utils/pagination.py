@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+
+from src.utils.timezone import ensure_utc_minus_5
+
+CURSOR_SEPARATOR = "|"
+
+
+def encode_cursor(fecha: datetime, item_id: int) -> str:
+    """Codifica la posicion (fecha, id) del ultimo elemento de una pagina."""
+    raw = f"{ensure_utc_minus_5(fecha).isoformat()}{CURSOR_SEPARATOR}{int(item_id)}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decodifica un cursor generado por `encode_cursor`."""
+    value = (cursor or "").strip()
+    if not value:
+        raise ValueError("Cursor invalido")
+    padding = "=" * (-len(value) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(value + padding).decode("utf-8")
+        fecha_raw, id_raw = raw.rsplit(CURSOR_SEPARATOR, 1)
+        return ensure_utc_minus_5(datetime.fromisoformat(fecha_raw)), int(id_raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor invalido") from None
+
+
+def encode_key_cursor(*ids: int) -> str:
+    """Codifica una clave compuesta de ids (por ejemplo producto_id, stock_id)."""
+    raw = CURSOR_SEPARATOR.join(str(int(item_id)) for item_id in ids)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_key_cursor(cursor: str, size: int) -> tuple[int, ...]:
+    """Decodifica un cursor de `encode_key_cursor` con ``size`` ids."""
+    value = (cursor or "").strip()
+    if not value:
+        raise ValueError("Cursor invalido")
+    padding = "=" * (-len(value) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(value + padding).decode("utf-8")
+        ids = tuple(int(item_id) for item_id in raw.split(CURSOR_SEPARATOR))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor invalido") from None
+    if len(ids) != size:
+        raise ValueError("Cursor invalido")
+    return ids
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import IO, Any, Iterator, Union
+
+
+def open_xlsx_rows(source: Union[str, IO[bytes]]) -> Iterator[tuple[Any, ...]]:
+    """
+    Abre la hoja activa en modo solo lectura y devuelve sus filas como tuplas.
+
+    El libro se carga aqui (los errores de formato salen de inmediato); las
+    filas se leen de forma incremental sin cargar la hoja completa en memoria.
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(source, read_only=True, data_only=True)
+
+    def _rows() -> Iterator[tuple[Any, ...]]:
+        try:
+            yield from workbook.active.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    return _rows()
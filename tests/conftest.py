@@ -1,5 +1,13 @@
+import sys
+from pathlib import Path
+
 import pytest
 
+# Los modulos de la app se importan siempre como ``src.*``.
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
 @pytest.fixture
 def sample_data():
     return {
@@ -0,0 +1,34 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from src.domain.services.product_service import ProductBarcodeIndex  # noqa: E402
+
+
+def test_stale_index_is_refreshed_by_one_thread_while_others_read_old_map():
+    index = ProductBarcodeIndex(ttl_seconds=0)
+    index.load([SimpleNamespace(producto_id=1, codigo_barras="770", nombre="viejo")])
+    en_carga = threading.Event()
+    liberar = threading.Event()
+    cargas = []
+
+    def loader():
+        cargas.append(1)
+        en_carga.set()
+        liberar.wait(5)
+        return [SimpleNamespace(producto_id=1, codigo_barras="770", nombre="nuevo")]
+
+    recarga = threading.Thread(target=index.refresh_if_stale, args=(loader,))
+    recarga.start()
+    assert en_carga.wait(5)
+
+    assert index.refresh_if_stale(loader) is False
+    assert index.get("770").nombre == "viejo"
+
+    liberar.set()
+    recarga.join(5)
+    assert len(cargas) == 1
+    assert index.get("770").nombre == "nuevo"
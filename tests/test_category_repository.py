@@ -2,9 +2,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 import pytest
 
-from domain.entities.categoryEntity import CategoryEntity
-from infrastructure.models.models import Base, Category
-from infrastructure.repository.createCategoryRepository import CategoryRepository
+from src.domain.entities.categoryEntity import CategoryEntity
+from src.infrastructure.models.models import Base, Category
+from src.infrastructure.repository.createCategoryRepository import CategoryRepository
 
 
 @pytest.fixture
@@ -0,0 +1,63 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from src.infrastructure.numero_factura import NumeroFacturaAllocator
+
+
+class FakeSequence:
+    def __init__(self):
+        self.valor = 0
+        self.llamadas = 0
+        self._lock = threading.Lock()
+
+    def fetch(self, cantidad):
+        with self._lock:
+            self.llamadas += 1
+            inicio = self.valor + 1
+            self.valor += cantidad
+        time.sleep(0.001)
+        return range(inicio, inicio + cantidad)
+
+
+def test_parallel_checkouts_never_repeat_numbers():
+    sequence = FakeSequence()
+    allocator = NumeroFacturaAllocator(block_size=25, fetch_block=sequence.fetch)
+
+    def checkout(i):
+        return allocator.next_numeros(1 + i % 3)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        lotes = list(pool.map(checkout, range(400)))
+
+    numeros = [numero for lote in lotes for numero in lote]
+    assert len(numeros) == sum(1 + i % 3 for i in range(400))
+    assert len(set(numeros)) == len(numeros)
+    assert sequence.llamadas < len(lotes) / 10
+
+
+def test_large_request_fetches_enough_numbers():
+    sequence = FakeSequence()
+    allocator = NumeroFacturaAllocator(block_size=5, fetch_block=sequence.fetch)
+
+    numeros = allocator.next_numeros(12)
+
+    assert numeros[0] == "POS-000001"
+    assert numeros[-1] == "POS-000012"
+    assert sequence.llamadas == 1
+
+
+def test_try_take_never_waits_for_the_lock_or_the_sequence():
+    sequence = FakeSequence()
+    allocator = NumeroFacturaAllocator(block_size=5, fetch_block=sequence.fetch)
+
+    assert allocator.try_take(1) is None
+    assert sequence.llamadas == 0
+
+    allocator.next_numeros(1)
+    assert allocator.try_take(2) == ["POS-000002", "POS-000003"]
+
+    with allocator._lock:
+        assert allocator.try_take(1) is None
+    assert allocator.try_take(3) is None
+    assert sequence.llamadas == 1
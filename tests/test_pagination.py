@@ -0,0 +1,39 @@
+from datetime import datetime
+
+import pytest
+
+from src.utils.pagination import (
+    decode_cursor,
+    decode_key_cursor,
+    encode_cursor,
+    encode_key_cursor,
+)
+from src.utils.timezone import UTC_MINUS_5
+
+
+def test_cursor_roundtrip_keeps_fecha_and_id():
+    fecha = datetime(2025, 3, 14, 9, 26, 53, 589793, tzinfo=UTC_MINUS_5)
+
+    cursor = encode_cursor(fecha, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (fecha, 42)
+
+
+@pytest.mark.parametrize("cursor", ["", "no-es-base64!", "c2luLXNlcGFyYWRvcg"])
+def test_decode_cursor_rejects_invalid_values(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_key_cursor_roundtrip_keeps_both_ids():
+    cursor = encode_key_cursor(17, 203)
+
+    assert "=" not in cursor
+    assert decode_key_cursor(cursor, 2) == (17, 203)
+
+
+@pytest.mark.parametrize("cursor", ["", "no-es-base64!", encode_key_cursor(17)])
+def test_decode_key_cursor_rejects_invalid_values(cursor):
+    with pytest.raises(ValueError):
+        decode_key_cursor(cursor, 2)
@@ -0,0 +1,55 @@
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.infrastructure.models.models import Base, Categoria, Product, User  # noqa: E402
+from src.infrastructure.repository.createProductsRepository import (  # noqa: E402
+    ProductRepository,
+)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    Base.metadata.create_all(
+        bind=engine, tables=[User.__table__, Categoria.__table__, Product.__table__]
+    )
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def producto(producto_id, codigo_barras, nombre):
+    ahora = datetime.now()
+    return Product(
+        producto_id=producto_id,
+        codigo_barras=codigo_barras,
+        nombre=nombre,
+        precio_venta=Decimal("2500.00"),
+        costo=Decimal("1800.00"),
+        iva=Decimal("0.00"),
+        fecha_creacion=ahora,
+        fecha_actualizacion=ahora,
+        estado=True,
+    )
+
+
+def test_list_products_normalizes_barcode_and_name_like_the_validators(db_session):
+    db_session.add_all([producto(1, "  7701234 ", " Gaseosa "), producto(2, "   ", "Pan")])
+    db_session.commit()
+
+    productos = ProductRepository(db_session).list_products()
+
+    assert sorted((p.producto_id, p.codigo_barras, p.nombre) for p in productos) == [
+        (1, "7701234", "Gaseosa"),
+        (2, None, "Pan"),
+    ]
@@ -0,0 +1,44 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from src.infrastructure.web.request_metrics import (  # noqa: E402
+    MetricsRegistry,
+    RequestMetricsMiddleware,
+    _current,
+)
+
+
+class _Route:
+    path = "/productos/{product_id}"
+
+
+async def _app(scope, receive, send):
+    scope["route"] = _Route()
+    stats = _current.get()
+    stats.queries += 2
+    stats.db_ms += 3.5
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def test_middleware_adds_server_timing_and_records_route_template():
+    registry = MetricsRegistry()
+    enviados = []
+
+    async def send(message):
+        enviados.append(message)
+
+    middleware = RequestMetricsMiddleware(_app, registry=registry)
+    asyncio.run(middleware({"type": "http", "method": "GET"}, None, send))
+
+    headers = dict(enviados[0]["headers"])
+    assert b'db;dur=3.5;desc="2 queries"' in headers[b"server-timing"]
+    texto = registry.render_prometheus()
+    labels = 'method="GET",route="/productos/{product_id}"'
+    assert f"http_request_duration_seconds_count{{{labels}}} 1" in texto
+    assert f"http_request_db_queries_total{{{labels}}} 2" in texto
+    assert f'http_responses_total{{{labels},status="200"}} 1' in texto
+    assert _current.get() is None
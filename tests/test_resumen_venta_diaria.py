@@ -0,0 +1,124 @@
+import os
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.infrastructure.models.models import Base, ResumenVentaDiaria, Venta  # noqa: E402
+from src.infrastructure.repository.createResumenVentaDiariaRepository import (  # noqa: E402
+    ResumenVentaDiariaRepository,
+)
+from src.utils.timezone import UTC_MINUS_5  # noqa: E402
+
+FECHA = datetime(2025, 3, 14, 10, 30, tzinfo=UTC_MINUS_5)
+# La reconstruccion lee ``venta``, cuyos CHECK usan sintaxis de Postgres.
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:", echo=False)
+    ResumenVentaDiaria.__table__.create(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.fixture
+def pg_session():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL no definido")
+    engine = create_engine(TEST_DATABASE_URL)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+def assert_consistente(resumen):
+    partes = (
+        resumen.total_efectivo
+        + resumen.total_tarjeta
+        + resumen.total_transferencia
+        + resumen.total_credito
+    )
+    assert partes == resumen.total_ventas
+
+
+def test_annulment_subtracts_from_its_column_and_keeps_totals_consistent(db_session):
+    repo = ResumenVentaDiariaRepository(db_session)
+
+    repo.apply_venta(FECHA, "efectivo", Decimal("1000.00"), 1)
+    repo.apply_venta(FECHA, "tarjeta", Decimal("5000.00"), 1)
+    repo.apply_venta(FECHA, "tarjeta", Decimal("2000.00"), -1)
+    repo.rebuild_pendientes()
+    db_session.commit()
+
+    resumen = repo.get_by_fecha(FECHA.date())
+    assert resumen.total_ventas == Decimal("4000.00")
+    assert resumen.total_efectivo == Decimal("1000.00")
+    assert resumen.total_tarjeta == Decimal("3000.00")
+    assert resumen.cantidad_transacciones == 1
+    assert_consistente(resumen)
+
+
+def venta(total, tipo_pago, estado=True):
+    return Venta(
+        fecha=FECHA,
+        subtotal=Decimal(total),
+        impuesto=Decimal("0.00"),
+        descuento=Decimal("0.00"),
+        total=Decimal(total),
+        tipo_pago=tipo_pago,
+        es_credito=False,
+        estado=estado,
+    )
+
+
+def test_annulment_that_would_underflow_rebuilds_the_day_from_venta(pg_session):
+    repo = ResumenVentaDiariaRepository(pg_session)
+    pg_session.add_all(
+        [venta("1000.00", "efectivo"), venta("5000.00", "tarjeta"), venta("3000.00", "efectivo", False)]
+    )
+    repo.apply_venta(FECHA, "efectivo", Decimal("1000.00"), 1)
+    repo.apply_venta(FECHA, "tarjeta", Decimal("5000.00"), 1)
+
+    # La venta de 3000 nunca se sumo al resumen: restarla lo dejaria negativo.
+    repo.apply_venta(FECHA, "efectivo", Decimal("3000.00"), -1)
+    repo.rebuild_pendientes()
+    pg_session.commit()
+
+    resumen = repo.get_by_fecha(FECHA.date())
+    assert resumen.total_ventas == Decimal("6000.00")
+    assert resumen.total_efectivo == Decimal("1000.00")
+    assert resumen.total_tarjeta == Decimal("5000.00")
+    assert resumen.cantidad_transacciones == 2
+    assert_consistente(resumen)
+
+
+def test_annulment_on_a_day_without_summary_rebuilds_the_day_from_venta(pg_session):
+    repo = ResumenVentaDiariaRepository(pg_session)
+    pg_session.add_all([venta("2500.00", "transferencia"), venta("4000.00", "efectivo", False)])
+
+    repo.apply_venta(FECHA, "efectivo", Decimal("4000.00"), -1)
+    repo.rebuild_pendientes()
+    pg_session.commit()
+
+    resumen = repo.get_by_fecha(FECHA.date())
+    assert resumen.total_ventas == Decimal("2500.00")
+    assert resumen.total_transferencia == Decimal("2500.00")
+    assert resumen.cantidad_transacciones == 1
+    assert_consistente(resumen)
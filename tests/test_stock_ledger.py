@@ -0,0 +1,154 @@
+import itertools
+import os
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from src.domain.entities.ventaDetalleEntity import VentaDetalleEntity  # noqa: E402
+from src.domain.entities.ventaEntity import VentaEntity  # noqa: E402
+from src.domain.enums.stockEnums import RefMovimientoStock, TipoMovimientoStock  # noqa: E402
+from src.infrastructure.models.models import (  # noqa: E402
+    Base,
+    MovimientosStock,
+    Product,
+    RefMovimiento,
+    Stock,
+    TipoMovimiento,
+)
+from src.infrastructure.numero_factura import NumeroFacturaAllocator  # noqa: E402
+from src.infrastructure.repository.createMovimientoStockRepository import (  # noqa: E402
+    MovimientoStockRepository,
+)
+from src.infrastructure.repository.createVentaRepository import VentaRepository  # noqa: E402
+
+# apply_deltas usa CTEs con UPDATE/INSERT ... RETURNING: solo Postgres.
+# TEST_DATABASE_URL debe apuntar a una base descartable (se recrea el esquema).
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL no definido")
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(TEST_DATABASE_URL)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all(
+        [TipoMovimiento(nombre=tipo.value, activo=True) for tipo in TipoMovimientoStock]
+        + [RefMovimiento(nombre=ref.value, activo=True) for ref in RefMovimientoStock]
+    )
+    session.commit()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def producto(db_session):
+    ahora = datetime.now()
+    product = Product(
+        nombre="Gaseosa",
+        precio_venta=Decimal("2500.00"),
+        costo=Decimal("1800.00"),
+        iva=Decimal("0.00"),
+        fecha_creacion=ahora,
+        fecha_actualizacion=ahora,
+        estado=True,
+    )
+    db_session.add(product)
+    db_session.flush()
+    db_session.add(
+        Stock(
+            producto_id=product.producto_id,
+            cantidad_actual=10,
+            cantidad_minima=2,
+            ultima_actualizacion=ahora,
+        )
+    )
+    db_session.commit()
+    return product.producto_id
+
+
+def cantidad_actual(db_session, producto_id):
+    db_session.expire_all()
+    return db_session.scalar(select(Stock.cantidad_actual).where(Stock.producto_id == producto_id))
+
+
+def movimientos(db_session, producto_id):
+    return db_session.execute(
+        select(TipoMovimiento.nombre, RefMovimiento.nombre, MovimientosStock.cantidad)
+        .join(TipoMovimiento, TipoMovimiento.tipo_movimiento_id == MovimientosStock.tipo_movimiento_id)
+        .join(RefMovimiento, RefMovimiento.ref_movimiento_id == MovimientosStock.ref_movimiento_id)
+        .where(MovimientosStock.producto_id == producto_id)
+        .order_by(MovimientosStock.movimiento_id)
+    ).all()
+
+
+def venta_repository(db_session):
+    numeros = itertools.count(1)
+    allocator = NumeroFacturaAllocator(
+        fetch_block=lambda cantidad: [next(numeros) for _ in range(cantidad)]
+    )
+    return VentaRepository(db_session, numero_allocator=allocator)
+
+
+def test_apply_deltas_decrements_stock_and_writes_movimiento(db_session, producto):
+    repo = MovimientoStockRepository(db_session)
+
+    resultado = repo.apply_deltas([(producto, -3, "VENTA-1")], ref=RefMovimientoStock.VENTA)
+    db_session.commit()
+
+    assert resultado == {producto: 7}
+    assert cantidad_actual(db_session, producto) == 7
+    assert movimientos(db_session, producto) == [("SALIDA", "VENTA", 3)]
+
+
+def test_apply_deltas_rejects_negative_stock_without_writing(db_session, producto):
+    repo = MovimientoStockRepository(db_session)
+
+    with pytest.raises(ValueError, match="Stock insuficiente"):
+        repo.apply_deltas([(producto, -11, "VENTA-1")], ref=RefMovimientoStock.VENTA)
+    db_session.rollback()
+
+    assert cantidad_actual(db_session, producto) == 10
+    assert movimientos(db_session, producto) == []
+
+
+def test_anular_venta_restores_stock(db_session, producto):
+    repo = venta_repository(db_session)
+    venta = repo.create_venta(
+        VentaEntity(
+            fecha=datetime.now(),
+            subtotal=Decimal("10000.00"),
+            total=Decimal("10000.00"),
+            tipo_pago="efectivo",
+        ),
+        [
+            VentaDetalleEntity(
+                producto_id=producto,
+                cantidad=4,
+                precio_unitario=Decimal("2500.00"),
+                subtotal=Decimal("10000.00"),
+            )
+        ],
+        stock_deltas={producto: -4},
+    )
+    assert cantidad_actual(db_session, producto) == 6
+
+    repo.anular_venta(venta.venta_id, motivo="cliente desistio", stock_deltas={producto: 4})
+
+    assert cantidad_actual(db_session, producto) == 10
+    assert movimientos(db_session, producto) == [
+        ("SALIDA", "VENTA", 4),
+        ("ENTRADA", "ANULACION_VENTA", 4),
+    ]